@@ -0,0 +1,49 @@
+"""Compares loading a glyph-level PcGts document from PAGE-XML with loading
+it from the binary format of page.binary.
+
+Usage (from the repository root):
+
+    PYTHONPATH=. python benchmarks/bench_binary.py [regions lines words glyphs]
+"""
+
+import io
+import sys
+from page.elements import PcGts, ParseOptions
+from page.elements.point import np
+from common import generate_document, best_of
+
+
+def main():
+    shape = [int(arg) for arg in sys.argv[1:5]] or [20, 25, 8, 6]
+    document = generate_document(*shape)
+    pcgts = PcGts.from_file(io.BytesIO(document))
+
+    encode_time, blob = best_of(pcgts.to_binary)
+    xml_time, _ = best_of(lambda: PcGts.from_file(io.BytesIO(document)))
+    binary_time, _ = best_of(lambda: PcGts.from_binary(blob))
+
+    print(f"PAGE-XML: {len(document) / 1e6:5.1f} MB")
+    print(f"binary:   {len(blob) / 1e6:5.1f} MB")
+    print(f"PcGts.to_binary:    {encode_time * 1e3:8.1f} ms")
+    print(f"PcGts.from_file:    {xml_time * 1e3:8.1f} ms")
+    print(f"PcGts.from_binary:  {binary_time * 1e3:8.1f} ms "
+          f"({xml_time / binary_time:.1f}x)")
+
+    if np is not None:
+        options = ParseOptions(point_arrays=True)
+        array_xml_time, _ = best_of(
+            lambda: PcGts.from_file(io.BytesIO(document), options)
+        )
+        binary_time, _ = best_of(
+            lambda: PcGts.from_binary(blob, point_arrays=True)
+        )
+        # the default of PcGts.from_file_cached with numpy
+        print("with point arrays:")
+        print(f"  PcGts.from_file:  {array_xml_time * 1e3:8.1f} ms")
+        print(f"  PcGts.from_binary:{binary_time * 1e3:8.1f} ms "
+              f"({array_xml_time / binary_time:.1f}x, "
+              f"{xml_time / binary_time:.1f}x of from_file without arrays)")
+
+
+if __name__ == "__main__":
+    main()
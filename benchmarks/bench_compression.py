@@ -0,0 +1,52 @@
+"""Compares saving and loading plain and compressed PAGE-XML files on the
+local disk.
+
+Usage (from the repository root):
+
+    PYTHONPATH=. python benchmarks/bench_compression.py [regions lines ...]
+"""
+
+import io
+import sys
+import tempfile
+from pathlib import Path
+from page.elements import PcGts
+from common import generate_document, best_of
+
+VARIANTS = [
+    ("plain", ".xml", None),
+    ("gzip -1", ".xml.gz", 1),
+    ("gzip -6", ".xml.gz", 6),
+    ("gzip -9", ".xml.gz", 9),
+    ("bz2 -9", ".xml.bz2", 9),
+    ("xz -0", ".xml.xz", 0),
+    ("xz -6", ".xml.xz", 6),
+]
+
+
+def main():
+    shape = [int(arg) for arg in sys.argv[1:5]] or [20, 25, 8, 6]
+    document = generate_document(*shape)
+    pcgts = PcGts.from_file(io.BytesIO(document))
+    size = len(pcgts.to_bytes())
+
+    print(f"document: {size / 1e6:.1f} MB uncompressed")
+    print(f"{'':10}{'size':>10}{'save':>10}{'MB/s':>8}{'load':>10}{'MB/s':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, suffix, level in VARIANTS:
+            path = Path(tmp_dir) / ("bench" + suffix)
+            save_time, _ = best_of(
+                lambda: pcgts.save_to_file(path, compresslevel=level), 3
+            )
+            load_time, _ = best_of(lambda: PcGts.from_file(path), 3)
+
+            print(
+                f"{name:10}{path.stat().st_size / 1e6:8.2f}MB"
+                f"{save_time * 1e3:8.0f}ms{size / save_time / 1e6:8.1f}"
+                f"{load_time * 1e3:8.0f}ms{size / load_time / 1e6:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
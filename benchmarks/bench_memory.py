@@ -0,0 +1,91 @@
+"""Measures the memory used by the parsed element tree of a glyph-level
+PcGts document, excluding the lxml tree it was parsed from.
+
+Usage (from the repository root):
+
+    PYTHONPATH=. python benchmarks/bench_memory.py [regions lines words glyphs]
+"""
+
+import gc
+import io
+import sys
+import tracemalloc
+from lxml import etree
+from page.elements import PcGts, ParseOptions
+from page.elements.point import np
+from common import generate_document
+
+
+def count_elements(pcgts: PcGts) -> dict:
+    counts = {"region": 0, "line": 0, "word": 0, "glyph": 0, "text": 0}
+
+    for region in pcgts.page.text_regions():
+        counts["region"] += 1
+
+        for line in region.lines:
+            counts["line"] += 1
+            counts["text"] += line.text is not None
+
+            for word in line.words:
+                counts["word"] += 1
+                counts["text"] += word.text is not None
+
+                for glyph in word.glyphs:
+                    counts["glyph"] += 1
+                    counts["text"] += glyph.text is not None
+
+    return counts
+
+
+def instance_size(obj: object) -> int:
+    """Returns the size of an object itself, including its __dict__ (if
+    any) but excluding the objects it refers to."""
+
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+
+    return size
+
+
+def measure(root_xml: etree.ElementBase, options: ParseOptions) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    pcgts = PcGts.from_element(root_xml, root_xml.nsmap, options)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, pcgts
+
+
+def main():
+    shape = [int(arg) for arg in sys.argv[1:5]] or [20, 25, 8, 6]
+    document = generate_document(*shape)
+    root_xml = etree.parse(io.BytesIO(document)).getroot()
+
+    variants = [("points", ParseOptions())]
+    if np is not None:
+        variants.append(("point arrays", ParseOptions(point_arrays=True)))
+
+    for name, options in variants:
+        size, pcgts = measure(root_xml, options)
+        counts = count_elements(pcgts)
+        n_elements = sum(counts.values())
+
+        print(f"{name}: {size / 1e6:.1f} MB for {n_elements} elements "
+              f"({counts['glyph']} glyphs), "
+              f"{size / n_elements:.0f} bytes per element")
+
+    line = pcgts.page.regions[0].lines[0]
+    glyph = line.words[0].glyphs[0]
+    print("bytes per instance (without referenced objects):")
+
+    for obj in [
+        pcgts.page.regions[0], line, line.words[0], glyph, glyph.text,
+        glyph.coords, line.coords.as_points()[0]
+    ]:
+        print(f"  {type(obj).__name__:12} {instance_size(obj):5}")
+
+
+if __name__ == "__main__":
+    main()
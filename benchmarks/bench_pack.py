@@ -0,0 +1,66 @@
+"""Compares loading random documents from single files and from a corpus
+pack.
+
+Usage (from the repository root):
+
+    PYTHONPATH=. python benchmarks/bench_pack.py [documents [loads]]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from page.elements import PcGts
+from page.pack import PackWriter, CorpusPack
+from common import generate_document, best_of
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    loads = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for i in range(documents):
+            path = os.path.join(tmp_dir, f"page_{i:06d}.xml")
+            with open(path, "wb") as file:
+                file.write(generate_document(1, 5, 4, 3, seed=i))
+            paths.append(path)
+
+        pack_path = os.path.join(tmp_dir, "corpus.pgpack")
+
+        def write_pack():
+            with PackWriter(pack_path) as writer:
+                for path in paths:
+                    writer.add_file(path)
+
+        write_time, _ = best_of(write_pack, 1)
+        print(
+            f"{documents} documents, pack written in {write_time:.2f}s, "
+            f"{os.path.getsize(pack_path) / 1e6:.2f} MB"
+        )
+
+        indices = [rng.randrange(documents) for _ in range(loads)]
+
+        files_time, _ = best_of(
+            lambda: [PcGts.from_file(paths[i]) for i in indices], 3
+        )
+
+        with CorpusPack(pack_path) as pack:
+            open_time, _ = best_of(lambda: CorpusPack(pack_path).close(), 3)
+            index_time, _ = best_of(lambda: [pack[i] for i in indices], 3)
+            keys = [os.path.basename(paths[i]) for i in indices]
+            key_time, _ = best_of(lambda: [pack.get(k) for k in keys], 3)
+
+        print(f"open pack:           {open_time * 1e6:8.0f}us")
+        for name, seconds in (
+            ("single files", files_time),
+            ("pack by index", index_time),
+            ("pack by key", key_time),
+        ):
+            print(f"{name + ':':20} {seconds / loads * 1e6:8.0f}us per page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Measures the time it takes to parse a glyph-level PcGts document.
+
+Usage (from the repository root):
+
+    PYTHONPATH=. python benchmarks/bench_parse.py [regions lines words glyphs]
+"""
+
+import io
+import sys
+from lxml import etree
+from page.elements import PcGts, ParseOptions, ParseDepth
+from page.elements.point import np
+from common import generate_document, best_of
+
+
+def main():
+    shape = [int(arg) for arg in sys.argv[1:5]] or [20, 25, 8, 6]
+    document = generate_document(*shape)
+    root_xml = etree.parse(io.BytesIO(document)).getroot()
+    n_elements = sum(1 for _ in root_xml.iter())
+
+    xml_time, _ = best_of(lambda: etree.parse(io.BytesIO(document)))
+    tree_time, _ = best_of(
+        lambda: PcGts.from_element(root_xml, root_xml.nsmap)
+    )
+
+    print(f"document: {len(document) / 1e6:.1f} MB, {n_elements} elements")
+    print(f"lxml parse:          {xml_time * 1e3:8.1f} ms")
+    print(f"PcGts.from_element:  {tree_time * 1e3:8.1f} ms")
+    print(f"total:               {(xml_time + tree_time) * 1e3:8.1f} ms")
+
+    if np is not None:
+        options = ParseOptions(point_arrays=True)
+        array_time, _ = best_of(
+            lambda: PcGts.from_element(root_xml, root_xml.nsmap, options)
+        )
+        print(f"  with point arrays: {array_time * 1e3:8.1f} ms")
+
+    for depth in [ParseDepth.WORD, ParseDepth.LINE, ParseDepth.REGION]:
+        options = ParseOptions(depth=depth)
+        depth_time, _ = best_of(
+            lambda: PcGts.from_element(root_xml, root_xml.nsmap, options)
+        )
+        name = f"{depth.name.lower()} depth:"
+        print(f"  up to {name:13}{depth_time * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Measures the time it takes to serialize a glyph-level PcGts document.
+
+Usage (from the repository root):
+
+    PYTHONPATH=. python benchmarks/bench_write.py [regions lines words glyphs]
+"""
+
+import io
+import sys
+from lxml import etree
+from page.constants import DEFAULT_NAMESPACE_MAP
+from page.elements import PcGts
+from common import generate_document, best_of
+
+
+def write(pcgts: PcGts, **kwargs) -> bytes:
+    file = io.BytesIO()
+    pcgts.write(file, **kwargs)
+    return file.getvalue()
+
+
+def main():
+    shape = [int(arg) for arg in sys.argv[1:5]] or [20, 25, 8, 6]
+    pcgts = PcGts.from_file(io.BytesIO(generate_document(*shape)))
+
+    tree_time, document = best_of(lambda: etree.tostring(
+        pcgts.to_element(DEFAULT_NAMESPACE_MAP), pretty_print=True
+    ))
+    direct_time, _ = best_of(pcgts.to_bytes)
+    stream_time, _ = best_of(lambda: write(pcgts))
+    compact_time, _ = best_of(lambda: write(pcgts, pretty_print=False))
+
+    print(f"document: {len(document) / 1e6:.1f} MB")
+    print(f"etree.tostring:          {tree_time * 1e3:8.1f} ms")
+    print(f"PcGts.to_bytes:          {direct_time * 1e3:8.1f} ms")
+    print(f"PcGts.write:             {stream_time * 1e3:8.1f} ms")
+    print(f"  without pretty print:  {compact_time * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Helpers shared by the benchmark scripts in this directory."""
+
+import random
+import time
+from typing import Callable, Tuple
+from page.constants import DEFAULT_XML_NAMESPACE
+
+
+def _points(rng: random.Random, n: int) -> str:
+    return " ".join(
+        f"{rng.randrange(0, 5000)},{rng.randrange(0, 5000)}" for _ in range(n)
+    )
+
+
+def generate_document(
+    regions: int = 20, lines: int = 25, words: int = 8, glyphs: int = 6,
+    seed: int = 0
+) -> bytes:
+    """Generates a synthetic PcGts document with the given number of
+    regions, lines per region, words per line and glyphs per word."""
+
+    rng = random.Random(seed)
+    out = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<PcGts xmlns="{DEFAULT_XML_NAMESPACE}" pcGtsId="bench">',
+        "<Metadata><Creator>bench</Creator>"
+        "<Created>2021-10-21T18:37:36</Created>"
+        "<LastChange>2021-10-21T18:37:36</LastChange></Metadata>",
+        '<Page imageFilename="bench.png" imageWidth="5000" '
+        'imageHeight="5000">'
+    ]
+
+    for r in range(regions):
+        out.append(f'<TextRegion id="r{r}" type="paragraph">')
+        out.append(f'<Coords points="{_points(rng, 4)}"/>')
+
+        for li in range(lines):
+            line_id = f"r{r}l{li}"
+            out.append(f'<TextLine id="{line_id}">')
+            out.append(f'<Coords points="{_points(rng, 4)}"/>')
+            out.append(f'<Baseline points="{_points(rng, 2)}"/>')
+            line_text = []
+
+            for w in range(words):
+                word_id = f"{line_id}w{w}"
+                out.append(f'<Word id="{word_id}">')
+                out.append(f'<Coords points="{_points(rng, 4)}"/>')
+                word_text = ""
+
+                for g in range(glyphs):
+                    char = chr(rng.randrange(ord("a"), ord("z") + 1))
+                    word_text += char
+                    out.append(
+                        f'<Glyph id="{word_id}g{g}">'
+                        f'<Coords points="{_points(rng, 4)}"/>'
+                        f'<TextEquiv conf="0.9"><Unicode>{char}</Unicode>'
+                        '</TextEquiv></Glyph>'
+                    )
+
+                line_text.append(word_text)
+                out.append(
+                    f"<TextEquiv><Unicode>{word_text}</Unicode></TextEquiv>"
+                    "</Word>"
+                )
+
+            out.append(
+                f"<TextEquiv><Unicode>{' '.join(line_text)}</Unicode>"
+                "</TextEquiv></TextLine>"
+            )
+
+        out.append("</TextRegion>")
+
+    out.append("</Page></PcGts>")
+    return "\n".join(out).encode("utf-8")
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> Tuple[float, object]:
+    """Runs fn repeat times and returns the best wall time in seconds
+    together with the result of the last run."""
+
+    best = float("inf")
+    result = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
@@ -0,0 +1,191 @@
+"""Loading and saving PAGE-XML documents from asyncio code.
+
+File contents are read and written in chunks in the default executor of
+the event loop, so no single blocking call takes long. While a file is
+read, every chunk is decompressed and fed to an incremental XML parser as
+soon as it arrives, so the file is never buffered as a whole. The parser
+runs in a thread of its own for every file, since lxml parsers must stay
+on one thread. Building the elements from the parsed tree and
+serializing, which are CPU-bound as well, run in a configurable executor,
+so nothing CPU-bound blocks the event loop. A
+concurrent.futures.ProcessPoolExecutor makes use of multiple cores, but it
+receives the whole file and parses it on its own, since a parser cannot be
+shared between processes. Compressed files are handled like in
+PcGts.from_file and save_to_file.
+"""
+
+import asyncio
+import io
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional, Union
+from lxml import etree
+
+from page.compression import ChunkDecompressor, compress
+from page.compression import compression_from_suffix
+from page.constants import NsMap, DEFAULT_NAMESPACE_MAP
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
+from page.elements.pcgts import PcGts
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class _NoLimit:
+    async def __aenter__(self):
+        pass
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+def _limit(limit: Optional[asyncio.Semaphore]):
+    return _NoLimit() if limit is None else limit
+
+
+async def read_chunks(
+    path: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Reads a file in chunks without blocking the event loop."""
+
+    loop = asyncio.get_running_loop()
+    file = await loop.run_in_executor(None, open, path, "rb")
+
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, file.read, chunk_size)
+            if not chunk:
+                return
+
+            yield chunk
+    finally:
+        await loop.run_in_executor(None, file.close)
+
+
+async def write_chunks(
+    path: PathLike, data: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """Writes data to a file in chunks without blocking the event loop."""
+
+    loop = asyncio.get_running_loop()
+    file = await loop.run_in_executor(None, open, path, "wb")
+
+    try:
+        view = memoryview(data)
+
+        for start in range(0, len(view), chunk_size):
+            await loop.run_in_executor(
+                None, file.write, view[start:start + chunk_size]
+            )
+    finally:
+        await loop.run_in_executor(None, file.close)
+
+
+def _parse(data: bytes, options: ParseOptions) -> Optional[PcGts]:
+    return PcGts.from_file(io.BytesIO(data), options)
+
+
+def _from_root(
+    root_xml: etree.ElementBase, options: ParseOptions
+) -> Optional[PcGts]:
+    if etree.QName(root_xml.tag).localname != "PcGts":
+        # this is not a pagecontent file
+        return None
+
+    return PcGts.from_element(root_xml, root_xml.nsmap, options)
+
+
+def _feed(
+    decompressor: ChunkDecompressor, parser: etree.XMLParser, chunk: bytes
+):
+    data = decompressor.decompress(chunk)
+    if data:
+        parser.feed(data)
+
+
+def _close(
+    decompressor: ChunkDecompressor, parser: etree.XMLParser
+) -> etree.ElementBase:
+    data = decompressor.flush()
+    if data:
+        parser.feed(data)
+
+    return parser.close()
+
+
+async def _parse_chunks(
+    path: PathLike, chunk_size: int
+) -> etree.ElementBase:
+    """Reads a (possibly compressed) XML file and returns its root element.
+    Every chunk is decompressed and parsed as soon as it has been read.
+    The parser is created and fed in a thread of its own, since lxml
+    crashes if a parser is fed by several threads, even one after the
+    other."""
+
+    loop = asyncio.get_running_loop()
+    decompressor = ChunkDecompressor()
+
+    with ThreadPoolExecutor(max_workers=1) as parser_thread:
+        parser = await loop.run_in_executor(parser_thread, etree.XMLParser)
+
+        async for chunk in read_chunks(path, chunk_size):
+            await loop.run_in_executor(
+                parser_thread, _feed, decompressor, parser, chunk
+            )
+
+        return await loop.run_in_executor(
+            parser_thread, _close, decompressor, parser
+        )
+
+
+def _serialize(
+    pcgts: PcGts, nsmap: NsMap, compression: Optional[str],
+    compresslevel: Optional[int]
+) -> bytes:
+    return compress(pcgts.to_bytes(nsmap), compression, compresslevel)
+
+
+async def load(
+    path: PathLike, options: ParseOptions = DEFAULT_PARSE_OPTIONS,
+    executor: Optional[Executor] = None,
+    limit: Optional[asyncio.Semaphore] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Optional[PcGts]:
+    """Loads a PAGE-XML file, see PcGts.aload."""
+
+    async with _limit(limit):
+        loop = asyncio.get_running_loop()
+
+        if isinstance(executor, ProcessPoolExecutor):
+            # the worker process has to parse the whole file on its own
+            chunks: List[bytes] = [
+                chunk async for chunk in read_chunks(path, chunk_size)
+            ]
+            return await loop.run_in_executor(
+                executor, _parse, b"".join(chunks), options
+            )
+
+        root_xml = await _parse_chunks(path, chunk_size)
+        return await loop.run_in_executor(
+            executor, _from_root, root_xml, options
+        )
+
+
+async def save(
+    pcgts: PcGts, path: PathLike, nsmap: NsMap = DEFAULT_NAMESPACE_MAP,
+    executor: Optional[Executor] = None,
+    limit: Optional[asyncio.Semaphore] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compresslevel: Optional[int] = None
+):
+    """Saves a PcGts to a PAGE-XML file, see PcGts.asave."""
+
+    async with _limit(limit):
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(
+            executor, _serialize, pcgts, nsmap,
+            compression_from_suffix(path), compresslevel
+        )
+        await write_chunks(path, data, chunk_size)
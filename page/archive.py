@@ -0,0 +1,190 @@
+"""Reading PAGE-XML files directly from zip and tar archives.
+
+Every member is parsed from the stream of the archive, nothing is
+extracted to disk. Tar archives (which may be compressed as a whole) can
+only be read sequentially. Zip archives allow random access to their
+members, so they can also be decoded by several processes in parallel.
+"""
+
+import os
+import tarfile
+import zipfile
+from fnmatch import fnmatchcase
+from functools import partial
+from typing import BinaryIO, Callable, Iterator, List, Optional, Union
+
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
+from page.elements.pcgts import PcGts
+from page.parallel import LoadResult, LOAD_ERRORS, chunks_of, map_chunks
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class UnsupportedMemberError(Exception):
+    """Raised for zip members which are encrypted or compressed with a
+    method which zipfile does not support."""
+
+
+# errors of single members, which do not abort reading the archive
+MEMBER_ERRORS = LOAD_ERRORS + (
+    zipfile.BadZipFile, tarfile.TarError, UnsupportedMemberError
+)
+
+DEFAULT_PATTERN = "*.xml"
+
+# bit 0 of the general purpose flags of a zip member
+_ZIP_ENCRYPTED = 0x1
+_ZIP_METHODS = frozenset((
+    zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2,
+    zipfile.ZIP_LZMA
+))
+
+
+def _load_member(
+    name: str, open_member: Callable[[], BinaryIO], options: ParseOptions
+) -> LoadResult:
+    try:
+        with open_member() as file:
+            return LoadResult(name, PcGts.from_file(file, options))
+    except MEMBER_ERRORS as error:
+        return LoadResult(name, None, error)
+
+
+def _open_zip_member(archive: zipfile.ZipFile, name: str) -> BinaryIO:
+    # zipfile would raise RuntimeError and NotImplementedError for these
+    info = archive.getinfo(name)
+    if info.flag_bits & _ZIP_ENCRYPTED:
+        raise UnsupportedMemberError(f"{name} is encrypted")
+    if info.compress_type not in _ZIP_METHODS:
+        raise UnsupportedMemberError(
+            f"{name} uses the unsupported compression method "
+            f"{info.compress_type}"
+        )
+
+    return archive.open(name)
+
+
+def _zip_members(archive: zipfile.ZipFile, pattern: str) -> List[str]:
+    return [
+        info.filename for info in archive.infolist()
+        if not info.is_dir() and fnmatchcase(info.filename, pattern)
+    ]
+
+
+def _load_zip_chunk(
+    path: PathLike, names: List[str], options: ParseOptions
+) -> List[LoadResult]:
+    with zipfile.ZipFile(path) as archive:
+        return [
+            _load_member(
+                name, partial(_open_zip_member, archive, name), options
+            )
+            for name in names
+        ]
+
+
+def _iter_zip(
+    path: PathLike, pattern: str, options: ParseOptions,
+    workers: Optional[int], chunksize: int, ordered: bool
+) -> Iterator[LoadResult]:
+    with zipfile.ZipFile(path) as archive:
+        names = _zip_members(archive, pattern)
+
+        if workers == 0:
+            for name in names:
+                yield _load_member(
+                    name, partial(_open_zip_member, archive, name), options
+                )
+
+            return
+
+    # every worker opens the archive itself and reads only its members
+    chunks = (
+        (path, chunk, options) for chunk in chunks_of(names, chunksize)
+    )
+    yield from map_chunks(_load_zip_chunk, chunks, workers, ordered)
+
+
+def _iter_tar(
+    path: PathLike, pattern: str, options: ParseOptions
+) -> Iterator[LoadResult]:
+    # the stream mode reads compressed tar archives without seeking back
+    with tarfile.open(path, "r|*") as archive:
+        for member in archive:
+            if not member.isfile() or not fnmatchcase(member.name, pattern):
+                continue
+
+            yield _load_member(
+                member.name, partial(archive.extractfile, member), options
+            )
+
+
+def iter_archive(
+    path: PathLike, pattern: str = DEFAULT_PATTERN,
+    options: ParseOptions = DEFAULT_PARSE_OPTIONS,
+    workers: Optional[int] = 0, chunksize: int = 16, ordered: bool = True
+) -> Iterator[LoadResult]:
+    """Loads all PAGE-XML files of a zip or tar archive.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The archive, either a zip file or a (possibly gzip, bz2 or xz
+        compressed) tar file.
+    pattern : str
+        A glob pattern (see fnmatch) which the names of the members must
+        match, e.g. "pages/*.xml". Note that "*" also matches slashes, so
+        the default matches XML files in all directories.
+    options : page.elements.ParseOptions
+        The options for parsing every member.
+    workers : int, optional
+        The number of worker processes decoding the members of a zip
+        archive, see PcGts.load_many. By default, all members are decoded
+        in the current process. Tar archives are always read sequentially.
+    chunksize : int
+        The number of zip members which are sent to a worker at once.
+    ordered : bool
+        If False, the results of zip members decoded in parallel are
+        yielded in the order in which they are completed.
+
+    Returns
+    -------
+    Iterator[page.parallel.LoadResult]
+        One result per matching member, in the order of the archive. The
+        path of a result is the name of its member. Errors of single
+        members are reported in the error attribute of their result.
+
+    Raises
+    ------
+    ValueError
+        If the file is neither a zip nor a tar archive.
+    """
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    if zipfile.is_zipfile(path):
+        return _iter_zip(path, pattern, options, workers, chunksize, ordered)
+    elif tarfile.is_tarfile(path):
+        return _iter_tar(path, pattern, options)
+    else:
+        raise ValueError(f"{os.fspath(path)} is neither a zip nor a tar file")
+
+
+def archive_members(
+    path: PathLike, pattern: str = DEFAULT_PATTERN
+) -> List[str]:
+    """Returns the names of all members of a zip or tar archive which
+    match the pattern (see iter_archive), without loading them."""
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return _zip_members(archive, pattern)
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path, "r|*") as archive:
+            return [
+                member.name for member in archive
+                if member.isfile() and fnmatchcase(member.name, pattern)
+            ]
+    else:
+        raise ValueError(f"{os.fspath(path)} is neither a zip nor a tar file")
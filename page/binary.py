@@ -0,0 +1,551 @@
+"""A compact binary serialization of parsed PcGts documents.
+
+The format is meant for caching documents which are loaded over and over
+again, it is not a replacement for PAGE-XML. A blob starts with a fixed
+size header, which is followed by these sections:
+
+* the lengths (in code points) of all distinct strings as varints,
+* all distinct strings, concatenated and encoded as UTF-8,
+* the structure of the element tree as a stream of varints, in which
+  strings are referred to by their index in the string table,
+* the points of all Coordinates as packed little-endian int32 values,
+* all confidences as packed little-endian float64 values.
+
+Blobs are tied to a format version and are rejected by other versions.
+"""
+
+import struct
+import sys
+from array import array
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from page.elements.coords import Baseline, Coordinates
+from page.elements.glyph import Glyph, IndexedGlyph
+from page.elements.line import Line, IndexedLine
+from page.elements.metadata import Metadata
+from page.elements.page import Page
+from page.elements.pcgts import PcGts
+from page.elements.point import Point, np
+from page.elements.reading_order import (
+    ReadingOrder, OrderedGroup, OrderedGroupIndexed,
+    UnorderedGroup, UnorderedGroupIndexed
+)
+from page.elements.region import Region, TextRegion, TextRegionType
+from page.elements.region_ref import RegionRef, RegionRefIndexed
+from page.elements.text import Text
+from page.elements.word import Word, IndexedWord
+from page.exceptions import PageXMLError
+
+MAGIC = b"PGPY"
+VERSION = 1
+
+# magic, version, then the number of strings, the byte sizes of the string
+# lengths, the string data and the structure, and the number of int32
+# coordinates and float64 confidences
+_HEADER = struct.Struct("<4sB3xIIIIII")
+
+_REGION_TYPES: List[TextRegionType] = list(TextRegionType)
+_REGION_TYPE_CODES: Dict[TextRegionType, int] = {
+    region_type: code + 1 for code, region_type in enumerate(_REGION_TYPES)
+}
+
+# how many TextEquivs an element has, see _Writer.texts
+_NO_TEXT, _SINGLE_TEXT, _INDEXED_TEXTS = 0, 1, 2
+
+# the kinds of the elements of a reading order, see _Writer.group
+(
+    _ORDERED_GROUP, _UNORDERED_GROUP, _ORDERED_GROUP_INDEXED,
+    _UNORDERED_GROUP_INDEXED, _REGION_REF, _REGION_REF_INDEXED
+) = range(6)
+
+_GROUP_CODES = {
+    OrderedGroup: _ORDERED_GROUP, UnorderedGroup: _UNORDERED_GROUP,
+    OrderedGroupIndexed: _ORDERED_GROUP_INDEXED,
+    UnorderedGroupIndexed: _UNORDERED_GROUP_INDEXED,
+    RegionRef: _REGION_REF, RegionRefIndexed: _REGION_REF_INDEXED
+}
+_INDEXED_GROUP_CODES = (
+    _ORDERED_GROUP_INDEXED, _UNORDERED_GROUP_INDEXED, _REGION_REF_INDEXED
+)
+
+_TEXT_REGION_CODE = 0
+
+
+def _encode_varints(values: List[int]) -> bytes:
+    out = bytearray()
+    append = out.append
+
+    for value in values:
+        while value >= 0x80:
+            append((value & 0x7f) | 0x80)
+            value >>= 7
+
+        append(value)
+
+    return bytes(out)
+
+
+def _decode_varints(data: bytes) -> List[int]:
+    if np is not None and len(data) > 0:
+        return _decode_varints_numpy(data)
+
+    values: List[int] = []
+    value = shift = 0
+
+    for byte in data:
+        value |= (byte & 0x7f) << shift
+
+        if byte < 0x80:
+            values.append(value)
+            value = shift = 0
+        else:
+            shift += 7
+
+    return values
+
+
+def _decode_varints_numpy(data: bytes) -> List[int]:
+    raw = np.frombuffer(data, dtype=np.uint8)
+    # every varint ends with the first byte which has the high bit unset
+    ends = np.flatnonzero(raw < 0x80)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+
+    # the position of every byte inside its varint
+    lengths = ends - starts + 1
+    offsets = np.arange(len(raw)) - np.repeat(starts, lengths)
+
+    if offsets.max(initial=0) > 8:
+        # values above 2 ** 63 would overflow, this never happens for
+        # blobs written by this module
+        raise PageXMLError("binary blob contains an oversized varint")
+
+    payload = (raw & 0x7f).astype(np.uint64) << (7 * offsets).astype(
+        np.uint64
+    )
+    return np.add.reduceat(payload, starts).tolist()
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if value % 2 == 0 else -(value >> 1) - 1
+
+
+class _Writer:
+    def __init__(self):
+        self.ints: List[int] = []
+        self.strings: Dict[str, int] = {}
+        self.points = array("i")
+        self.floats = array("d")
+
+    def uint(self, value: int):
+        self.ints.append(value)
+
+    def opt_int(self, value: Optional[int]):
+        self.ints.append(0 if value is None else _zigzag(value) + 1)
+
+    def str(self, value: str):
+        index = self.strings.setdefault(value, len(self.strings))
+        self.ints.append(index)
+
+    def opt_str(self, value: Optional[str]):
+        if value is None:
+            self.ints.append(0)
+        else:
+            index = self.strings.setdefault(value, len(self.strings))
+            self.ints.append(index + 1)
+
+    def opt_float(self, value: Optional[float]):
+        if value is None:
+            self.ints.append(0)
+        else:
+            self.ints.append(1)
+            self.floats.append(value)
+
+    def coords(self, coords: Coordinates):
+        if coords.is_array():
+            flat = coords.points.ravel().tolist()
+        else:
+            flat = [c for p in coords.points for c in (p.x, p.y)]
+
+        self.ints.append(len(flat) // 2)
+        self.points.extend(flat)
+
+    def text(self, text: Text):
+        self.opt_int(text.index)
+        self.str(text.unicode)
+        self.opt_str(text.plain_text)
+        self.opt_float(text.conf)
+
+    def texts(self, element: Union[Line, Word, Glyph]):
+        if isinstance(element, (IndexedLine, IndexedWord, IndexedGlyph)):
+            texts = list(element.texts())
+            self.ints += [_INDEXED_TEXTS, len(texts)]
+
+            for text in texts:
+                self.text(text)
+        elif element.text is None:
+            self.ints.append(_NO_TEXT)
+        else:
+            self.ints.append(_SINGLE_TEXT)
+            self.text(element.text)
+
+    def glyph(self, glyph: Glyph):
+        self.str(glyph.glyph_id)
+        self.coords(glyph.coords)
+        self.texts(glyph)
+
+    def word(self, word: Word):
+        self.str(word.word_id)
+        self.coords(word.coords)
+        self.uint(len(word.glyphs))
+
+        for glyph in word.glyphs:
+            self.glyph(glyph)
+
+        self.texts(word)
+
+    def line(self, line: Line):
+        self.str(line.line_id)
+        self.coords(line.coords)
+
+        if line.baseline is None:
+            self.uint(0)
+        else:
+            self.uint(1)
+            self.coords(line.baseline)
+
+        self.uint(len(line.words))
+
+        for word in line.words:
+            self.word(word)
+
+        self.texts(line)
+
+    def region(self, region: Region):
+        if not isinstance(region, TextRegion):
+            raise TypeError(f"cannot serialize region {region}")
+
+        self.uint(_TEXT_REGION_CODE)
+        self.opt_str(region.region_id)
+        self.coords(region.coords)
+        self.uint(_REGION_TYPE_CODES.get(region.region_type, 0))
+        self.uint(len(region.children))
+
+        for child in region.children:
+            self.region(child)
+
+        self.uint(len(region.lines))
+
+        for line in region.lines:
+            self.line(line)
+
+    def group(self, group: Union[OrderedGroup, UnorderedGroup, RegionRef]):
+        code = _GROUP_CODES[type(group)]
+        self.uint(code)
+
+        if isinstance(group, RegionRef):
+            self.str(group.ref)
+        else:
+            self.str(group.group_id)
+            self.opt_str(group.caption)
+            self.uint(len(group.children))
+
+            for child in group.children:
+                self.group(child)
+
+        if code in _INDEXED_GROUP_CODES:
+            self.opt_int(group.index)
+
+    def pcgts(self, pcgts: PcGts):
+        self.opt_str(pcgts.pc_gts_id)
+
+        metadata = pcgts.metadata
+        self.str(metadata.creator)
+        self.str(metadata.created.isoformat())
+        self.str(metadata.last_change.isoformat())
+        self.opt_str(metadata.comments)
+
+        page = pcgts.page
+        width, height = page.image_size
+        self.opt_int(width)
+        self.opt_int(height)
+        self.opt_str(page.image_filename)
+
+        if page.reading_order is None:
+            self.uint(0)
+        else:
+            self.uint(1)
+            self.group(page.reading_order.root)
+
+        self.uint(len(page.regions))
+
+        for region in page.regions:
+            self.region(region)
+
+    def to_bytes(self) -> bytes:
+        strings = list(self.strings)
+        string_lengths = _encode_varints([len(s) for s in strings])
+        string_data = "".join(strings).encode("utf-8")
+        structure = _encode_varints(self.ints)
+
+        if sys.byteorder != "little":
+            self.points.byteswap()
+            self.floats.byteswap()
+
+        header = _HEADER.pack(
+            MAGIC, VERSION, len(strings), len(string_lengths),
+            len(string_data), len(structure), len(self.points),
+            len(self.floats)
+        )
+
+        return b"".join([
+            header, string_lengths, string_data, structure,
+            self.points.tobytes(), self.floats.tobytes()
+        ])
+
+
+def _split_sections(data: bytes) -> Tuple[int, List[memoryview]]:
+    """Checks the header of a blob and returns the number of strings and
+    views of its sections: the string lengths, the string data, the
+    structure, the points and the floats."""
+
+    if len(data) < _HEADER.size:
+        raise PageXMLError("binary blob is truncated")
+
+    (
+        magic, version, n_strings, n_string_lengths, n_string_data,
+        n_structure, n_points, n_floats
+    ) = _HEADER.unpack_from(data)
+
+    if magic != MAGIC:
+        raise PageXMLError("data is not a binary PcGts blob")
+
+    if version != VERSION:
+        raise PageXMLError(
+            f"binary blob has version {version}, expected {VERSION}"
+        )
+
+    view = memoryview(data)
+    sections = []
+    offset = _HEADER.size
+
+    for size in (
+        n_string_lengths, n_string_data, n_structure, 4 * n_points,
+        8 * n_floats
+    ):
+        start, offset = offset, offset + size
+
+        if offset > len(data):
+            raise PageXMLError("binary blob is truncated")
+
+        sections.append(view[start:offset])
+
+    return n_strings, sections
+
+
+def _decode_strings(
+    n_strings: int, lengths: memoryview, data: memoryview
+) -> List[str]:
+    string_lengths = _decode_varints(lengths)
+    string_data = str(data, "utf-8")
+
+    if len(string_lengths) != n_strings:
+        raise PageXMLError("binary blob has a corrupt string table")
+
+    strings: List[str] = []
+    start = 0
+
+    for length in string_lengths:
+        strings.append(string_data[start:start + length])
+        start += length
+
+    return strings
+
+
+def _decode_floats(data: memoryview) -> List[float]:
+    floats = array("d")
+    floats.frombytes(data)
+    if sys.byteorder != "little":
+        floats.byteswap()
+
+    return floats.tolist()
+
+
+class _Reader:
+    def __init__(self, data: bytes, point_arrays: bool):
+        n_strings, sections = _split_sections(data)
+        string_lengths, string_data, structure, points, floats = sections
+
+        self.strings = _decode_strings(n_strings, string_lengths, string_data)
+        self.next: Callable[[], int] = iter(
+            _decode_varints(structure)
+        ).__next__
+
+        self.point_arrays = point_arrays
+        self.point_offset = 0
+
+        if point_arrays:
+            self.points = np.frombuffer(points, dtype="<i4").astype(
+                np.int32
+            ).reshape(-1, 2)
+        else:
+            flat = array("i")
+            flat.frombytes(points)
+            if sys.byteorder != "little":
+                flat.byteswap()
+            # all Points are created at once, the Coordinates take slices
+            self.points = list(map(Point, flat[::2], flat[1::2]))
+
+        self.floats = iter(_decode_floats(floats))
+
+    def str(self) -> str:
+        return self.strings[self.next()]
+
+    def opt_str(self) -> Optional[str]:
+        index = self.next()
+        return None if index == 0 else self.strings[index - 1]
+
+    def opt_int(self) -> Optional[int]:
+        value = self.next()
+        return None if value == 0 else _unzigzag(value - 1)
+
+    def opt_float(self) -> Optional[float]:
+        return None if self.next() == 0 else next(self.floats)
+
+    def coords(self) -> Coordinates:
+        return Coordinates(self._points())
+
+    def baseline(self) -> Baseline:
+        return Baseline(self._points())
+
+    def _points(self):
+        n = self.next()
+        start = self.point_offset
+        self.point_offset += n
+
+        return self.points[start:start + n]
+
+    def text(self) -> Text:
+        return Text(
+            self.opt_int(), self.str(), self.opt_str(), self.opt_float()
+        )
+
+    def texts(self) -> Union[None, Text, List[Text]]:
+        kind = self.next()
+
+        if kind == _NO_TEXT:
+            return None
+        elif kind == _SINGLE_TEXT:
+            return self.text()
+        else:
+            return [self.text() for _ in range(self.next())]
+
+    def glyph(self) -> Glyph:
+        glyph_id = self.str()
+        coords = self.coords()
+        texts = self.texts()
+
+        if isinstance(texts, list):
+            return IndexedGlyph(glyph_id, coords, texts)
+        else:
+            return Glyph(glyph_id, coords, texts)
+
+    def word(self) -> Word:
+        word_id = self.str()
+        coords = self.coords()
+        glyphs = [self.glyph() for _ in range(self.next())]
+        texts = self.texts()
+
+        if isinstance(texts, list):
+            return IndexedWord(word_id, coords, glyphs, texts)
+        else:
+            return Word(word_id, coords, glyphs, texts)
+
+    def line(self) -> Line:
+        line_id = self.str()
+        coords = self.coords()
+        baseline = self.baseline() if self.next() else None
+        words = [self.word() for _ in range(self.next())]
+        texts = self.texts()
+
+        if isinstance(texts, list):
+            return IndexedLine(line_id, coords, texts, words, baseline)
+        else:
+            return Line(line_id, coords, texts, words, baseline)
+
+    def region(self) -> Region:
+        if self.next() != _TEXT_REGION_CODE:
+            raise PageXMLError("binary blob contains an unknown region")
+
+        region_id = self.opt_str()
+        coords = self.coords()
+        type_code = self.next()
+        region_type = None if type_code == 0 else _REGION_TYPES[type_code - 1]
+        children = [self.region() for _ in range(self.next())]
+        lines = [self.line() for _ in range(self.next())]
+        return TextRegion(region_id, coords, children, region_type, lines)
+
+    def group(self) -> Union[OrderedGroup, UnorderedGroup, RegionRef]:
+        code = self.next()
+
+        if code == _REGION_REF:
+            return RegionRef(self.str())
+        elif code == _REGION_REF_INDEXED:
+            return RegionRefIndexed(self.str(), self.opt_int())
+
+        group_id = self.str()
+        caption = self.opt_str()
+        children = [self.group() for _ in range(self.next())]
+
+        if code == _ORDERED_GROUP:
+            return OrderedGroup(group_id, children, caption)
+        elif code == _UNORDERED_GROUP:
+            return UnorderedGroup(group_id, children, caption)
+        elif code == _ORDERED_GROUP_INDEXED:
+            return OrderedGroupIndexed(
+                group_id, children, self.opt_int(), caption
+            )
+        elif code == _UNORDERED_GROUP_INDEXED:
+            return UnorderedGroupIndexed(
+                group_id, children, self.opt_int(), caption
+            )
+        else:
+            raise PageXMLError("binary blob contains an unknown group")
+
+    def pcgts(self) -> PcGts:
+        pc_gts_id = self.opt_str()
+        metadata = Metadata(
+            self.str(), datetime.fromisoformat(self.str()),
+            datetime.fromisoformat(self.str()), self.opt_str()
+        )
+
+        image_size = (self.opt_int(), self.opt_int())
+        image_filename = self.opt_str()
+        reading_order = ReadingOrder(self.group()) if self.next() else None
+        regions = [self.region() for _ in range(self.next())]
+
+        page = Page(image_size, image_filename, reading_order, regions)
+        return PcGts(pc_gts_id, metadata, page)
+
+
+def to_binary(pcgts: PcGts) -> bytes:
+    """Serializes a PcGts into a binary blob, see PcGts.to_binary."""
+
+    writer = _Writer()
+    writer.pcgts(pcgts)
+    return writer.to_bytes()
+
+
+def from_binary(data: bytes, point_arrays: bool = False) -> PcGts:
+    """Deserializes a binary blob, see PcGts.from_binary."""
+
+    try:
+        return _Reader(data, point_arrays).pcgts()
+    except (StopIteration, IndexError, ValueError, UnicodeDecodeError):
+        raise PageXMLError("binary blob is corrupt")
@@ -0,0 +1,126 @@
+"""Caching parsed PAGE-XML documents in the binary format of page.binary.
+
+A cache file holds the binary blob of a document, prefixed with the
+modification time and size of its source file (and the absolute path of
+the source file, if the cache files are kept in a separate directory).
+The cache file is only used as long as these still match, otherwise the
+source file is parsed again and the cache file is rewritten.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+from page.binary import from_binary, to_binary
+from page.elements.options import ParseOptions
+from page.elements.pcgts import PcGts
+from page.elements.point import np
+from page.exceptions import PageXMLError
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+CACHE_SUFFIX = ".pgbin"
+
+# mtime in nanoseconds, size and the length of the encoded source path
+_KEY_HEADER = struct.Struct("<qQI")
+
+
+def cache_path(path: PathLike, cache_dir: Optional[PathLike] = None) -> Path:
+    """Returns the path of the cache file for a PAGE-XML file.
+
+    Without a cache directory, the cache file is stored next to the source
+    file. Within a cache directory, cache files are named after a hash of
+    the absolute path of the source file.
+    """
+
+    if cache_dir is None:
+        path = Path(path)
+        return path.with_name(path.name + CACHE_SUFFIX)
+
+    source = os.path.abspath(os.fspath(path))
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    return Path(cache_dir) / (digest + CACHE_SUFFIX)
+
+
+def _key(path: PathLike, with_path: bool) -> bytes:
+    stat = os.stat(path)
+    source = os.path.abspath(os.fspath(path)).encode("utf-8") \
+        if with_path else b""
+    return _KEY_HEADER.pack(stat.st_mtime_ns, stat.st_size, len(source)) \
+        + source
+
+
+def _read_cached(
+    cache_file: Path, key: bytes, point_arrays: bool
+) -> Optional[PcGts]:
+    try:
+        with cache_file.open("rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    if not data.startswith(key):
+        # the source file has changed since the cache file was written
+        return None
+
+    try:
+        return from_binary(data[len(key):], point_arrays)
+    except PageXMLError:
+        # corrupt, or written by another version of the format
+        return None
+
+
+def _write_cached(cache_file: Path, key: bytes, pcgts: PcGts):
+    # write to a temporary file first, so that concurrent readers never
+    # see a partially written cache file
+    fd, temp_path = tempfile.mkstemp(
+        prefix=cache_file.name, dir=cache_file.parent
+    )
+
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(key)
+            file.write(to_binary(pcgts))
+
+        os.replace(temp_path, cache_file)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load(
+    path: PathLike, cache_dir: Optional[PathLike] = None,
+    point_arrays: Optional[bool] = None
+) -> Optional[PcGts]:
+    """Loads a pagecontent file through the cache, see
+    PcGts.from_file_cached."""
+
+    if point_arrays is None:
+        point_arrays = np is not None
+
+    cache_file = cache_path(path, cache_dir)
+    key = _key(path, cache_dir is not None)
+
+    pcgts = _read_cached(cache_file, key, point_arrays)
+    if pcgts is not None:
+        return pcgts
+
+    options = ParseOptions(point_arrays=point_arrays)
+    pcgts = PcGts.from_file(os.fspath(path), options)
+    if pcgts is None:
+        return None
+
+    try:
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        _write_cached(cache_file, key, pcgts)
+    except OSError:
+        # the cache is an optimization only, e.g. the directory of the
+        # source file might not be writable
+        pass
+
+    return pcgts
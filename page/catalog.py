@@ -0,0 +1,519 @@
+"""A catalog of a PAGE-XML corpus in an SQLite database.
+
+The catalog stores the header fields of every document (see
+page.stream.PageHeader), one row per region and per line with their
+bounding boxes, and an FTS5 full-text index over the text of the lines.
+Queries return the paths of the documents and the ids of the elements, so
+that only the matching documents have to be loaded afterwards::
+
+    with Catalog("corpus.sqlite") as catalog:
+        catalog.update_directory("corpus/")
+
+        for hit in catalog.find_lines(text='"anno domini"'):
+            pcgts = PcGts.from_file(hit.path)
+            line = pcgts.page.get_by_id(hit.line_id)
+
+Updates are incremental, files whose modification time and size did not
+change are not parsed again.
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Union
+
+from page.elements.options import ParseOptions, ParseDepth
+from page.elements.pcgts import PcGts
+from page.elements.region import Region, TextRegion
+from page.parallel import LoadResult
+
+PathLike = Union[str, "os.PathLike[str]"]
+BBox = Tuple[int, int, int, int]
+
+# the words and glyphs are not needed for the catalog
+CATALOG_PARSE_OPTIONS = ParseOptions(depth=ParseDepth.LINE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    pc_gts_id TEXT,
+    creator TEXT,
+    created TEXT,
+    last_change TEXT,
+    image_filename TEXT,
+    image_width INTEGER,
+    image_height INTEGER,
+    region_count INTEGER NOT NULL,
+    line_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS regions (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents (id),
+    region_id TEXT,
+    region_type TEXT,
+    min_x INTEGER, min_y INTEGER, max_x INTEGER, max_y INTEGER,
+    line_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS regions_document ON regions (document_id);
+CREATE INDEX IF NOT EXISTS regions_type ON regions (region_type);
+CREATE TABLE IF NOT EXISTS lines (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents (id),
+    region_id TEXT,
+    line_id TEXT NOT NULL,
+    min_x INTEGER, min_y INTEGER, max_x INTEGER, max_y INTEGER,
+    text TEXT
+);
+CREATE INDEX IF NOT EXISTS lines_document ON lines (document_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS line_text USING fts5 (
+    text, content='lines', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS lines_insert AFTER INSERT ON lines BEGIN
+    INSERT INTO line_text (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS lines_delete AFTER DELETE ON lines BEGIN
+    INSERT INTO line_text (line_text, rowid, text)
+    VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+@dataclass
+class CatalogUpdate:
+    """The outcome of Catalog.update.
+
+    Attributes
+    ----------
+    added, updated, unchanged, removed : int
+        The number of documents which were added, parsed again since they
+        changed, skipped since they did not change, and removed.
+    failed : List[page.parallel.LoadResult]
+        The files which could not be loaded or are not pagecontent files.
+        They are not part of the catalog (anymore).
+    """
+
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: List[LoadResult] = field(default_factory=list)
+
+
+@dataclass
+class RegionHit:
+    path: str
+    region_id: Optional[str]
+    region_type: Optional[str]
+    bbox: BBox
+
+
+@dataclass
+class LineHit:
+    path: str
+    region_id: Optional[str]
+    line_id: str
+    bbox: BBox
+    text: Optional[str]
+
+
+def _bbox_condition(table: str) -> str:
+    return (
+        f"{table}.min_x <= ? AND {table}.max_x >= ? "
+        f"AND {table}.min_y <= ? AND {table}.max_y >= ?"
+    )
+
+
+def _bbox_params(bbox: Sequence[int]) -> Tuple[int, int, int, int]:
+    x0, y0, x1, y1 = bbox
+    return x1, x0, y1, y0
+
+
+def _region_row(document_id: int, region: Region) -> tuple:
+    if isinstance(region, TextRegion):
+        region_type = region.region_type
+        line_count = len(region.lines)
+    else:
+        region_type, line_count = None, 0
+
+    return (
+        document_id, region.region_id,
+        None if region_type is None else region_type.value,
+        *region.coords.bbox, line_count
+    )
+
+
+class Catalog:
+    """An SQLite catalog of PAGE-XML files, see the module documentation.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The database file, which is created if it does not exist yet, or
+        ":memory:" for a temporary catalog.
+
+    Attributes
+    ----------
+    connection : sqlite3.Connection
+        The connection to the database, for queries which are not covered
+        by the find methods. See _SCHEMA for the tables.
+    """
+
+    def __init__(self, path: PathLike = ":memory:"):
+        self.connection = sqlite3.connect(os.fspath(path))
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        (count,), = self.connection.execute(
+            "SELECT COUNT(*) FROM documents"
+        )
+        return count
+
+    def paths(self) -> List[str]:
+        """Returns the paths of all documents of the catalog."""
+        return [
+            path for path, in self.connection.execute(
+                "SELECT path FROM documents ORDER BY path"
+            )
+        ]
+
+    def _delete(self, document_id: int):
+        for table, column in [
+            ("lines", "document_id"), ("regions", "document_id"),
+            ("documents", "id")
+        ]:
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE {column} = ?", (document_id,)
+            )
+
+    def _insert(self, path: str, stat: os.stat_result, pcgts: PcGts):
+        page = pcgts.page
+        metadata = pcgts.metadata
+        regions = list(page.iter_elements(Region))
+        lines = [
+            (region, line)
+            for region in regions if isinstance(region, TextRegion)
+            for line in region.lines
+        ]
+        width, height = page.image_size
+
+        cursor = self.connection.execute(
+            "INSERT INTO documents (path, mtime_ns, size, pc_gts_id, "
+            "creator, created, last_change, image_filename, image_width, "
+            "image_height, region_count, line_count) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path, stat.st_mtime_ns, stat.st_size, pcgts.pc_gts_id,
+                metadata.creator, metadata.created.isoformat(),
+                metadata.last_change.isoformat(), page.image_filename,
+                width, height, len(regions), len(lines)
+            )
+        )
+        document_id = cursor.lastrowid
+
+        self.connection.executemany(
+            "INSERT INTO regions (document_id, region_id, region_type, "
+            "min_x, min_y, max_x, max_y, line_count) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [_region_row(document_id, region) for region in regions]
+        )
+        self.connection.executemany(
+            "INSERT INTO lines (document_id, region_id, line_id, "
+            "min_x, min_y, max_x, max_y, text) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    document_id, region.region_id, line.line_id,
+                    *line.coords.bbox,
+                    None if line.text is None else line.text.unicode
+                )
+                for region, line in lines
+            ]
+        )
+
+    @staticmethod
+    def _diff(
+        paths: Iterable[PathLike], known: Dict[str, Tuple[int, int, int]],
+        result: CatalogUpdate
+    ) -> Tuple[Set[str], List[Tuple[str, os.stat_result]], List[int]]:
+        """Compares the files with the cataloged documents. Returns the
+        absolute paths of all files, the files which have to be parsed
+        (again) and the ids of documents of files which cannot be accessed
+        anymore."""
+
+        seen = set()
+        changed = []
+        stale = []
+
+        for path in paths:
+            path = os.path.abspath(os.fspath(path))
+            if path in seen:
+                # the same file under a different (e.g. relative) path
+                continue
+            seen.add(path)
+
+            try:
+                stat = os.stat(path)
+            except OSError as error:
+                result.failed.append(LoadResult(path, None, error))
+                if path in known:
+                    stale.append(known[path][0])
+                continue
+
+            entry = known.get(path)
+            if entry is not None and entry[1:] == (
+                stat.st_mtime_ns, stat.st_size
+            ):
+                result.unchanged += 1
+            else:
+                changed.append((path, stat))
+
+        return seen, changed, stale
+
+    def _load_changed(
+        self, changed: List[Tuple[str, os.stat_result]],
+        known: Dict[str, Tuple[int, int, int]], workers: Optional[int],
+        result: CatalogUpdate
+    ):
+        """Parses the changed files and replaces their documents."""
+
+        stats = dict(changed)
+
+        for loaded in PcGts.load_many(
+            [path for path, _ in changed], workers,
+            options=CATALOG_PARSE_OPTIONS
+        ):
+            entry = known.get(loaded.path)
+            if entry is not None:
+                self._delete(entry[0])
+
+            if loaded.pcgts is None:
+                result.failed.append(loaded)
+                continue
+
+            self._insert(loaded.path, stats[loaded.path], loaded.pcgts)
+            if entry is None:
+                result.added += 1
+            else:
+                result.updated += 1
+
+    def update(
+        self, paths: Iterable[PathLike], workers: Optional[int] = 0,
+        prune: Optional[PathLike] = None
+    ) -> CatalogUpdate:
+        """Adds new files to the catalog and parses changed files again.
+
+        Parameters
+        ----------
+        paths : Iterable[str or os.PathLike]
+            The files to catalog. They are stored by their absolute paths.
+        workers : int, optional
+            The number of worker processes parsing the files, see
+            PcGts.load_many. By default, the files are parsed in the
+            current process.
+        prune : str or os.PathLike, optional
+            If given, all documents in this directory which are not part
+            of paths are removed from the catalog.
+        """
+
+        result = CatalogUpdate()
+        known = {
+            path: (document_id, mtime_ns, size)
+            for document_id, path, mtime_ns, size in self.connection.execute(
+                "SELECT id, path, mtime_ns, size FROM documents"
+            )
+        }
+        seen, changed, stale = self._diff(paths, known, result)
+
+        with self.connection:
+            self._load_changed(changed, known, workers, result)
+
+            for document_id in stale:
+                self._delete(document_id)
+
+            if prune is not None:
+                directory = os.path.join(os.path.abspath(prune), "")
+
+                for path, (document_id, _, _) in known.items():
+                    if path.startswith(directory) and path not in seen:
+                        self._delete(document_id)
+                        result.removed += 1
+
+        return result
+
+    def update_directory(
+        self, directory: PathLike, pattern: str = "*.xml",
+        workers: Optional[int] = 0
+    ) -> CatalogUpdate:
+        """Updates the catalog with all files in a directory (including its
+        subdirectories) whose names match the glob pattern, and removes the
+        documents of files which were deleted from it. See update."""
+
+        paths = sorted(Path(directory).rglob(pattern))
+        return self.update(paths, workers, prune=directory)
+
+    def remove(self, path: PathLike) -> bool:
+        """Removes a document from the catalog, returning False if it was
+        not part of the catalog."""
+
+        row = self.connection.execute(
+            "SELECT id FROM documents WHERE path = ?",
+            (os.path.abspath(os.fspath(path)),)
+        ).fetchone()
+
+        if row is None:
+            return False
+
+        with self.connection:
+            self._delete(row[0])
+
+        return True
+
+    def find_documents(
+        self, creator: Optional[str] = None,
+        min_size: Optional[Tuple[int, int]] = None,
+        max_size: Optional[Tuple[int, int]] = None,
+        region_type: Optional[str] = None,
+        min_lines: Optional[int] = None, text: Optional[str] = None
+    ) -> List[str]:
+        """Returns the paths of all documents matching all given criteria.
+
+        Parameters
+        ----------
+        creator : str, optional
+            The creator of the metadata.
+        min_size, max_size : (int, int), optional
+            Bounds of the image width and height (inclusive).
+        region_type : str, optional
+            A TextRegionType value (e.g. "heading") which one of the
+            regions of the document must have.
+        min_lines : int, optional
+            The minimal number of lines of the document.
+        text : str, optional
+            An FTS5 query (e.g. 'domini OR dominus' or '"anno domini"')
+            which one of the lines of the document must match.
+        """
+
+        conditions, params = [], []
+
+        if creator is not None:
+            conditions.append("d.creator = ?")
+            params.append(creator)
+
+        if min_size is not None:
+            conditions.append("d.image_width >= ? AND d.image_height >= ?")
+            params.extend(min_size)
+
+        if max_size is not None:
+            conditions.append("d.image_width <= ? AND d.image_height <= ?")
+            params.extend(max_size)
+
+        if region_type is not None:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM regions r "
+                "WHERE r.document_id = d.id AND r.region_type = ?)"
+            )
+            params.append(region_type)
+
+        if min_lines is not None:
+            conditions.append("d.line_count >= ?")
+            params.append(min_lines)
+
+        if text is not None:
+            conditions.append(
+                "d.id IN (SELECT l.document_id FROM lines l WHERE l.id IN "
+                "(SELECT rowid FROM line_text WHERE line_text MATCH ?))"
+            )
+            params.append(text)
+
+        where = " AND ".join(conditions) or "1"
+        return [
+            path for path, in self.connection.execute(
+                f"SELECT d.path FROM documents d WHERE {where} "
+                "ORDER BY d.path", params
+            )
+        ]
+
+    def find_regions(
+        self, region_type: Optional[str] = None,
+        bbox: Optional[Sequence[int]] = None, path: Optional[PathLike] = None
+    ) -> List[RegionHit]:
+        """Returns all regions (including nested ones) of the given type
+        whose bounding boxes intersect the rectangle bbox, as (min x,
+        min y, max x, max y), optionally only those of one document."""
+
+        conditions, params = [], []
+
+        if region_type is not None:
+            conditions.append("r.region_type = ?")
+            params.append(region_type)
+
+        if bbox is not None:
+            conditions.append(_bbox_condition("r"))
+            params.extend(_bbox_params(bbox))
+
+        if path is not None:
+            conditions.append("d.path = ?")
+            params.append(os.path.abspath(os.fspath(path)))
+
+        where = " AND ".join(conditions) or "1"
+        return [
+            RegionHit(row[0], row[1], row[2], tuple(row[3:]))
+            for row in self.connection.execute(
+                "SELECT d.path, r.region_id, r.region_type, "
+                "r.min_x, r.min_y, r.max_x, r.max_y "
+                "FROM regions r JOIN documents d ON d.id = r.document_id "
+                f"WHERE {where} ORDER BY d.path, r.id", params
+            )
+        ]
+
+    def find_lines(
+        self, text: Optional[str] = None,
+        bbox: Optional[Sequence[int]] = None,
+        path: Optional[PathLike] = None, limit: Optional[int] = None
+    ) -> List[LineHit]:
+        """Returns all lines matching the FTS5 query text (see
+        find_documents) whose bounding boxes intersect bbox (see
+        find_regions), optionally only those of one document. Without a
+        limit, all matching lines are returned."""
+
+        conditions, params = [], []
+
+        if text is not None:
+            conditions.append(
+                "l.id IN (SELECT rowid FROM line_text WHERE line_text MATCH ?)"
+            )
+            params.append(text)
+
+        if bbox is not None:
+            conditions.append(_bbox_condition("l"))
+            params.extend(_bbox_params(bbox))
+
+        if path is not None:
+            conditions.append("d.path = ?")
+            params.append(os.path.abspath(os.fspath(path)))
+
+        where = " AND ".join(conditions) or "1"
+        params.append(-1 if limit is None else limit)
+        return [
+            LineHit(row[0], row[1], row[2], tuple(row[3:7]), row[7])
+            for row in self.connection.execute(
+                "SELECT d.path, l.region_id, l.line_id, "
+                "l.min_x, l.min_y, l.max_x, l.max_y, l.text "
+                "FROM lines l JOIN documents d ON d.id = l.document_id "
+                f"WHERE {where} ORDER BY d.path, l.id LIMIT ?", params
+            )
+        ]
@@ -0,0 +1,403 @@
+"""Columnar exports of the lines, words or glyphs of documents.
+
+Iterating over millions of element objects, e.g. to build a pandas data
+frame, is dominated by the overhead of the objects. Columns holds the same
+information in a few numpy arrays, one row per element:
+
+* the number of the document of the element (see Columns.documents),
+* the ids of the elements and of their parents,
+* their bounding boxes as four int32 columns,
+* the confidence and the text of their TextEquiv,
+* their polygons as offsets into one flat (M, 2) int32 array of points.
+
+Strings are stored as StringColumns, i.e. UTF-8 encoded into one buffer
+with an array of offsets, so that no column holds Python objects.
+Columns can be saved as an uncompressed .npz file, whose arrays are
+memory-mapped when it is loaded again::
+
+    columns = corpus_columns(
+        (result.path, result.pcgts) for result in PcGts.load_many(paths)
+        if result.pcgts is not None
+    )
+    columns.save("lines.npz")
+
+    columns = Columns.load("lines.npz")
+    frame = pandas.DataFrame(columns.to_dict())
+
+Requires numpy.
+"""
+
+import os
+import struct
+import zipfile
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Tuple, Type
+from typing import Union
+
+from page.elements.element import Element
+from page.elements.glyph import Glyph
+from page.elements.line import Line
+from page.elements.page import Page, element_id
+from page.elements.pcgts import PcGts
+from page.elements.region import Region, TextRegion
+from page.elements.point import np, _require_numpy
+from page.elements.word import Word
+
+PathLike = Union[str, "os.PathLike[str]"]
+ColumnType = Union[Type[Line], Type[Word], Type[Glyph]]
+
+_LOCAL_HEADER = struct.Struct("<4s22xHH")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+class StringColumn:
+    """A column of optional strings, stored as their concatenated UTF-8
+    encodings (data) and the offsets of each string into them (offsets,
+    with one more entry than strings). Missing strings are empty and
+    marked in the boolean array present."""
+
+    __slots__ = ("offsets", "data", "present")
+
+    def __init__(
+        self, offsets: "np.ndarray", data: "np.ndarray",
+        present: "np.ndarray"
+    ):
+        self.offsets = offsets
+        self.data = data
+        self.present = present
+
+    @staticmethod
+    def from_strings(strings: Sequence[Optional[str]]) -> "StringColumn":
+        encoded = [
+            b"" if string is None else string.encode("utf-8")
+            for string in strings
+        ]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter(map(len, encoded), np.int64, len(encoded)),
+            out=offsets[1:]
+        )
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        present = np.fromiter(
+            (string is not None for string in strings), bool, len(strings)
+        )
+        return StringColumn(offsets, data, present)
+
+    def __len__(self) -> int:
+        return len(self.present)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if not self.present[index]:
+            return None
+
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+
+    def tolist(self) -> List[Optional[str]]:
+        data = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        return [
+            data[start:end].decode("utf-8") if present else None
+            for start, end, present in zip(
+                offsets, offsets[1:], self.present.tolist()
+            )
+        ]
+
+
+@dataclass(eq=False)
+class Columns:
+    """The columns of a set of elements of the same type, see the module
+    documentation.
+
+    Attributes
+    ----------
+    documents : StringColumn
+        The keys of the documents.
+    document : numpy.ndarray
+        The index of the document of every element, int32.
+    ids, parent_ids : StringColumn
+        The ids of the elements and of the regions, lines or words they
+        belong to. Lines of regions without an id have no parent id.
+    min_x, min_y, max_x, max_y : numpy.ndarray
+        The bounding boxes of the elements, int32, all zero for elements
+        whose polygon has no points.
+    conf : numpy.ndarray
+        The confidences of the texts, float32, NaN if an element has no
+        text or its text has no confidence.
+    texts : StringColumn
+        The Unicode texts of the elements.
+    point_offsets : numpy.ndarray
+        The offsets of the polygons of the elements into points, int64.
+    points : numpy.ndarray
+        The (M, 2) int32 array of the points of all polygons.
+    """
+
+    documents: StringColumn
+    document: "np.ndarray"
+    ids: StringColumn
+    parent_ids: StringColumn
+    min_x: "np.ndarray"
+    min_y: "np.ndarray"
+    max_x: "np.ndarray"
+    max_y: "np.ndarray"
+    conf: "np.ndarray"
+    texts: StringColumn
+    point_offsets: "np.ndarray"
+    points: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.document)
+
+    def polygon(self, index: int) -> "np.ndarray":
+        """Returns the (N, 2) points of the polygon of an element."""
+
+        start, end = self.point_offsets[index], self.point_offsets[index + 1]
+        return self.points[start:end]
+
+    def to_dict(self) -> Dict[str, "np.ndarray"]:
+        """Returns the columns without the polygons as one-dimensional
+        arrays of equal length (strings as object arrays), e.g. for
+        pandas.DataFrame."""
+
+        def objects(strings: List[Optional[str]]) -> "np.ndarray":
+            array = np.empty(len(strings), dtype=object)
+            array[:] = strings
+            return array
+
+        return {
+            "document": objects(self.documents.tolist())[self.document],
+            "id": objects(self.ids.tolist()),
+            "parent_id": objects(self.parent_ids.tolist()),
+            "min_x": self.min_x, "min_y": self.min_y,
+            "max_x": self.max_x, "max_y": self.max_y,
+            "conf": self.conf,
+            "text": objects(self.texts.tolist()),
+        }
+
+    def save(self, path: PathLike):
+        """Writes the columns to an uncompressed .npz file."""
+
+        arrays = {}
+        for column in fields(self):
+            value = getattr(self, column.name)
+
+            if isinstance(value, StringColumn):
+                for part in StringColumn.__slots__:
+                    arrays[f"{column.name}_{part}"] = getattr(value, part)
+            else:
+                arrays[column.name] = value
+
+        with open(path, "wb") as file:
+            np.savez(file, **arrays)
+
+    @staticmethod
+    def load(path: PathLike, mmap: bool = True) -> "Columns":
+        """Reads columns written by save. If mmap is True, the arrays are
+        memory-mapped instead of being read into memory."""
+
+        _require_numpy()
+
+        if mmap:
+            arrays = _map_npz(path)
+        else:
+            with np.load(path) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+
+        values = {}
+        for column in fields(Columns):
+            if column.type is StringColumn:
+                values[column.name] = StringColumn(*(
+                    arrays[f"{column.name}_{part}"]
+                    for part in StringColumn.__slots__
+                ))
+            else:
+                values[column.name] = arrays[column.name]
+
+        return Columns(**values)
+
+
+def _map_npz(path: PathLike) -> Dict[str, "np.ndarray"]:
+    """Memory-maps the arrays of an uncompressed .npz file, which are
+    stored in it as they are."""
+
+    arrays = {}
+
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename
+            if name.endswith(".npy"):
+                name = name[:-len(".npy")]
+
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+
+            # the data of a member follows its local header, whose extra
+            # field may differ from the one in the central directory
+            file.seek(info.header_offset)
+            signature, name_length, extra_length = _LOCAL_HEADER.unpack(
+                file.read(_LOCAL_HEADER.size)
+            )
+            if signature != _LOCAL_HEADER_SIGNATURE:
+                raise zipfile.BadZipFile(f"invalid local header of {name}")
+
+            file.seek(name_length + extra_length, os.SEEK_CUR)
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(file)
+            else:
+                header = np.lib.format.read_array_header_2_0(file)
+            shape, fortran_order, dtype = header
+
+            if 0 in shape:
+                # empty files cannot be mapped
+                arrays[name] = np.empty(shape, dtype)
+            else:
+                arrays[name] = np.memmap(
+                    file, dtype=dtype, mode="r", offset=file.tell(),
+                    shape=shape, order="F" if fortran_order else "C"
+                )
+
+    return arrays
+
+
+def _walk(
+    page: Page, element_type: ColumnType
+) -> Iterator[Tuple[Element, Element]]:
+    """Yields the elements of the given type with their parents in the
+    order of Page._walk, without visiting the levels below them."""
+
+    def walk_region(region: Region) -> Iterator[Tuple[Element, Element]]:
+        for child in region.children:
+            yield from walk_region(child)
+
+        if not isinstance(region, TextRegion):
+            return
+
+        for line in region.lines:
+            if element_type is Line:
+                yield line, region
+                continue
+
+            for word in line.words:
+                if element_type is Word:
+                    yield word, line
+                    continue
+
+                for glyph in word.glyphs:
+                    yield glyph, word
+
+    for region in page.regions:
+        yield from walk_region(region)
+
+
+class _ColumnBuilder:
+    """Collects the fields of elements in lists, which are converted into
+    arrays at once by finish."""
+
+    def __init__(self, element_type: ColumnType):
+        if element_type not in (Line, Word, Glyph):
+            raise ValueError("columns contain lines, words or glyphs")
+
+        self.element_type = element_type
+        self.documents: List[str] = []
+        self.document: List[int] = []
+        self.ids: List[str] = []
+        self.parent_ids: List[Optional[str]] = []
+        self.conf: List[float] = []
+        self.texts: List[Optional[str]] = []
+        self.counts: List[int] = []
+        self.xy: List[int] = []
+
+    def add(self, key: str, page: Page):
+        document = len(self.documents)
+        self.documents.append(key)
+        nan = float("nan")
+
+        for element, parent in _walk(page, self.element_type):
+            self.document.append(document)
+            self.ids.append(element_id(element))
+            self.parent_ids.append(element_id(parent))
+
+            text = element.text
+            if text is None:
+                self.texts.append(None)
+                self.conf.append(nan)
+            else:
+                self.texts.append(text.unicode)
+                self.conf.append(nan if text.conf is None else text.conf)
+
+            coords = element.coords
+            if coords.is_array():
+                self.xy.extend(coords.points.ravel().tolist())
+            else:
+                for point in coords.points:
+                    self.xy.append(point.x)
+                    self.xy.append(point.y)
+
+            self.counts.append(len(coords.points))
+
+    def finish(self) -> Columns:
+        counts = np.array(self.counts, dtype=np.int64)
+        point_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=point_offsets[1:])
+        points = np.array(self.xy, dtype=np.int32).reshape(-1, 2)
+
+        # reduceat would take the first point of the next polygon for an
+        # empty polygon, so only polygons with points are reduced and the
+        # bounding boxes of empty ones are left at zero
+        minima = np.zeros((len(counts), 2), dtype=np.int32)
+        maxima = np.zeros((len(counts), 2), dtype=np.int32)
+        non_empty = counts > 0
+
+        if non_empty.any():
+            starts = point_offsets[:-1][non_empty]
+            minima[non_empty] = np.minimum.reduceat(points, starts)
+            maxima[non_empty] = np.maximum.reduceat(points, starts)
+
+        return Columns(
+            StringColumn.from_strings(self.documents),
+            np.array(self.document, dtype=np.int32),
+            StringColumn.from_strings(self.ids),
+            StringColumn.from_strings(self.parent_ids),
+            minima[:, 0].copy(), minima[:, 1].copy(),
+            maxima[:, 0].copy(), maxima[:, 1].copy(),
+            np.array(self.conf, dtype=np.float32),
+            StringColumn.from_strings(self.texts),
+            point_offsets, points
+        )
+
+
+def page_columns(
+    page: Page, element_type: ColumnType = Line, key: str = ""
+) -> Columns:
+    """Returns the columns of all lines, words or glyphs of a page
+    (including those of nested regions) in document order. The page is the
+    only document, with the given key."""
+
+    _require_numpy()
+    builder = _ColumnBuilder(element_type)
+    builder.add(key, page)
+    return builder.finish()
+
+
+def corpus_columns(
+    documents: Iterable[Tuple[str, Union[PcGts, Page]]],
+    element_type: ColumnType = Line
+) -> Columns:
+    """Returns the columns of all lines, words or glyphs of many documents,
+    given as pairs of a key (e.g. the path) and the document. The fields
+    of the elements are collected before any array is created, so this is
+    considerably faster than concatenating the columns of every page."""
+
+    _require_numpy()
+    builder = _ColumnBuilder(element_type)
+
+    for key, document in documents:
+        if isinstance(document, PcGts):
+            document = document.page
+        builder.add(key, document)
+
+    return builder.finish()
@@ -0,0 +1,258 @@
+"""Transparent support for compressed PAGE-XML files.
+
+When reading, the compression (gzip, bz2 or xz) is detected by the magic
+bytes at the start of a file, so the file name does not matter. When
+writing, the compression is chosen by the suffix of the file name, e.g.
+".xml.gz". Data is decompressed and compressed while it is being parsed
+or written, so no uncompressed copy of a file is ever created.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import zlib
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, Optional, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+Source = Union[PathLike, BinaryIO]
+
+GZIP, BZ2, XZ = "gzip", "bz2", "xz"
+
+_MAGIC_BYTES: Dict[str, bytes] = {
+    GZIP: b"\x1f\x8b",
+    BZ2: b"BZh",
+    XZ: b"\xfd7zXZ\x00"
+}
+_MAGIC_LENGTH = max(len(magic) for magic in _MAGIC_BYTES.values())
+
+_SUFFIXES: Dict[str, str] = {
+    ".gz": GZIP, ".gzip": GZIP,
+    ".bz2": BZ2,
+    ".xz": XZ, ".lzma": XZ
+}
+
+
+def detect_compression(header: bytes) -> Optional[str]:
+    """Returns the compression of data starting with the given bytes, or
+    None if the data is not compressed."""
+
+    for compression, magic in _MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return compression
+
+    return None
+
+
+def compression_from_suffix(path: PathLike) -> Optional[str]:
+    """Returns the compression which is used for writing a file, based on
+    the suffix of its name, or None for uncompressed files."""
+
+    _, suffix = os.path.splitext(os.fspath(path))
+    return _SUFFIXES.get(suffix.lower())
+
+
+def _decompressing_reader(file: BinaryIO, compression: str) -> BinaryIO:
+    if compression == GZIP:
+        return gzip.GzipFile(fileobj=file, mode="rb")
+    elif compression == BZ2:
+        return bz2.BZ2File(file, "rb")
+    else:
+        return lzma.LZMAFile(file, "rb")
+
+
+def _peek(file: BinaryIO) -> bytes:
+    if isinstance(file, io.TextIOBase):
+        return b""
+    elif hasattr(file, "peek"):
+        return file.peek(_MAGIC_LENGTH)[:_MAGIC_LENGTH]
+    elif hasattr(file, "seekable") and file.seekable():
+        position = file.tell()
+        header = file.read(_MAGIC_LENGTH)
+        file.seek(position)
+        return header
+    else:
+        # the magic bytes cannot be put back, assume uncompressed data
+        return b""
+
+
+@contextmanager
+def open_source(source: Source) -> Iterator[Source]:
+    """Returns something lxml can parse from, decompressing the source if
+    it is compressed.
+
+    Uncompressed files are passed on by name, so that lxml can read them
+    itself, which is faster than reading through a Python file object.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        file = open(source, "rb")
+
+        try:
+            compression = detect_compression(file.read(_MAGIC_LENGTH))
+
+            if compression is None:
+                file.close()
+                yield os.fspath(source)
+            else:
+                file.seek(0)
+                with _decompressing_reader(file, compression) as reader:
+                    yield reader
+        finally:
+            file.close()
+    else:
+        compression = detect_compression(_peek(source))
+
+        if compression is None:
+            yield source
+        else:
+            with _decompressing_reader(source, compression) as reader:
+                yield reader
+
+
+class ChunkDecompressor:
+    """Decompresses data which arrives in chunks, e.g. from an asynchronous
+    reader. Like open_source, it detects the compression by the magic bytes
+    at the start of the data and passes uncompressed data on as it is.
+    Files of several concatenated streams (as written by pigz or pbzip2)
+    are supported as well.
+    """
+
+    def __init__(self):
+        # the first bytes, until there are enough to detect the compression
+        self._header: Optional[bytes] = b""
+        self._compression: Optional[str] = None
+        self._decompressor = None
+
+    def _new_decompressor(self):
+        if self._compression == GZIP:
+            # zlib handles the gzip header and trailer with these wbits
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self._compression == BZ2:
+            return bz2.BZ2Decompressor()
+        else:
+            return lzma.LZMADecompressor()
+
+    def _start(self) -> bytes:
+        header, self._header = self._header, None
+        self._compression = detect_compression(header)
+
+        if self._compression is not None:
+            self._decompressor = self._new_decompressor()
+
+        return header
+
+    def _decompress(self, data: bytes) -> bytes:
+        if self._decompressor is None:
+            return data
+
+        parts = []
+        while data:
+            if self._decompressor.eof:
+                # the remaining data belongs to the next stream
+                self._decompressor = self._new_decompressor()
+
+            parts.append(self._decompressor.decompress(data))
+
+            if self._decompressor.eof:
+                data = self._decompressor.unused_data
+            else:
+                data = b""
+
+        return b"".join(parts)
+
+    def decompress(self, chunk: bytes) -> bytes:
+        """Returns the decompressed data of the next chunk, which may be
+        empty."""
+
+        if self._header is not None:
+            self._header += chunk
+            if len(self._header) < _MAGIC_LENGTH:
+                return b""
+
+            chunk = self._start()
+
+        return self._decompress(chunk)
+
+    def flush(self) -> bytes:
+        """Returns the remaining decompressed data after the last chunk.
+
+        Raises
+        ------
+        EOFError
+            If the data ended in the middle of a compressed stream.
+        """
+
+        data = b"" if self._header is None else self._decompress(self._start())
+
+        if self._decompressor is not None and not self._decompressor.eof:
+            raise EOFError(
+                "Compressed file ended before the end-of-stream marker was "
+                "reached"
+            )
+
+        return data
+
+
+def compress(
+    data: bytes, compression: Optional[str],
+    compresslevel: Optional[int] = None
+) -> bytes:
+    """Compresses data, see open_output for the compression levels."""
+
+    if compression is None:
+        return data
+
+    stream = io.BytesIO()
+    with _compressing_writer(stream, compression, compresslevel) as writer:
+        writer.write(data)
+
+    return stream.getvalue()
+
+
+def _compressing_writer(
+    file: BinaryIO, compression: str, compresslevel: Optional[int]
+) -> BinaryIO:
+    if compression == GZIP:
+        level = 9 if compresslevel is None else compresslevel
+        # mtime=0 makes the output reproducible
+        return gzip.GzipFile(
+            fileobj=file, mode="wb", compresslevel=level, mtime=0
+        )
+    elif compression == BZ2:
+        level = 9 if compresslevel is None else compresslevel
+        return bz2.BZ2File(file, "wb", compresslevel=level)
+    elif compression == XZ:
+        return lzma.LZMAFile(file, "wb", preset=compresslevel)
+    else:
+        raise ValueError(f"unknown compression '{compression}'")
+
+
+@contextmanager
+def open_output(
+    path: PathLike, compresslevel: Optional[int] = None
+) -> Iterator[BinaryIO]:
+    """Opens a file for writing, compressing everything written to it if
+    the suffix of its name is one of .gz, .bz2 or .xz.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to write.
+    compresslevel : int, optional
+        The compression level, from 1 (fastest) to 9 (smallest). By default
+        9 for gzip and bz2, and 6 for xz. Ignored for uncompressed files.
+    """
+
+    compression = compression_from_suffix(path)
+
+    with open(path, "wb") as file:
+        if compression is None:
+            yield file
+        else:
+            with _compressing_writer(
+                file, compression, compresslevel
+            ) as writer:
+                yield writer
@@ -1,6 +1,8 @@
 from page.elements.element import Element
+from page.elements.options import ParseOptions, ParseDepth
 from page.elements.line import Line, IndexedLine
 from page.elements.point import Point, parse_points, points_to_string
+from page.elements.point import parse_points_array
 from page.elements.coords import Coordinates, Baseline
 from page.elements.metadata import Metadata
 from page.elements.region import Region, TextRegion, TextRegionType
@@ -10,16 +12,20 @@ from page.elements.word import Word
 from page.elements.glyph import Glyph
 from page.elements.page import Page
 from page.elements.pcgts import PcGts
+from page.elements.content_hash import content_hash
+from page.elements.content_hash import invalidate_content_hash
+from page.elements.content_hash import content_equal
 
 __all__ = [
-    "Element",
+    "Element", "ParseOptions", "ParseDepth",
     "Line", "IndexedLine",
     "Coordinates", "Baseline",
-    "Point", "parse_points", "points_to_string",
+    "Point", "parse_points", "points_to_string", "parse_points_array",
     "Metadata",
     "Region", "TextRegion", "TextRegionType",
     "RegionRef", "RegionRefIndexed",
     "Text", "Word", "Glyph",
     "Page",
-    "PcGts"
+    "PcGts",
+    "content_hash", "invalidate_content_hash", "content_equal"
 ]
@@ -0,0 +1,67 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from lxml import etree
+
+from page.constants import NsMap
+
+Children = Dict[str, List[etree.ElementBase]]
+
+
+@lru_cache(maxsize=None)
+def _clark_tags(
+    namespace: Optional[str], localnames: Tuple[str, ...]
+) -> Dict[str, str]:
+    """Maps the Clark notation ({namespace}localname) of every local name
+    to the local name itself."""
+
+    if namespace is None:
+        return {name: name for name in localnames}
+    else:
+        return {f"{{{namespace}}}{name}": name for name in localnames}
+
+
+def group_children(
+    xml: etree.ElementBase, nsmap: NsMap, localnames: Tuple[str, ...]
+) -> Children:
+    """Groups the direct children of an element by their tag, iterating
+    over the children only once.
+
+    This is equivalent to calling xml.findall("./<localname>", nsmap) for
+    every one of the given local names, i.e. the children are expected to
+    be in the default namespace of nsmap (or in no namespace at all if it
+    has no default namespace). Children with any other tag are skipped by
+    lxml without creating Python objects for them.
+
+    Parameters
+    ----------
+    xml : lxml.etree.ElementBase
+        The element whose children to group.
+    nsmap : page.constants.NsMap
+        The namespace map the element was parsed with.
+    localnames : Tuple[str, ...]
+        The local names of the tags to look for. This should be a constant,
+        since the corresponding Clark notation tags are cached.
+
+    Returns
+    -------
+    Dict[str, List[lxml.etree.ElementBase]]
+        For every local name, the list of children with that tag in
+        document order.
+    """
+
+    tags = _clark_tags(nsmap.get(None), localnames)
+    children: Children = {name: [] for name in localnames}
+
+    for child_xml in xml.iterchildren(*tags):
+        children[tags[child_xml.tag]].append(child_xml)
+
+    return children
+
+
+def first_child(
+    children: Children, localname: str
+) -> Optional[etree.ElementBase]:
+    """Returns the first child with the given local name, or None."""
+
+    matches = children[localname]
+    return matches[0] if matches else None
@@ -0,0 +1,238 @@
+"""Content hashes of elements, computed bottom-up like a Merkle tree.
+
+The content hash of an element is a BLAKE2b digest of its class and of the
+values of all fields which take part in its equality, where child
+elements contribute their own content hashes. Two elements with the same
+hash are equal (barring a collision of the 128 bit digests), so hashes can
+serve as cache keys or to deduplicate documents and regions::
+
+    unique = {content_hash(pcgts.page): pcgts for pcgts in documents}
+
+The hashes of texts, glyphs, words, lines, regions and pages are cached on
+the elements. Hashing a page again after changing one of its regions only
+rehashes the region and the page, if the caches of both were discarded
+with invalidate_content_hash. content_equal compares two elements by their
+hashes, which takes constant time once both hashes are cached. The ==
+operator of the elements is not affected and always compares all fields.
+
+Like the other caches of this package, the cached hashes do not notice
+changes of the elements. After changing an element, invalidate_content_hash
+has to be called on it and on all of its ancestors, or simply on the page,
+which discards all hashes of the page. Page.invalidate_indices discards
+them as well.
+"""
+
+import struct
+from dataclasses import fields
+from datetime import datetime
+from enum import Enum
+from hashlib import blake2b
+from typing import Callable, Dict, List, Sequence, Tuple, Type
+from typing import Union
+
+from page.elements.coords import Coordinates
+from page.elements.element import Element
+from page.elements.lazy import LazyList
+from page.elements.point import np
+
+DIGEST_SIZE = 16
+
+# the names of the fields of every class which are part of its equality
+_COMPARED_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _compared_fields(cls: Type) -> Tuple[str, ...]:
+    names = _COMPARED_FIELDS.get(cls)
+
+    if names is None:
+        names = tuple(f.name for f in fields(cls) if f.compare)
+        _COMPARED_FIELDS[cls] = names
+
+    return names
+
+
+def _points_bytes(coords: Coordinates) -> bytes:
+    # point lists and point arrays with the same points are equal, so both
+    # are hashed as little-endian int64 pairs
+    if coords.is_array():
+        return np.ascontiguousarray(coords.points, dtype="<i8").tobytes()
+
+    points = coords.points
+    return struct.pack(
+        f"<{2 * len(points)}q",
+        *[value for point in points for value in (point.x, point.y)]
+    )
+
+
+# Each encoder appends the encoding of a field value to a list of parts,
+# prefixed with its kind (and, for variable-length values, its length) to
+# keep the encoding unambiguous.
+Encoder = Callable[[List[bytes], object], None]
+
+
+def _encode_none(parts: List[bytes], value: None):
+    parts.append(b"N")
+
+
+def _encode_str(parts: List[bytes], value: str):
+    data = value.encode("utf-8")
+    parts.append(b"S%d:" % len(data))
+    parts.append(data)
+
+
+def _encode_bool(parts: List[bytes], value: bool):
+    parts.append(b"T" if value else b"F")
+
+
+def _encode_number(parts: List[bytes], value: Union[int, float]):
+    # equal numbers like 1 and 1.0 have to be encoded alike
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    parts.append(b"I%r;" % value)
+
+
+def _encode_enum(parts: List[bytes], value: Enum):
+    parts.append(b"E")
+    _encode(parts, value.value)
+
+
+def _encode_datetime(parts: List[bytes], value: datetime):
+    _encode_str(parts, value.isoformat())
+
+
+def _encode_coords(parts: List[bytes], value: Coordinates):
+    data = _points_bytes(value)
+    parts.append(b"C%s:%d:" % (
+        type(value).__qualname__.encode("ascii"), len(data)
+    ))
+    parts.append(data)
+
+
+def _encode_element(parts: List[bytes], value: Element):
+    parts.append(b"H")
+    parts.append(content_hash(value))
+
+
+def _encode_sequence(parts: List[bytes], value: Sequence):
+    parts.append(b"L%d:" % len(value))
+    for item in value:
+        _encode(parts, item)
+
+
+# the encoders of all types encountered so far, see _encoder
+_ENCODERS: Dict[type, Encoder] = {}
+
+
+def _encoder(cls: type) -> Encoder:
+    # the order matters, e.g. bool is a subclass of int and Coordinates of
+    # Element
+    for base, encoder in (
+        (type(None), _encode_none), (str, _encode_str),
+        (bool, _encode_bool), ((int, float), _encode_number),
+        (Enum, _encode_enum), (datetime, _encode_datetime),
+        (Coordinates, _encode_coords), (Element, _encode_element),
+        ((list, tuple, LazyList), _encode_sequence),
+    ):
+        if issubclass(cls, base):
+            _ENCODERS[cls] = encoder
+            return encoder
+
+    raise TypeError(f"cannot hash values of type {cls}")
+
+
+def _encode(parts: List[bytes], value):
+    encoder = _ENCODERS.get(type(value))
+    if encoder is None:
+        encoder = _encoder(type(value))
+
+    encoder(parts, value)
+
+
+def content_hash(element: Element) -> bytes:
+    """Returns the content hash of an element, see the module documentation.
+
+    Returns
+    -------
+    bytes
+        A 16 byte digest, which is stable across processes and platforms.
+
+    Raises
+    ------
+    TypeError
+        If a field of the element (or of one of its children) has a type
+        which cannot be hashed.
+    """
+
+    cached = getattr(element, "_content_hash", None)
+    if cached is not None:
+        return cached
+
+    cls = type(element)
+    parts = [cls.__qualname__.encode("ascii")]
+
+    for name in _compared_fields(cls):
+        _encode(parts, getattr(element, name))
+
+    value = blake2b(b"".join(parts), digest_size=DIGEST_SIZE).digest()
+
+    try:
+        element._content_hash = value
+    except AttributeError:
+        # the class does not cache its hash
+        pass
+
+    return value
+
+
+# whether the values of a type can have cached content hashes (or contain
+# such values), see _has_hashes
+_HAS_HASHES: Dict[type, bool] = {}
+
+
+def _has_hashes(cls: type) -> bool:
+    has_hashes = _HAS_HASHES.get(cls)
+
+    if has_hashes is None:
+        # coordinates are not cached and only contain points
+        has_hashes = (
+            issubclass(cls, Element) and not issubclass(cls, Coordinates)
+        )
+        _HAS_HASHES[cls] = has_hashes
+
+    return has_hashes
+
+
+def invalidate_content_hash(element: Element):
+    """Discards the cached content hashes of an element and of all of its
+    descendants, which is required after changing them."""
+
+    if getattr(element, "_content_hash", None) is not None:
+        element._content_hash = None
+
+    for name in _compared_fields(type(element)):
+        value = getattr(element, name)
+        cls = type(value)
+
+        if cls is list or cls is tuple:
+            items = value
+        elif cls is LazyList:
+            # unparsed items have no hashes yet
+            items = value.parsed()
+        else:
+            if _has_hashes(cls):
+                invalidate_content_hash(value)
+            continue
+
+        for item in items:
+            if _has_hashes(type(item)):
+                invalidate_content_hash(item)
+
+
+def content_equal(first: Element, second: Element) -> bool:
+    """Returns True if two elements have the same content hash, i.e. if
+    they are equal (barring a collision). Once the hashes of both elements
+    are cached, this takes constant time, unlike ==, which compares all
+    fields. Like content_hash, it relies on the cached hashes being
+    invalidated after changes."""
+
+    return first is second or content_hash(first) == content_hash(second)
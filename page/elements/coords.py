@@ -1,31 +1,73 @@
 from page.elements import Element
 from page.elements.point import Point, parse_points, points_to_string
+from page.elements.point import parse_points_array, points_to_array
+from page.elements.point import array_to_points, np, _require_numpy
+from page.elements.geometry import BBox, BatchGeometry, batch_geometry
+from page.elements.geometry import polygon_bbox, polygon_signed_area
+from page.elements.geometry import polygon_centroid, convex_hull
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
+from page.elements.slots import add_slots
 from page.constants import NsMap
 from page.exceptions import PageXMLError
-from typing import List
+from typing import List, Optional, Sequence, Tuple, Union
 from lxml import etree
 from dataclasses import dataclass
 
+# Either a list of Points or, with ParseOptions(point_arrays=True),
+# an (N, 2) int32 numpy array.
+Points = Union[List[Point], "np.ndarray"]
 
-@dataclass
+
+class _GeometryCache:
+    """The geometric properties of one points object, computed on demand."""
+
+    __slots__ = ("points", "bbox", "area", "centroid", "convex_hull")
+
+    def __init__(self, points: Points):
+        self.points = points
+        self.bbox: Optional[BBox] = None
+        self.area: Optional[float] = None
+        self.centroid: Optional[Tuple[float, float]] = None
+        self.convex_hull: Optional[Points] = None
+
+
+@add_slots
+@dataclass(eq=False)
 class Coordinates(Element):
-    points: List[Point]
+    """The points of a polygon (or a polyline, in case of a Baseline).
+
+    The geometric properties bbox, area, centroid and convex_hull are
+    computed on first access and cached. Assigning new points discards the
+    cache, but changes of the points in place (e.g. appending a Point)
+    are not noticed, call invalidate_geometry (or Page.invalidate_indices
+    for all coordinates of a page) after them.
+    """
+
+    __slots__ = ("_geometry",)
+
+    points: Points
 
     @staticmethod
     def _from_element(
-        coords_xml: etree.ElementBase, nsmap: NsMap
-    ) -> List[Point]:
+        coords_xml: etree.ElementBase, nsmap: NsMap, options: ParseOptions
+    ) -> Points:
         points_str = coords_xml.get("points")
         if points_str is None:
             raise PageXMLError("Coords element is missing points attribute")
 
-        return parse_points(points_str)
+        if options.point_arrays:
+            return parse_points_array(points_str)
+        else:
+            return parse_points(points_str)
 
     @staticmethod
     def from_element(
-        coords_xml: etree.ElementBase, nsmap: NsMap
+        coords_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
     ) -> "Coordinates":
-        return Coordinates(Coordinates._from_element(coords_xml, nsmap))
+        return Coordinates(
+            Coordinates._from_element(coords_xml, nsmap, options)
+        )
 
     def _to_element(self, nsmap: NsMap, tag_name: str) -> etree.ElementBase:
         coords_xml = etree.Element(tag_name, nsmap=nsmap)
@@ -35,14 +77,159 @@ class Coordinates(Element):
     def to_element(self, nsmap: NsMap) -> etree.ElementBase:
         return self._to_element(nsmap, "Coords")
 
+    def is_array(self) -> bool:
+        """Returns True if the points are stored in a numpy array."""
+        return np is not None and isinstance(self.points, np.ndarray)
+
+    def as_array(self) -> "np.ndarray":
+        """Returns the points as an (N, 2) int32 numpy array."""
+
+        if self.is_array():
+            return self.points
+        else:
+            return points_to_array(self.points)
+
+    def as_points(self) -> List[Point]:
+        """Returns the points as a list of Points."""
+
+        if self.is_array():
+            return array_to_points(self.points)
+        else:
+            return self.points
+
+    def _xy(self) -> List[Tuple[int, int]]:
+        if self.is_array():
+            return self.points.tolist()
+        else:
+            return [(p.x, p.y) for p in self.points]
+
+    def _geometry_cache(self) -> _GeometryCache:
+        cache = getattr(self, "_geometry", None)
+
+        # the cache belongs to the points object it was computed from
+        if cache is None or cache.points is not self.points:
+            cache = _GeometryCache(self.points)
+            self._geometry = cache
+
+        return cache
+
+    def invalidate_geometry(self):
+        """Discards the cached geometric properties, which is required after
+        changing the points in place."""
+        self._geometry = None
+
+    @property
+    def bbox(self) -> BBox:
+        """The bounding box (min x, min y, max x, max y) of the points."""
+
+        cache = self._geometry_cache()
+        if cache.bbox is None:
+            cache.bbox = polygon_bbox(self._xy())
+        return cache.bbox
+
+    @property
+    def area(self) -> float:
+        """The area of the polygon (shoelace formula)."""
+
+        cache = self._geometry_cache()
+        if cache.area is None:
+            cache.area = abs(polygon_signed_area(self._xy()))
+        return cache.area
+
+    @property
+    def centroid(self) -> Tuple[float, float]:
+        """The centroid of the polygon, or the mean of its points if it has
+        no area."""
+
+        cache = self._geometry_cache()
+        if cache.centroid is None:
+            cache.centroid = polygon_centroid(self._xy())
+        return cache.centroid
+
+    @property
+    def convex_hull(self) -> Points:
+        """The vertices of the convex hull of the points, as a list of
+        Points or, for point arrays, as an (N, 2) int32 array."""
+
+        cache = self._geometry_cache()
+        if cache.convex_hull is None:
+            hull = convex_hull(self._xy())
+
+            if self.is_array():
+                cache.convex_hull = np.array(hull, np.int32).reshape(-1, 2)
+            else:
+                cache.convex_hull = [Point(x, y) for x, y in hull]
+
+        return cache.convex_hull
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        if self.is_array() or other.is_array():
+            return bool(np.array_equal(self.as_array(), other.as_array()))
+        else:
+            return self.points == other.points
+
+
+def compute_geometry(
+    coords: Sequence[Coordinates], cache: bool = True
+) -> BatchGeometry:
+    """Computes the bounding boxes, areas and centroids of many coordinates
+    in one vectorized pass, see page.elements.geometry.batch_geometry.
+
+    Parameters
+    ----------
+    coords : Sequence[page.elements.Coordinates]
+        The coordinates, each with at least one point.
+    cache : bool
+        If True, the results are also stored in the caches of the
+        coordinates, so that their bbox, area and centroid properties do
+        not have to compute them again.
+    """
+
+    _require_numpy()
+
+    counts = np.fromiter(
+        (len(c.points) for c in coords), dtype=np.int64, count=len(coords)
+    )
+
+    if all(c.is_array() for c in coords):
+        arrays = [c.points for c in coords]
+        xy = np.concatenate(arrays) if arrays else np.empty((0, 2), np.int64)
+    else:
+        # numpy converts a flat list of ints much faster than pairs
+        xy = np.array([
+            value
+            for c in coords
+            for point in (c.points.tolist() if c.is_array() else c.points)
+            for value in (
+                point if isinstance(point, list) else (point.x, point.y)
+            )
+        ], dtype=np.int64).reshape(-1, 2)
+
+    geometry = batch_geometry(xy, counts)
+
+    if cache:
+        for c, bbox, area, centroid in zip(
+            coords, map(tuple, geometry.bboxes.tolist()),
+            geometry.areas.tolist(), map(tuple, geometry.centroids.tolist())
+        ):
+            entry = c._geometry_cache()
+            entry.bbox, entry.area, entry.centroid = bbox, area, centroid
+
+    return geometry
+
 
-@dataclass
+@add_slots
+@dataclass(eq=False)
 class Baseline(Coordinates):
     @staticmethod
     def from_element(
-        coords_xml: etree.ElementBase, nsmap: NsMap
+        coords_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
     ) -> "Baseline":
-        return Baseline(Coordinates._from_element(coords_xml, nsmap))
+        return Baseline(Coordinates._from_element(coords_xml, nsmap, options))
 
     def to_element(self, nsmap: NsMap) -> etree.ElementBase:
         return self._to_element(nsmap, "Baseline")
@@ -8,6 +8,8 @@ class Element(ABC):
     For example, these could be regions, lines, text, etc.
     """
 
+    __slots__ = ()
+
     @staticmethod
     @abstractmethod
     def from_element(xml: etree.ElementBase, nsmap: NsMap) -> "Element":
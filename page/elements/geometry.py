@@ -0,0 +1,154 @@
+"""Geometric properties of polygons, given as sequences of (x, y) pairs.
+
+Besides the functions for single polygons, batch_geometry computes the
+bounding boxes, areas and centroids of many polygons at once with numpy.
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+from page.elements.point import np
+
+BBox = Tuple[int, int, int, int]
+XY = Sequence[Sequence[int]]
+
+
+def polygon_bbox(xy: XY) -> BBox:
+    """Returns the bounding box (min x, min y, max x, max y)."""
+
+    xs = [p[0] for p in xy]
+    ys = [p[1] for p in xy]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def polygon_signed_area(xy: XY) -> float:
+    """Returns the area of the polygon using the shoelace formula. The area
+    is positive if the points are ordered counter-clockwise in a coordinate
+    system whose y axis points up, i.e. clockwise on an image."""
+
+    n = len(xy)
+    twice_area = 0
+
+    for i in range(n):
+        x0, y0 = xy[i]
+        x1, y1 = xy[(i + 1) % n]
+        twice_area += x0 * y1 - x1 * y0
+
+    return twice_area / 2
+
+
+def polygon_centroid(xy: XY) -> Tuple[float, float]:
+    """Returns the centroid of the area of the polygon. For polygons
+    without an area (e.g. lines), this is the mean of their points."""
+
+    n = len(xy)
+    twice_area = 0
+    cx = cy = 0
+
+    for i in range(n):
+        x0, y0 = xy[i]
+        x1, y1 = xy[(i + 1) % n]
+        cross = x0 * y1 - x1 * y0
+        twice_area += cross
+        cx += (x0 + x1) * cross
+        cy += (y0 + y1) * cross
+
+    if twice_area == 0:
+        return sum(p[0] for p in xy) / n, sum(p[1] for p in xy) / n
+
+    return cx / (3 * twice_area), cy / (3 * twice_area)
+
+
+def convex_hull(xy: XY) -> List[Tuple[int, int]]:
+    """Returns the vertices of the convex hull of the points, starting with
+    the smallest point and without collinear points (Andrew's monotone
+    chain algorithm)."""
+
+    points = sorted(set((p[0], p[1]) for p in xy))
+
+    if len(points) <= 2:
+        return points
+
+    def cross(o, a, b) -> int:
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    def chain(points) -> List[Tuple[int, int]]:
+        hull: List[Tuple[int, int]] = []
+
+        for point in points:
+            while len(hull) >= 2 and cross(hull[-2], hull[-1], point) <= 0:
+                hull.pop()
+            hull.append(point)
+
+        return hull
+
+    lower = chain(points)
+    upper = chain(reversed(points))
+    return lower[:-1] + upper[:-1]
+
+
+@dataclass
+class BatchGeometry:
+    """The geometric properties of many polygons as numpy arrays, with one
+    row per polygon."""
+
+    # (N, 4) int64 array of (min x, min y, max x, max y)
+    bboxes: "np.ndarray"
+    # (N,) float64 array of (unsigned) areas
+    areas: "np.ndarray"
+    # (N, 2) float64 array of centroids
+    centroids: "np.ndarray"
+
+
+def batch_geometry(xy: "np.ndarray", counts: "np.ndarray") -> BatchGeometry:
+    """Computes bounding boxes, areas and centroids of many polygons in one
+    vectorized pass.
+
+    Parameters
+    ----------
+    xy : numpy.ndarray
+        The (M, 2) array of the points of all polygons, one polygon after
+        the other.
+    counts : numpy.ndarray
+        The number of points of every polygon, each at least 1.
+    """
+
+    counts = np.asarray(counts, dtype=np.int64)
+
+    if len(counts) == 0:
+        return BatchGeometry(
+            np.empty((0, 4), np.int64), np.empty(0), np.empty((0, 2))
+        )
+
+    if counts.min() < 1:
+        raise ValueError("every polygon must have at least one point")
+
+    xy = np.asarray(xy, dtype=np.int64)
+    starts = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=starts[1:])
+
+    # the index of the next point of the same polygon
+    following = np.arange(1, len(xy) + 1)
+    following[starts + counts - 1] = starts
+
+    x, y = xy[:, 0], xy[:, 1]
+    x_next, y_next = x[following], y[following]
+    cross = (x * y_next - x_next * y).astype(np.float64)
+
+    twice_areas = np.add.reduceat(cross, starts)
+    sums = np.add.reduceat(
+        np.stack(((x + x_next) * cross, (y + y_next) * cross), axis=1),
+        starts
+    )
+    means = np.add.reduceat(xy, starts) / counts[:, None]
+
+    has_area = twice_areas != 0
+    centroids = means
+    centroids[has_area] = (
+        sums[has_area] / (3 * twice_areas[has_area])[:, None]
+    )
+
+    bboxes = np.concatenate((
+        np.minimum.reduceat(xy, starts), np.maximum.reduceat(xy, starts)
+    ), axis=1)
+
+    return BatchGeometry(bboxes, np.abs(twice_areas) / 2, centroids)
@@ -2,6 +2,9 @@ from page.elements.element import Element
 from page.elements.coords import Coordinates
 from page.elements.text import Text
 from page.elements.indexed import IndexedElement
+from page.elements.slots import add_slots
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
+from page.elements.children import group_children, first_child
 from page.constants import NsMap
 from page.exceptions import PageXMLError
 from typing import Iterable, List, Optional
@@ -9,26 +12,36 @@ from lxml import etree
 from dataclasses import dataclass, field
 
 
+@add_slots
 @dataclass
 class Glyph(Element):
+    _CHILD_TAGS = ("Coords", "TextEquiv")
+
+    __slots__ = ("_content_hash",)
+
     glyph_id: str
     coords: Coordinates = field(repr=False)
     text: Optional[Text]
     # TODO: Glyph attributes (e.g. ligature, symbol, ...)
 
     @staticmethod
-    def from_element(glyph_xml: etree.ElementBase, nsmap: NsMap) -> "Glyph":
+    def from_element(
+        glyph_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> "Glyph":
         glyph_id = glyph_xml.get("id")
         if glyph_id is None:
             raise PageXMLError("Glyph is missing an id attribute")
 
-        coords_xml = glyph_xml.find("./Coords", namespaces=nsmap)
+        children = group_children(glyph_xml, nsmap, Glyph._CHILD_TAGS)
+
+        coords_xml = first_child(children, "Coords")
         if coords_xml is None:
             raise PageXMLError("Glyph is missing Coords element")
 
-        coords = Coordinates.from_element(coords_xml, nsmap)
+        coords = Coordinates.from_element(coords_xml, nsmap, options)
 
-        textequiv_xmls = glyph_xml.findall("./TextEquiv", namespaces=nsmap)
+        textequiv_xmls = children["TextEquiv"]
         textequiv_count = len(textequiv_xmls)
 
         if textequiv_count == 0:
@@ -45,24 +58,28 @@ class Glyph(Element):
         glyph_xml.set("id", self.glyph_id)
         glyph_xml.append(self.coords.to_element(nsmap))
 
-        if self.text is not None:
-            glyph_xml.append(self.text.to_element(nsmap))
+        for text in self._texts():
+            glyph_xml.append(text.to_element(nsmap))
 
         return glyph_xml
 
+    def _texts(self) -> List[Text]:
+        """Returns the texts which are written as TextEquiv elements."""
+        return [] if self.text is None else [self.text]
+
 
 class IndexedGlyph(Glyph, IndexedElement[int, Text]):
+    __slots__ = ("_index",)
+
     def __init__(self, glyph_id: str, coords: Coordinates, texts: List[Text]):
-        IndexedElement.__init__(self, texts, lambda text: text.index)
+        IndexedElement.__init__(self, texts)
         Glyph.__init__(self, glyph_id, coords, self.get_from_index(0))
 
     def texts(self) -> Iterable[Text]:
         return self.objects()
 
-    def to_element(self, nsmap: NsMap) -> etree.ElementBase:
-        glyph_xml = super().to_element(nsmap)
+    def __reduce__(self):
+        return IndexedGlyph, (self.glyph_id, self.coords, list(self.texts()))
 
-        for text in self.texts():
-            glyph_xml.append(text.to_element(nsmap))
-
-        return glyph_xml
+    def _texts(self) -> List[Text]:
+        return list(self.texts())
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Callable, Hashable, TypeVar
+from typing import Hashable, TypeVar
 from typing import Generic, Dict, Optional, List, Iterable
 
 from page.exceptions import PageXMLError
@@ -12,24 +12,30 @@ class IndexedElement(Generic[IndexTy, ObjectTy], ABC):
     """Represents an element which can contain indexed subelements ("objects")
     of type ObjectTy, providing an efficient get_from_index(IndexTy) method.
 
+    The index of an object is determined by the index_from_obj method, which
+    is shared by all instances of a class. By default, it returns the index
+    attribute of the object. Inheriting classes have to provide an _index
+    slot (or a __dict__) to store the index in.
+
     This class assumes that the inheriting subclasses are immutable."""
 
-    def __init__(
-        self, objects: List[ObjectTy],
-        index_from_obj: Callable[[ObjectTy], Optional[IndexTy]]
-    ):
-        self.__index_from_obj: Callable[[ObjectTy], Optional[IndexTy]] = (
-            index_from_obj
-        )
-        self.__index = self.__build_index(objects)
+    __slots__ = ()
+
+    @staticmethod
+    def index_from_obj(obj: ObjectTy) -> Optional[IndexTy]:
+        return obj.index
+
+    def __init__(self, objects: List[ObjectTy]):
+        self._index = self.__build_index(objects)
 
     def __build_index(
         self, objects: List[ObjectTy]
     ) -> Dict[IndexTy, ObjectTy]:
         index: Dict[IndexTy, ObjectTy] = {}
+        index_from_obj = self.index_from_obj
 
         for obj in objects:
-            idx = self.__index_from_obj(obj)
+            idx = index_from_obj(obj)
 
             if idx is None:
                 # This error occurs for example when an IndexedElement such as
@@ -45,10 +51,10 @@ class IndexedElement(Generic[IndexTy, ObjectTy], ABC):
         return index
 
     def objects(self) -> Iterable[ObjectTy]:
-        return self.__index.values()
+        return self._index.values()
 
     def get_from_index(self, index: int) -> Optional[ObjectTy]:
-        if index in self.__index:
-            return self.__index[index]
+        if index in self._index:
+            return self._index[index]
         else:
             return None
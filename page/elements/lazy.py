@@ -0,0 +1,115 @@
+from typing import Callable, Iterable, List, MutableSequence, TypeVar
+from typing import Union
+from lxml import etree
+
+ItemTy = TypeVar("ItemTy")
+
+# marks items of a LazyList which have not been parsed yet
+_UNPARSED = object()
+
+
+class LazyList(MutableSequence[ItemTy]):
+    """A list of elements which are parsed from their lxml elements on
+    first access. Every item is parsed at most once and then cached.
+
+    A LazyList compares equal to any list containing the same elements.
+    Mutating it parses all remaining items first, after which it behaves
+    exactly like a regular list.
+    """
+
+    def __init__(
+        self, xmls: List[etree.ElementBase],
+        parse: Callable[[etree.ElementBase], ItemTy]
+    ):
+        self._xmls = xmls
+        self._parse = parse
+        self._items: list = [_UNPARSED] * len(xmls)
+
+    def _get(self, index: int) -> ItemTy:
+        item = self._items[index]
+
+        if item is _UNPARSED:
+            item = self._parse(self._xmls[index])
+            self._items[index] = item
+
+        return item
+
+    def _materialize(self) -> list:
+        if self._xmls is not None:
+            for index in range(len(self._items)):
+                self._get(index)
+
+            # all items are parsed, the lxml elements are no longer needed
+            self._xmls = None
+            self._parse = None
+
+        return self._items
+
+    def is_materialized(self) -> bool:
+        """Returns True if all items have been parsed."""
+        return self._xmls is None or _UNPARSED not in self._items
+
+    def parsed(self) -> Iterable[ItemTy]:
+        """Yields the items which have been parsed so far, without parsing
+        any others."""
+
+        for item in self._items:
+            if item is not _UNPARSED:
+                yield item
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [
+                self._get(i) for i in range(*index.indices(len(self._items)))
+            ]
+
+        if index < 0:
+            index += len(self._items)
+
+        if not (0 <= index < len(self._items)):
+            raise IndexError("LazyList index out of range")
+
+        return self._get(index)
+
+    def __iter__(self):
+        for index in range(len(self._items)):
+            yield self._get(index)
+
+    def __setitem__(self, index: Union[int, slice], value):
+        self._materialize()[index] = value
+
+    def __delitem__(self, index: Union[int, slice]):
+        del self._materialize()[index]
+
+    def insert(self, index: int, value):
+        self._materialize().insert(index, value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+    def __reduce__(self):
+        # lxml elements cannot be pickled, so unpickle as a regular list
+        return list, (list(self),)
+
+
+def parse_elements(
+    xmls: Iterable[etree.ElementBase],
+    parse: Callable[[etree.ElementBase], ItemTy],
+    lazy: bool
+) -> List[ItemTy]:
+    """Parses the given lxml elements, either right away into a list
+    or on demand into a LazyList."""
+
+    if lazy:
+        return LazyList(list(xmls), parse)
+    else:
+        return [parse(xml) for xml in xmls]
@@ -2,7 +2,12 @@ from page.elements.element import Element
 from page.elements.coords import Baseline, Coordinates
 from page.elements.text import Text
 from page.elements.indexed import IndexedElement
+from page.elements.slots import add_slots
+from page.elements.children import group_children, first_child
 from page.elements.word import Word
+from page.elements.lazy import parse_elements
+from page.elements.options import ParseOptions, ParseDepth
+from page.elements.options import DEFAULT_PARSE_OPTIONS
 from page.exceptions import PageXMLError
 from page.constants import NsMap
 from lxml import etree
@@ -10,8 +15,14 @@ from typing import Iterable, List, Optional
 from dataclasses import dataclass, field
 
 
+@add_slots
 @dataclass
 class Line(Element):
+    _CHILD_TAGS = ("Coords", "Baseline", "Word", "TextEquiv")
+    _SHALLOW_CHILD_TAGS = ("Coords", "Baseline", "TextEquiv")
+
+    __slots__ = ("_content_hash",)
+
     line_id: str
     coords: Coordinates = field(repr=False)
     text: Optional[Text] = field(default=None)
@@ -19,29 +30,44 @@ class Line(Element):
     baseline: Optional[Baseline] = field(repr=False, default=None)
 
     @staticmethod
-    def from_element(line_xml: etree.ElementBase, nsmap: NsMap) -> "Line":
+    def from_element(
+        line_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> "Line":
         line_id = line_xml.get("id")
         if line_id is None:
             raise PageXMLError("TextLine is missing an id")
 
-        coords_xml = line_xml.find("./Coords", nsmap)
+        parse_words = options.depth >= ParseDepth.WORD
+        children = group_children(
+            line_xml, nsmap,
+            Line._CHILD_TAGS if parse_words else Line._SHALLOW_CHILD_TAGS
+        )
+
+        coords_xml = first_child(children, "Coords")
         if coords_xml is None:
             raise PageXMLError("TextLine is missing Coords")
 
-        coords: Coordinates = Coordinates.from_element(coords_xml, nsmap)
+        coords: Coordinates = Coordinates.from_element(
+            coords_xml, nsmap, options
+        )
 
-        baseline_xml = line_xml.find("./Baseline", nsmap)
+        baseline_xml = first_child(children, "Baseline")
         if baseline_xml is None:
             baseline = None
         else:
-            baseline = Baseline.from_element(baseline_xml, nsmap)
+            baseline = Baseline.from_element(baseline_xml, nsmap, options)
 
-        word_xmls = line_xml.findall("./Word", nsmap)
-        words: List[Word] = [
-            Word.from_element(word_xml, nsmap) for word_xml in word_xmls
-        ]
+        if parse_words:
+            words: List[Word] = parse_elements(
+                children["Word"],
+                lambda xml: Word.from_element(xml, nsmap, options),
+                options.lazy
+            )
+        else:
+            words = []
 
-        textequiv_xmls = line_xml.findall("./TextEquiv", nsmap)
+        textequiv_xmls = children["TextEquiv"]
         textequiv_count = len(textequiv_xmls)
 
         if textequiv_count == 0:
@@ -66,19 +92,28 @@ class Line(Element):
         if self.baseline is not None:
             line_xml.append(self.baseline.to_element(nsmap))
 
-        if self.text is not None:
-            line_xml.append(self.text.to_element(nsmap))
+        for word in self.words:
+            line_xml.append(word.to_element(nsmap))
+
+        for text in self._texts():
+            line_xml.append(text.to_element(nsmap))
 
         return line_xml
 
+    def _texts(self) -> List[Text]:
+        """Returns the texts which are written as TextEquiv elements."""
+        return [] if self.text is None else [self.text]
+
 
 class IndexedLine(Line, IndexedElement[int, Text]):
+    __slots__ = ("_index",)
+
     def __init__(
         self, line_id: str, coords: Coordinates,
         texts: List[Text], words: List[Word],
         baseline: Optional[Baseline]
     ):
-        IndexedElement.__init__(self, texts, lambda text: text.index)
+        IndexedElement.__init__(self, texts)
         Line.__init__(
             self, line_id, coords, text=self.get_from_index(0),
             baseline=baseline, words=words
@@ -87,10 +122,11 @@ class IndexedLine(Line, IndexedElement[int, Text]):
     def texts(self) -> Iterable[Text]:
         return self.objects()
 
-    def to_element(self, nsmap: NsMap) -> etree.ElementBase:
-        line_xml = super().to_element(nsmap)
-
-        for text in self.texts():
-            line_xml.append(text.to_element(nsmap))
+    def __reduce__(self):
+        return IndexedLine, (
+            self.line_id, self.coords, list(self.texts()), self.words,
+            self.baseline
+        )
 
-        return line_xml
+    def _texts(self) -> List[Text]:
+        return list(self.texts())
@@ -4,12 +4,31 @@ from dateutil import parser as dateparser
 from lxml import etree
 from page.exceptions import PageXMLError
 from page.elements.element import Element
+from page.elements.slots import add_slots
+from page.elements.children import group_children, first_child
 from page.constants import NsMap
 from dataclasses import dataclass
 
 
+def parse_datetime(text: str) -> datetime:
+    """Parses the date of a Created or LastChange element.
+
+    Almost all dates are written in the format of datetime.isoformat, which
+    datetime.fromisoformat parses much faster than dateutil. Other formats
+    (e.g. with a "Z" suffix before Python 3.11) fall back to dateutil.
+    """
+
+    try:
+        return datetime.fromisoformat(text.strip())
+    except ValueError:
+        return dateparser.parse(text)
+
+
+@add_slots
 @dataclass
 class Metadata(Element):
+    _CHILD_TAGS = ("Creator", "Created", "LastChange", "Comments")
+
     creator: str
     created: datetime
     last_change: datetime
@@ -17,16 +36,24 @@ class Metadata(Element):
 
     @staticmethod
     def from_element(metadata: etree.ElementBase, nsmap: NsMap) -> "Metadata":
-        creator_xml = metadata.find("./Creator", namespaces=nsmap)
-        created_xml = metadata.find("./Created", namespaces=nsmap)
-        last_change_xml = metadata.find("./LastChange", namespaces=nsmap)
-        comments_xml = metadata.find("./Comments", namespaces=nsmap)
+        children = group_children(metadata, nsmap, Metadata._CHILD_TAGS)
+        creator_xml = first_child(children, "Creator")
+        created_xml = first_child(children, "Created")
+        last_change_xml = first_child(children, "LastChange")
+        comments_xml = first_child(children, "Comments")
+
+        if any(
+            xml is None for xml in (creator_xml, created_xml, last_change_xml)
+        ):
+            raise PageXMLError(
+                "Metadata tag is missing Creator, Created or LastChange!"
+            )
 
         creator = creator_xml.text or ""
 
         try:
-            created = dateparser.parse(created_xml.text)
-            last_change = dateparser.parse(last_change_xml.text)
+            created = parse_datetime(created_xml.text or "")
+            last_change = parse_datetime(last_change_xml.text or "")
         except (ValueError, OverflowError):
             raise PageXMLError("Metadata tag contains invalid date(s)!")
 
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import AbstractSet, Callable, Iterable, Iterator, Mapping
+from typing import Optional, TYPE_CHECKING
+from lxml import etree
+
+if TYPE_CHECKING:
+    from page.elements.region import TextRegionType
+
+
+class ParseDepth(IntEnum):
+    """The deepest level of the element tree which should be parsed."""
+
+    REGION = 0
+    LINE = 1
+    WORD = 2
+    GLYPH = 3
+
+
+@dataclass(frozen=True)
+class ParseOptions:
+    """Options which control how a PAGE-XML document is parsed.
+
+    Attributes
+    ----------
+    lazy : bool
+        If True, Page.regions, TextRegion.lines, Line.words and Word.glyphs
+        are not parsed right away. Instead, they are backed by the lxml
+        elements of the document, and each of their items is parsed the
+        first time it is accessed. Note that this also defers any
+        PageXMLError of those items until they are accessed.
+    point_arrays : bool
+        If True, the points of all Coordinates and Baselines are stored
+        in (N, 2) int32 numpy arrays instead of lists of Points, which
+        is much more compact and faster to parse. Requires numpy.
+    depth : ParseDepth
+        Elements below this depth are skipped entirely, e.g. with
+        ParseDepth.LINE all TextRegion.lines are parsed, but every
+        Line.words is empty. By default, everything is parsed.
+    region_types : AbstractSet[TextRegionType], optional
+        If given, only regions of one of these types are parsed.
+    region_ids : AbstractSet[str], optional
+        If given, only regions with one of these ids are parsed.
+    region_filter : Callable[[Mapping[str, str]], bool], optional
+        If given, only regions for which this function returns True
+        are parsed. It is called with the raw attributes of the region
+        element, e.g. {"id": "r0", "type": "paragraph"}.
+
+    A region which is not selected by all of region_types, region_ids and
+    region_filter is skipped together with its lines, before any of them
+    is parsed. Selected regions nested in it take its place, e.g. in
+    Page.regions or in the children of its parent region.
+    """
+
+    lazy: bool = False
+    point_arrays: bool = False
+    depth: ParseDepth = ParseDepth.GLYPH
+    region_types: Optional[AbstractSet["TextRegionType"]] = None
+    region_ids: Optional[AbstractSet[str]] = None
+    region_filter: Optional[Callable[[Mapping[str, str]], bool]] = None
+
+    def selects_region(self, region_xml: etree.ElementBase) -> bool:
+        """Returns True if the given region element should be parsed."""
+
+        if self.region_ids is not None:
+            if region_xml.get("id") not in self.region_ids:
+                return False
+
+        if self.region_types is not None:
+            type_name = region_xml.get("type")
+            if not any(t.value == type_name for t in self.region_types):
+                return False
+
+        if self.region_filter is not None:
+            return bool(self.region_filter(region_xml.attrib))
+
+        return True
+
+    def selected_regions(
+        self, region_xmls: Iterable[etree.ElementBase]
+    ) -> Iterator[etree.ElementBase]:
+        """Yields the given region elements which should be parsed, where
+        a region which is not selected is replaced by its selected nested
+        regions (in document order)."""
+
+        for region_xml in region_xmls:
+            if self.selects_region(region_xml):
+                yield region_xml
+            else:
+                yield from self.selected_regions(
+                    region_xml.iterchildren("{*}TextRegion")
+                )
+
+
+DEFAULT_PARSE_OPTIONS = ParseOptions()
@@ -1,16 +1,119 @@
-from typing import Iterable, Tuple, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type
+from typing import Union
+from typing import TYPE_CHECKING
 from lxml import etree
 from page.elements.line import Line
+from page.elements.word import Word
+from page.elements.glyph import Glyph
 from page.elements.region import Region, TextRegion
+from page.elements.coords import compute_geometry
+from page.elements.geometry import BatchGeometry
 from page.elements.element import Element
+from page.elements.slots import add_slots
+from page.elements.content_hash import invalidate_content_hash
 from page.elements.reading_order import ReadingOrder
+from page.elements.lazy import LazyList, parse_elements
+from page.elements.children import group_children, first_child
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
 from page.constants import NsMap
 from page.exceptions import PageXMLError
 from dataclasses import dataclass, field
 
+if TYPE_CHECKING:
+    from page.columns import Columns
+    from page.spatial import SpatialIndex
 
+ElementTypes = Union[Type[Element], Tuple[Type[Element], ...]]
+
+
+def element_id(element: Element) -> Optional[str]:
+    """Returns the id of a region, line, word or glyph."""
+
+    if isinstance(element, Region):
+        return element.region_id
+    elif isinstance(element, Line):
+        return element.line_id
+    elif isinstance(element, Word):
+        return element.word_id
+    elif isinstance(element, Glyph):
+        return element.glyph_id
+    else:
+        raise TypeError(f"{type(element).__name__} has no id")
+
+
+# the attributes which hold the child elements of regions, lines and words
+_CHILD_ATTRIBUTES = ("children", "lines", "words", "glyphs")
+
+
+def _parsed(elements: List[Element]) -> Iterable[Element]:
+    # elements which have not been parsed yet have no caches
+    if isinstance(elements, LazyList):
+        return elements.parsed()
+    return elements
+
+
+def _invalidate_geometry(element: Element):
+    """Discards the cached geometry of the coordinates and the baseline of
+    an element and of all of its parsed descendants."""
+
+    element.coords.invalidate_geometry()
+
+    baseline = getattr(element, "baseline", None)
+    if baseline is not None:
+        baseline.invalidate_geometry()
+
+    for name in _CHILD_ATTRIBUTES:
+        for child in _parsed(getattr(element, name, ())):
+            _invalidate_geometry(child)
+
+
+class _IdIndex:
+    """Maps the ids of all elements of a page to the elements, and the
+    elements to their parents."""
+
+    __slots__ = ("by_id", "parents")
+
+    def __init__(self, elements: Iterable[Tuple[Element, Element]]):
+        self.by_id: Dict[str, Element] = {}
+        # elements are not hashable, they are identified by their id(),
+        # the element itself is kept to detect reused ids
+        self.parents: Dict[int, Tuple[Element, Element]] = {}
+
+        for element, parent in elements:
+            key = element_id(element)
+            if key is not None:
+                self.by_id.setdefault(key, element)
+
+            self.parents[id(element)] = element, parent
+
+
+class _ReadingPositions:
+    """The regions of a page in reading order and their positions."""
+
+    __slots__ = ("regions", "positions")
+
+    def __init__(self, regions: Iterable[Region]):
+        self.regions: Tuple[Region, ...] = ()
+        # keyed by id() like the parents of the _IdIndex
+        self.positions: Dict[int, Tuple[Region, int]] = {}
+        ordered: List[Region] = []
+
+        for region in regions:
+            if id(region) not in self.positions:
+                self.positions[id(region)] = region, len(ordered)
+                ordered.append(region)
+
+        self.regions = tuple(ordered)
+
+
+@add_slots
 @dataclass
 class Page(Element):
+    __slots__ = (
+        "_content_hash", "_id_index", "_reading_positions", "_spatial_index"
+    )
+    _CHILD_TAGS = ("ReadingOrder", "TextRegion")
+
     image_size: Tuple[int, int]
     image_filename: str
     reading_order: Optional[ReadingOrder] = field(repr=False)
@@ -18,33 +121,44 @@ class Page(Element):
 
     @staticmethod
     def from_element(
-        root_xml: etree.ElementBase, nsmap: NsMap
+        root_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
     ) -> "Page":
-        try:
-            width = int(root_xml.get("imageWidth"))
-            height = int(root_xml.get("imageHeight"))
-        except ValueError:
-            raise PageXMLError(
-                "invalid image width and/or height in Page element"
-            )
+        image_size, image_filename = Page.parse_attributes(root_xml)
 
-        image_filename = root_xml.get("imageFilename")
+        children = group_children(root_xml, nsmap, Page._CHILD_TAGS)
 
-        ro_xml = root_xml.find("./ReadingOrder", namespaces=nsmap)
+        ro_xml = first_child(children, "ReadingOrder")
         if ro_xml is None:
             reading_order = None
         else:
             reading_order = ReadingOrder.from_element(ro_xml, nsmap)
 
-        regions: List[Region] = []
+        # parse every direct child element which is a selected region
+        regions: List[Region] = parse_elements(
+            options.selected_regions(children["TextRegion"]),
+            lambda xml: Region.from_element(xml, nsmap, options),
+            options.lazy
+        )
 
-        for xml in root_xml.iterchildren():
-            # try to parse every direct child element as a region
-            region_xml: Optional[Region] = Region.try_from_element(xml, nsmap)
-            if region_xml is not None:
-                regions.append(region_xml)
+        return Page(image_size, image_filename, reading_order, regions)
 
-        return Page((width, height), image_filename, reading_order, regions)
+    @staticmethod
+    def parse_attributes(
+        root_xml: etree.ElementBase
+    ) -> Tuple[Tuple[int, int], str]:
+        """Returns the image size and file name of a Page element, which
+        only requires its start tag."""
+
+        try:
+            width = int(root_xml.get("imageWidth"))
+            height = int(root_xml.get("imageHeight"))
+        except (TypeError, ValueError):
+            raise PageXMLError(
+                "missing or invalid image width and/or height in Page element"
+            )
+
+        return (width, height), root_xml.get("imageFilename")
 
     def to_element(self, nsmap: NsMap) -> etree.ElementBase:
         root_xml = etree.Element("Page", nsmap=nsmap)
@@ -71,3 +185,223 @@ class Page(Element):
         return (
             line for region in self.text_regions() for line in region.lines
         )
+
+    def _walk(self) -> Iterable[Tuple[Element, Element]]:
+        """Yields all regions, lines, words and glyphs along with their
+        parents in document order."""
+
+        def walk_region(
+            region: Region, parent: Element
+        ) -> Iterable[Tuple[Element, Element]]:
+            yield region, parent
+
+            for child in region.children:
+                yield from walk_region(child, region)
+
+            if isinstance(region, TextRegion):
+                for line in region.lines:
+                    yield line, region
+
+                    for word in line.words:
+                        yield word, line
+
+                        for glyph in word.glyphs:
+                            yield glyph, word
+
+        for region in self.regions:
+            yield from walk_region(region, self)
+
+    def iter_elements(
+        self, types: Optional[ElementTypes] = None
+    ) -> Iterable[Element]:
+        """Yields all regions (including nested ones), lines, words and
+        glyphs of the page in document order, optionally only those of the
+        given types, e.g. page.iter_elements((Word, Glyph))."""
+
+        for element, _ in self._walk():
+            if types is None or isinstance(element, types):
+                yield element
+
+    def geometry(
+        self, types: Optional[ElementTypes] = None
+    ) -> Tuple[List[Element], BatchGeometry]:
+        """Computes the bounding boxes, areas and centroids of all elements
+        of the page (see iter_elements) in one vectorized pass. Requires
+        numpy.
+
+        Returns
+        -------
+        Tuple[List[page.elements.Element], BatchGeometry]
+            The elements and their geometry, row i of each array belongs to
+            element i. The results are also cached in the coordinates of
+            the elements, see page.elements.coords.compute_geometry.
+        """
+
+        elements = list(self.iter_elements(types))
+        return elements, compute_geometry([e.coords for e in elements])
+
+    def invalidate_indices(self):
+        """Discards the indices of the page (see get_by_id, ordered_regions
+        and spatial_index), which are rebuilt on their next use. They do not
+        notice changes of the page, so this is required after adding or
+        removing elements, changing their ids or coordinates, or changing
+        the reading order. The cached geometry of all coordinates and
+        baselines (see Coordinates.invalidate_geometry) and the cached
+        content hashes of the page and its elements (see
+        invalidate_content_hash) are discarded as well, so that elements
+        may also be changed in place."""
+
+        self._id_index = None
+        self._reading_positions = None
+        self._spatial_index = None
+        self._invalidate_geometry()
+        invalidate_content_hash(self)
+
+    def _invalidate_geometry(self):
+        for region in _parsed(self.regions):
+            _invalidate_geometry(region)
+
+    def _get_id_index(self) -> _IdIndex:
+        index = getattr(self, "_id_index", None)
+
+        if index is None:
+            index = _IdIndex(self._walk())
+            self._id_index = index
+
+        return index
+
+    def get_by_id(self, element_id: str) -> Optional[Element]:
+        """Returns the region, line, word or glyph with the given id, or
+        None if there is no such element. If several elements share an id,
+        the first one in document order is returned.
+
+        An index of all ids is built on first use, so that every lookup
+        takes constant time, see invalidate_indices.
+        """
+        return self._get_id_index().by_id.get(element_id)
+
+    def parent_of(self, element: Element) -> Optional[Element]:
+        """Returns the parent of a region, line, word or glyph of the page,
+        i.e. the page itself for top-level regions. Returns None if the
+        element is not part of the page. See get_by_id."""
+
+        entry = self._get_id_index().parents.get(id(element))
+
+        if entry is None or entry[0] is not element:
+            return None
+
+        return entry[1]
+
+    def _get_reading_positions(self) -> _ReadingPositions:
+        positions = getattr(self, "_reading_positions", None)
+
+        if positions is None:
+            if self.reading_order is None:
+                regions: Iterable[Region] = self.regions
+            else:
+                resolved = (
+                    self.get_by_id(ref.ref)
+                    for ref in self.reading_order.region_refs()
+                )
+                regions = (
+                    region for region in resolved
+                    if isinstance(region, Region)
+                )
+
+            positions = _ReadingPositions(regions)
+            self._reading_positions = positions
+
+        return positions
+
+    def ordered_regions(self) -> Sequence[Region]:
+        """Returns the regions in reading order.
+
+        The region references of the reading order are flattened, with the
+        children of ordered groups sorted by their indices, and resolved
+        to the regions of the page. References to regions which are not
+        part of the page (e.g. because they were not selected by the
+        ParseOptions) are skipped, as are repeated references. Without a
+        reading order, the top-level regions are returned in document
+        order.
+
+        The result is computed once and then kept with the page, see
+        invalidate_indices.
+        """
+        return self._get_reading_positions().regions
+
+    def reading_position(self, region: Region) -> Optional[int]:
+        """Returns the position of a region in ordered_regions, or None if
+        the region is not part of the reading order."""
+
+        entry = self._get_reading_positions().positions.get(id(region))
+
+        if entry is None or entry[0] is not region:
+            return None
+
+        return entry[1]
+
+    def infer_reading_order(
+        self, min_gap: float = 0
+    ) -> Optional[ReadingOrder]:
+        """Infers a reading order from the positions of the top-level
+        regions, see page.ordering.infer_reading_order. Returns None if no
+        region has an id. The result is not assigned to the page, in order
+        to keep it::
+
+            page.reading_order = page.infer_reading_order()
+            page.invalidate_indices()
+        """
+
+        from page.ordering import infer_reading_order
+        return infer_reading_order(self, min_gap)
+
+    def to_columns(
+        self, element_type: Type[Element] = Line, key: str = ""
+    ) -> "Columns":
+        """Exports all lines, words or glyphs (element_type) of the page
+        into numpy arrays, see page.columns. Requires numpy."""
+
+        from page.columns import page_columns
+        return page_columns(self, element_type, key)
+
+    def spatial_index(self) -> "SpatialIndex":
+        """Returns a spatial index over all regions, lines, words and glyphs
+        of the page, see page.spatial.
+
+        The index is built on first use and then kept with the page, see
+        invalidate_indices.
+        """
+
+        index = getattr(self, "_spatial_index", None)
+
+        if index is None:
+            from page.spatial import SpatialIndex
+            index = SpatialIndex.from_page(self)
+            self._spatial_index = index
+
+        return index
+
+    def query_bbox(
+        self, bbox: Sequence[float], types: Optional[ElementTypes] = None,
+        exact: bool = True
+    ) -> List[Element]:
+        """Returns the elements of the page which intersect the rectangle
+        (min x, min y, max x, max y), optionally only those of the given
+        types, e.g. page.query_bbox((0, 0, 100, 50), Line). See
+        SpatialIndex.query_bbox."""
+        return self.spatial_index().query_bbox(bbox, types, exact)
+
+    def query_point(
+        self, x: float, y: float, types: Optional[ElementTypes] = None
+    ) -> List[Element]:
+        """Returns the elements of the page whose polygons contain the
+        point, optionally only those of the given types."""
+        return self.spatial_index().query_point(x, y, types)
+
+    def nearest(
+        self, x: float, y: float, k: int = 1,
+        types: Optional[ElementTypes] = None
+    ) -> List[Tuple[Element, float]]:
+        """Returns the k elements of the page closest to the point, with
+        their distances, see SpatialIndex.nearest."""
+        return self.spatial_index().nearest(x, y, k, types)
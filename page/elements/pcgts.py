@@ -1,36 +1,55 @@
-from typing import Optional, TextIO
+from typing import BinaryIO, Iterable, Iterator, Optional, TextIO
+from typing import TYPE_CHECKING
+from concurrent.futures import Executor
 from page.elements.metadata import Metadata
 from page.elements.page import Page
 from page.elements.element import Element
+from page.elements.slots import add_slots
+from page.elements.children import group_children, first_child
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
 from page.exceptions import PageXMLError
+from page.compression import open_source, open_output
 from page.constants import NsMap, DEFAULT_NAMESPACE_MAP
 from lxml import etree
 from dataclasses import dataclass
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from asyncio import Semaphore
+    from page.parallel import LoadResult
+    from page.stream import PageHeader
 
+
+@add_slots
 @dataclass
 class PcGts(Element):
+    _CHILD_TAGS = ("Metadata", "Page")
+
     pc_gts_id: Optional[str]
     metadata: Metadata
     page: Page
 
     @staticmethod
-    def from_element(pcgts_xml: etree.ElementBase, nsmap: NsMap) -> "PcGts":
+    def from_element(
+        pcgts_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> "PcGts":
         pc_gts_id = pcgts_xml.get("pcGtsId")
 
-        metadata_xml = pcgts_xml.find("./Metadata", namespaces=nsmap)
+        children = group_children(pcgts_xml, nsmap, PcGts._CHILD_TAGS)
+
+        metadata_xml = first_child(children, "Metadata")
         if metadata_xml is None:
             raise PageXMLError("PcGts tag is missing Metadata tag")
 
-        page_xml = pcgts_xml.find("./Page", namespaces=nsmap)
+        page_xml = first_child(children, "Page")
         if page_xml is None:
             raise PageXMLError("PcGts tag does not contain a Page")
 
         return PcGts(
             pc_gts_id,
             Metadata.from_element(metadata_xml, nsmap),
-            Page.from_element(page_xml, nsmap)
+            Page.from_element(page_xml, nsmap, options)
         )
 
     def to_element(self, nsmap: NsMap) -> etree.ElementBase:
@@ -43,8 +62,18 @@ class PcGts(Element):
         return pcgts_xml
 
     @staticmethod
-    def from_file(file: TextIO) -> Optional["PcGts"]:
-        tree = etree.parse(file)
+    def from_file(
+        file: TextIO, options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> Optional["PcGts"]:
+        """Parses a pagecontent file, returning None if the file is not
+        a pagecontent file. See ParseOptions for ways to customize parsing,
+        e.g. ParseOptions(lazy=True) to parse regions, lines, words and
+        glyphs on demand only. Files compressed with gzip, bz2 or xz are
+        decompressed while parsing."""
+
+        with open_source(file) as source:
+            tree = etree.parse(source)
+
         root_xml = tree.getroot()
         root_tag: str = etree.QName(root_xml.tag).localname
 
@@ -52,11 +81,208 @@ class PcGts(Element):
             # this is not a pagecontent file
             return None
 
-        return PcGts.from_element(root_xml, root_xml.nsmap)
+        return PcGts.from_element(root_xml, root_xml.nsmap, options)
+
+    @staticmethod
+    def scan_header(file: TextIO) -> Optional["PageHeader"]:
+        """Reads only the pcGtsId, the Metadata and the attributes of the
+        Page element of a pagecontent file, stopping at the start tag of
+        the Page element. Returns None if the file is not a pagecontent
+        file. See page.stream.scan_header."""
+
+        # page.stream and the other modules imported below import this
+        # module
+        from page.stream import scan_header
+        return scan_header(file)
+
+    def to_binary(self) -> bytes:
+        """Serializes the document into the compact binary format of
+        page.binary, which is much faster to load than PAGE-XML. The
+        format is meant for caching and is tied to the library version."""
+
+        from page.binary import to_binary
+        return to_binary(self)
+
+    @staticmethod
+    def from_binary(data: bytes, point_arrays: bool = False) -> "PcGts":
+        """Deserializes a document written by to_binary.
+
+        Parameters
+        ----------
+        data : bytes
+            The binary blob.
+        point_arrays : bool
+            If True, all coordinates are returned as numpy arrays, like
+            with ParseOptions(point_arrays=True).
+
+        Raises
+        ------
+        PageXMLError
+            If the blob is corrupt or of another version of the format.
+        """
+
+        from page.binary import from_binary
+        return from_binary(data, point_arrays)
+
+    @staticmethod
+    def from_file_cached(
+        path: Path, cache_dir: Optional[Path] = None,
+        point_arrays: Optional[bool] = None
+    ) -> Optional["PcGts"]:
+        """Parses a pagecontent file like from_file, but keeps a binary
+        copy (see to_binary) of the document in a cache file, which is
+        loaded instead as long as the file is not modified.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file to load.
+        cache_dir : str or os.PathLike, optional
+            The directory of the cache files. By default, the cache file is
+            stored next to the source file, with an additional ".pgbin"
+            suffix.
+        point_arrays : bool, optional
+            See from_binary. By default, point arrays are used if numpy
+            is installed, since creating a Point object for every point
+            takes most of the time of loading a cached document.
+        """
+
+        from page.cache import load
+        return load(path, cache_dir, point_arrays)
+
+    @staticmethod
+    def load_many(
+        paths: Iterable[Path], workers: Optional[int] = None,
+        chunksize: int = 16, ordered: bool = True,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> Iterator["LoadResult"]:
+        """Loads many PAGE-XML files in parallel using a process pool.
+
+        Parameters
+        ----------
+        paths : Iterable[str or os.PathLike]
+            The files to load. The iterable is consumed lazily, so it may
+            be a generator over a huge corpus.
+        workers : int, optional
+            The number of worker processes, by default one per CPU.
+            With 0 workers, all files are loaded in the current process.
+        chunksize : int
+            The number of files which are sent to a worker at once.
+        ordered : bool
+            If True, the results are yielded in the order of paths,
+            otherwise in the order in which the chunks are completed.
+        options : page.elements.ParseOptions
+            The options for parsing every file, which must be picklable.
+
+        Returns
+        -------
+        Iterator[page.parallel.LoadResult]
+            One result per path. Errors of single files (PageXMLError,
+            lxml.etree.XMLSyntaxError, OSError) are reported in the error
+            attribute of their result and do not abort the batch.
+        """
+
+        from page.parallel import load_many
+        return load_many(paths, workers, chunksize, ordered, options)
+
+    @staticmethod
+    async def aload(
+        path: Path, options: ParseOptions = DEFAULT_PARSE_OPTIONS,
+        executor: Optional[Executor] = None,
+        limit: Optional["Semaphore"] = None,
+        chunk_size: int = 1 << 16
+    ) -> Optional["PcGts"]:
+        """Loads a pagecontent file like from_file, without blocking the
+        event loop of asyncio.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file to load. It is read asynchronously in chunks, which
+            are parsed as they arrive (see page.aio).
+        options : page.elements.ParseOptions
+            See from_file. Must be picklable if executor is a process pool.
+        executor : concurrent.futures.Executor, optional
+            The executor in which the elements are built from the XML
+            tree, by default the default executor of the event loop. The
+            XML itself is parsed in a separate thread while the file is
+            read. A ProcessPoolExecutor instead receives the whole file
+            and also parses it, which allows loading on multiple cores.
+        limit : asyncio.Semaphore, optional
+            If given, the file is only loaded while holding the semaphore.
+            Sharing a semaphore between calls limits the number of documents
+            which are in memory at the same time.
+        chunk_size : int
+            The number of bytes which are read (and fed to the parser) at
+            once.
+        """
+
+        from page.aio import load
+        return await load(path, options, executor, limit, chunk_size)
+
+    async def asave(
+        self, path: Path, nsmap: NsMap = DEFAULT_NAMESPACE_MAP,
+        executor: Optional[Executor] = None,
+        limit: Optional["Semaphore"] = None,
+        compresslevel: Optional[int] = None
+    ):
+        """Saves the document like save_to_file, without blocking the event
+        loop of asyncio. See aload for executor and limit."""
+
+        from page.aio import save
+        await save(
+            self, path, nsmap, executor, limit, compresslevel=compresslevel
+        )
+
+    def to_bytes(
+        self, nsmap: NsMap = DEFAULT_NAMESPACE_MAP, pretty_print: bool = True
+    ) -> bytes:
+        """Serializes the document into PAGE-XML.
+
+        The XML is written directly from the elements (see page.serialize),
+        which is faster than, but results in the same bytes as, serializing
+        the element tree of to_element with lxml.etree.tostring.
+        """
+
+        from page.serialize import to_bytes
+        return to_bytes(self, nsmap, pretty_print)
+
+    def write(
+        self, file: BinaryIO, nsmap: NsMap = DEFAULT_NAMESPACE_MAP,
+        pretty_print: bool = True
+    ):
+        """Writes the document as PAGE-XML to a binary file object.
+
+        In contrast to to_bytes, the document is written region by region,
+        without building the element tree of the whole document first.
+        See page.writer.PcGtsWriter for writing regions as they are
+        produced.
+
+        Parameters
+        ----------
+        file : binary file object
+            The file to write to.
+        nsmap : NsMap
+            The namespace map of the document.
+        pretty_print : bool
+            If True, the elements are indented like with to_bytes,
+            otherwise the document is written without any whitespace
+            between elements.
+        """
+
+        from page.writer import write_pcgts
+        write_pcgts(file, self, nsmap, pretty_print)
+
+    def save_to_file(
+        self, path: Path, nsmap: NsMap = DEFAULT_NAMESPACE_MAP,
+        pretty_print: bool = True, compresslevel: Optional[int] = None
+    ):
+        """Saves the document to a PAGE-XML file, see write.
 
-    def save_to_file(self, path: Path, nsmap: NsMap = DEFAULT_NAMESPACE_MAP):
-        root_xml = self.to_element(nsmap)
-        encoded_xml = etree.tostring(root_xml, pretty_print=True)
+        If the file name ends with .gz, .bz2 or .xz, the file is compressed
+        accordingly while it is written. See page.compression.open_output
+        for the compression levels.
+        """
 
-        with path.open("wb") as file:
-            file.write(encoded_xml)
+        with open_output(path, compresslevel) as file:
+            self.write(file, nsmap, pretty_print)
@@ -1,8 +1,16 @@
-from typing import List
+import re
+from typing import List, Union
 from dataclasses import dataclass
 from page.exceptions import PageXMLError
+from page.elements.slots import add_slots
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
 
+
+@add_slots
 @dataclass(repr=False, order=True)
 class Point:
     x: int
@@ -47,5 +55,66 @@ def parse_points(points_str: str) -> List[Point]:
     return points
 
 
-def points_to_string(points: List[Point]) -> str:
+# Point strings that can be handed to numpy without further checks.
+# At most 9 digits per coordinate guarantee that they fit into an int32.
+_SIMPLE_POINTS_RE = re.compile(
+    r"-?[0-9]{1,9},-?[0-9]{1,9}(?: -?[0-9]{1,9},-?[0-9]{1,9})+"
+)
+_INT32_MIN, _INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "numpy is required for point arrays, install page-py[numpy]"
+        )
+
+
+def parse_points_array(points_str: str) -> "np.ndarray":
+    """Parses a points string like parse_points, but into an (N, 2) int32
+    numpy array of x and y coordinates instead of a list of Points."""
+
+    _require_numpy()
+
+    if _SIMPLE_POINTS_RE.fullmatch(points_str) is None:
+        # let parse_points produce the appropriate error, or handle
+        # the rare cases like huge coordinates or a leading "+"
+        points = parse_points(points_str)
+
+        if any(
+            not (_INT32_MIN <= c <= _INT32_MAX)
+            for p in points for c in (p.x, p.y)
+        ):
+            raise PageXMLError(
+                f"coordinates in points string {points_str} exceed int32"
+            )
+
+        return points_to_array(points)
+
+    return np.fromstring(
+        points_str.replace(",", " "), dtype=np.int32, sep=" "
+    ).reshape(-1, 2)
+
+
+def points_to_array(points: List[Point]) -> "np.ndarray":
+    """Converts a list of Points into an (N, 2) int32 numpy array."""
+
+    _require_numpy()
+    return np.array(
+        [(p.x, p.y) for p in points], dtype=np.int32
+    ).reshape(-1, 2)
+
+
+def array_to_points(array: "np.ndarray") -> List[Point]:
+    """Converts an (N, 2) numpy array into a list of Points."""
+    return [Point(x, y) for x, y in array.tolist()]
+
+
+def points_to_string(points: Union[List[Point], "np.ndarray"]) -> str:
+    if np is not None and isinstance(points, np.ndarray):
+        # all coordinates are formatted by a single format operation
+        # instead of one f-string per point
+        template = ('%d,%d ' * len(points))[:-1]
+        return template % tuple(points.ravel().tolist())
+
     return ' '.join([f'{p.x},{p.y}' for p in points])
@@ -1,7 +1,10 @@
 from page.constants import NsMap
 from page.exceptions import PageXMLError
 from page.elements.element import Element
+from page.elements.slots import add_slots
+from page.elements.children import group_children, first_child
 from page.elements.reading_order.group import Group, GroupIndexed
+from page.elements.region_ref import RegionRef
 from page.elements.reading_order.unordered_group import (
     UnorderedGroup, UnorderedGroupIndexed
 )
@@ -10,20 +13,24 @@ from page.elements.reading_order.ordered_group import (
 )
 
 from dataclasses import dataclass
-from typing import Union
+from typing import Iterable, Union
 from lxml import etree
 
 
+@add_slots
 @dataclass
 class ReadingOrder(Element):
+    _CHILD_TAGS = ("OrderedGroup", "UnorderedGroup")
+
     root: Union[OrderedGroup, UnorderedGroup]
 
     @staticmethod
     def from_element(
         ro_xml: etree.ElementBase, nsmap: NsMap
     ) -> "ReadingOrder":
-        og_xml = ro_xml.find("./OrderedGroup", namespaces=nsmap)
-        ug_xml = ro_xml.find("./UnorderedGroup", namespaces=nsmap)
+        children = group_children(ro_xml, nsmap, ReadingOrder._CHILD_TAGS)
+        og_xml = first_child(children, "OrderedGroup")
+        ug_xml = first_child(children, "UnorderedGroup")
 
         if og_xml is not None:
             return ReadingOrder(OrderedGroup.from_element(og_xml, nsmap))
@@ -32,6 +39,11 @@ class ReadingOrder(Element):
         else:
             raise PageXMLError("ReadingOrder does not contain a group")
 
+    def region_refs(self) -> Iterable[RegionRef]:
+        """Yields all region references in reading order, i.e. the children
+        of ordered groups sorted by their indices."""
+        return self.root.iter_region_refs()
+
     def to_element(self, nsmap: NsMap) -> etree.ElementBase:
         ro_xml = etree.Element("ReadingOrder", nsmap=nsmap)
         ro_xml.append(self.root.to_element(nsmap))
@@ -47,6 +47,21 @@ class Group(Element, ABC):
             self.children
         )
 
+    def ordered_children(self) -> List[Union["Group", RegionRef]]:
+        """Returns the children in reading order. The children of unordered
+        groups are returned in the order in which they are stored."""
+        return list(self.children)
+
+    def iter_region_refs(self) -> Iterable[RegionRef]:
+        """Yields the region references of this group and all of its
+        subgroups in reading order, see ordered_children."""
+
+        for child in self.ordered_children():
+            if isinstance(child, Group):
+                yield from child.iter_region_refs()
+            else:
+                yield child
+
 
 @dataclass
 class GroupIndexed(Group, Element, ABC):
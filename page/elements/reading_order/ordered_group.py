@@ -4,6 +4,7 @@ from lxml import etree
 from page.elements.indexed import IndexedElement
 from page.elements.reading_order.group import Group, GroupIndexed
 from page.elements.region_ref import RegionRefIndexed
+from page.elements.children import group_children
 from page.constants import NsMap
 from page.exceptions import PageXMLError
 import page.elements.reading_order.unordered_group as ug
@@ -12,14 +13,16 @@ import page.elements.reading_order.unordered_group as ug
 class OrderedGroup(
     Group, IndexedElement[int, Union[GroupIndexed, RegionRefIndexed]]
 ):
+    _CHILD_TAGS = (
+        "OrderedGroupIndexed", "UnorderedGroupIndexed", "RegionRefIndexed"
+    )
+
     def __init__(
         self, group_id: str,
         children: List[Union[GroupIndexed, RegionRefIndexed]],
         caption: Optional[str] = None
     ):
-        IndexedElement.__init__(
-            self, children, lambda group_or_ref: group_or_ref.index
-        )
+        IndexedElement.__init__(self, children)
         Group.__init__(self, group_id, children, caption)
 
     @staticmethod
@@ -29,21 +32,19 @@ class OrderedGroup(
         group_id, caption = Group._from_element(group_xml, "OrderedGroup")
         children: List[Union[GroupIndexed, RegionRefIndexed]] = []
 
-        for ogi_xml in group_xml.findall(
-            "./OrderedGroupIndexed", namespaces=nsmap
-        ):
+        child_xmls = group_children(
+            group_xml, nsmap, OrderedGroup._CHILD_TAGS
+        )
+
+        for ogi_xml in child_xmls["OrderedGroupIndexed"]:
             children.append(OrderedGroupIndexed.from_element(ogi_xml, nsmap))
 
-        for ugi_xml in group_xml.findall(
-            "./UnorderedGroupIndexed", namespaces=nsmap
-        ):
+        for ugi_xml in child_xmls["UnorderedGroupIndexed"]:
             children.append(
                 ug.UnorderedGroupIndexed.from_element(ugi_xml, nsmap)
             )
 
-        for rri_xml in group_xml.findall(
-            "./RegionRefIndexed", namespaces=nsmap
-        ):
+        for rri_xml in child_xmls["RegionRefIndexed"]:
             children.append(RegionRefIndexed.from_element(rri_xml, nsmap))
 
         return OrderedGroup(group_id, children, caption)
@@ -64,6 +65,10 @@ class OrderedGroup(
     def subgroups(self) -> Iterable[GroupIndexed]:
         return super().subgroups()
 
+    def ordered_children(self) -> List[Union[GroupIndexed, RegionRefIndexed]]:
+        # stable, children with equal indices keep their order
+        return sorted(self.children, key=self.index_from_obj)
+
 
 class OrderedGroupIndexed(OrderedGroup, GroupIndexed):
     def __init__(
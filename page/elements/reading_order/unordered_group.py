@@ -3,12 +3,15 @@ from lxml import etree
 
 from page.elements.region_ref import RegionRef
 from page.elements.reading_order.group import Group, GroupIndexed
+from page.elements.children import group_children
 from page.constants import NsMap
 from page.exceptions import PageXMLError
 import page.elements.reading_order.ordered_group as og
 
 
 class UnorderedGroup(Group):
+    _CHILD_TAGS = ("OrderedGroup", "UnorderedGroup", "RegionRef")
+
     def __init__(
         self, group_id: str, children: List[Union[Group, RegionRef]],
         caption: Optional[str] = None
@@ -22,13 +25,17 @@ class UnorderedGroup(Group):
         group_id, caption = Group._from_element(group_xml, "UnorderedGroup")
         children: List[Union[Group, RegionRef]] = []
 
-        for og_xml in group_xml.findall("./OrderedGroup", namespaces=nsmap):
+        child_xmls = group_children(
+            group_xml, nsmap, UnorderedGroup._CHILD_TAGS
+        )
+
+        for og_xml in child_xmls["OrderedGroup"]:
             children.append(og.OrderedGroup.from_element(og_xml, nsmap))
 
-        for ug_xml in group_xml.findall("./UnorderedGroup", namespaces=nsmap):
+        for ug_xml in child_xmls["UnorderedGroup"]:
             children.append(UnorderedGroup.from_element(ug_xml, nsmap))
 
-        for rr_xml in group_xml.findall("./RegionRef", namespaces=nsmap):
+        for rr_xml in child_xmls["RegionRef"]:
             children.append(RegionRef.from_element(rr_xml, nsmap))
 
         return UnorderedGroup(group_id, children, caption)
@@ -1,52 +1,56 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import Enum
 from page.elements.element import Element
 from page.elements.coords import Coordinates
 from page.elements.line import Line
+from page.elements.slots import add_slots
+from page.elements.lazy import parse_elements
+from page.elements.children import Children, group_children, first_child
+from page.elements.options import ParseOptions, ParseDepth
+from page.elements.options import DEFAULT_PARSE_OPTIONS
 from page.constants import NsMap
 from page.exceptions import PageXMLError
 from lxml import etree
 from dataclasses import dataclass, field
 
 
+@add_slots
 @dataclass
 class Region(Element, ABC):
+    __slots__ = ("_content_hash",)
+
     region_id: str
     coords: Coordinates = field(repr=False)
     children: List["Region"] = field(repr=False)
 
     @staticmethod
     def _parse_region(
-        region_xml: etree.ElementBase, nsmap: NsMap
+        region_xml: etree.ElementBase, nsmap: NsMap, options: ParseOptions,
+        children: Children
     ) -> Tuple[str, Coordinates, List["Region"]]:
         region_id = region_xml.get("id")
 
-        coords_xml = region_xml.find("./Coords", nsmap)
+        coords_xml = first_child(children, "Coords")
         if coords_xml is None:
             raise PageXMLError("region is missing coordinates")
 
-        coords = Coordinates.from_element(coords_xml, nsmap)
-        child_regions = []
-
-        for child_xml in region_xml.iterchildren():
-            if child_xml.tag.endswith("Region"):
-                # try to parse this region
-                region: Optional[Region] = Region.try_from_element(
-                    child_xml, nsmap
-                )
-
-                if region is not None:
-                    child_regions.append(region)
+        coords = Coordinates.from_element(coords_xml, nsmap, options)
+        child_regions = [
+            Region.from_element(child_xml, nsmap, options)
+            for child_xml in options.selected_regions(children["TextRegion"])
+        ]
 
         return region_id, coords, child_regions
 
+    def _attrib(self) -> Dict[str, str]:
+        """Returns the attributes of the region element."""
+        return {} if self.region_id is None else {"id": self.region_id}
+
     def _create_region_base_element(
         self, tag: str, nsmap: NsMap
     ) -> etree.ElementBase:
-        region_xml = etree.Element(
-            tag, attrib={"id": self.region_id}, nsmap=nsmap
-        )
+        region_xml = etree.Element(tag, attrib=self._attrib(), nsmap=nsmap)
         region_xml.append(self.coords.to_element(nsmap))
 
         for child in self.children:
@@ -55,20 +59,33 @@ class Region(Element, ABC):
         return region_xml
 
     @staticmethod
-    def try_from_element(
-        region_xml: etree.ElementBase, nsmap: NsMap
-    ) -> Optional["Region"]:
-        region_tag: str = etree.QName(region_xml.tag).localname
+    def is_region_element(region_xml: etree.ElementBase) -> bool:
+        """Returns True if try_from_element would parse the given element
+        into a region instead of returning None."""
+
+        if not isinstance(region_xml.tag, str):
+            # comments and processing instructions
+            return False
 
         # TODO: Implement other region tags
-        if region_tag == "TextRegion":
-            return TextRegion.from_element(region_xml, nsmap)
+        return etree.QName(region_xml.tag).localname == "TextRegion"
+
+    @staticmethod
+    def try_from_element(
+        region_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> Optional["Region"]:
+        if Region.is_region_element(region_xml):
+            return TextRegion.from_element(region_xml, nsmap, options)
         else:
             return None
 
     @staticmethod
-    def from_element(region_xml: etree.ElementBase, nsmap: NsMap) -> "Region":
-        region = Region.try_from_element(region_xml, nsmap)
+    def from_element(
+        region_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> "Region":
+        region = Region.try_from_element(region_xml, nsmap, options)
         if region is None:
             raise PageXMLError(f"Tag {region_xml.tag} is not a region tag")
         return region
@@ -98,15 +115,20 @@ class TextRegionType(Enum):
     OTHER = "other"
 
 
+@add_slots
 @dataclass
 class TextRegion(Region):
+    _CHILD_TAGS = ("Coords", "TextRegion", "TextLine")
+    _SHALLOW_CHILD_TAGS = ("Coords", "TextRegion")
+
     region_type: Optional[TextRegionType]
     lines: List[Line] = field(repr=False)
     # TODO: TextRegion can contain its own TextEquiv (and TextStyle)
 
     @staticmethod
     def from_element(
-        region_xml: etree.ElementBase, nsmap: NsMap
+        region_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
     ) -> "TextRegion":
         region_type_name = region_xml.get("type")
 
@@ -120,15 +142,35 @@ class TextRegion(Region):
                     f"region has invalid type '{region_type_name}'"
                 )
 
-        region_id, coords, children = Region._parse_region(region_xml, nsmap)
+        parse_lines = options.depth >= ParseDepth.LINE
+        child_xmls = group_children(
+            region_xml, nsmap,
+            TextRegion._CHILD_TAGS if parse_lines
+            else TextRegion._SHALLOW_CHILD_TAGS
+        )
+        region_id, coords, children = Region._parse_region(
+            region_xml, nsmap, options, child_xmls
+        )
 
-        line_xmls = region_xml.findall("./TextLine", nsmap)
-        lines: List[Line] = [
-            Line.from_element(line_xml, nsmap) for line_xml in line_xmls
-        ]
+        if parse_lines:
+            lines: List[Line] = parse_elements(
+                child_xmls["TextLine"],
+                lambda xml: Line.from_element(xml, nsmap, options),
+                options.lazy
+            )
+        else:
+            lines = []
 
         return TextRegion(region_id, coords, children, region_type, lines)
 
+    def _attrib(self) -> Dict[str, str]:
+        attrib = super()._attrib()
+
+        if self.region_type is not None:
+            attrib["type"] = self.region_type.value
+
+        return attrib
+
     def to_element(self, nsmap: NsMap) -> etree.ElementBase:
         region_xml = self._create_region_base_element("TextRegion", nsmap)
 
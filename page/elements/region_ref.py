@@ -2,10 +2,12 @@ from dataclasses import dataclass
 from lxml import etree
 
 from page.elements import Element
+from page.elements.slots import add_slots
 from page.constants import NsMap
 from page.exceptions import PageXMLError
 
 
+@add_slots
 @dataclass
 class RegionRef(Element):
     ref: str
@@ -26,6 +28,7 @@ class RegionRef(Element):
         return ref_xml
 
 
+@add_slots
 @dataclass
 class RegionRefIndexed(RegionRef):
     index: int
@@ -0,0 +1,83 @@
+from dataclasses import fields
+from typing import Iterable, Type, TypeVar
+
+ClassTy = TypeVar("ClassTy", bound=type)
+
+
+def add_slots(cls: ClassTy) -> ClassTy:
+    """Recreates a dataclass with __slots__ for all of its fields, similar
+    to dataclass(slots=True) which is only available since Python 3.10.
+
+    Must be applied on top of the @dataclass decorator. Slots which are not
+    dataclass fields (e.g. for cached values) can be declared as usual with
+    __slots__ in the class body. Fields which are already slots of a base
+    class are not declared again. To avoid a per-instance __dict__, every
+    base class must define __slots__ as well.
+
+    Unless the class defines its own __reduce__, instances are pickled as
+    a call to their class with all field values as positional arguments.
+    This is much more compact than pickling every slot by name, but it
+    requires subclasses with a different __init__ to override __reduce__.
+    """
+
+    cls_dict = dict(cls.__dict__)
+    own_slots = tuple(cls_dict.get("__slots__", ()))
+    inherited_slots = {
+        slot
+        for base in cls.__mro__[1:]
+        for slot in base.__dict__.get("__slots__", ())
+    }
+
+    field_slots = tuple(
+        f.name for f in fields(cls)
+        if f.name not in inherited_slots and f.name not in own_slots
+    )
+    cls_dict["__slots__"] = own_slots + field_slots
+
+    for name in cls_dict["__slots__"]:
+        # default values (and the slot descriptors of the original class)
+        # would conflict with the new slot descriptors, the generated
+        # __init__ keeps track of the default values on its own
+        cls_dict.pop(name, None)
+
+    # these are recreated by type (or ABCMeta) for the new class
+    for name in ["__dict__", "__weakref__", "__abstractmethods__"]:
+        cls_dict.pop(name, None)
+
+    cls_dict.pop("_abc_impl", None)
+
+    if "__reduce__" not in cls_dict:
+        init_fields = tuple(f.name for f in fields(cls) if f.init)
+
+        def __reduce__(self):
+            return self.__class__, tuple(
+                getattr(self, name) for name in init_fields
+            )
+
+        cls_dict["__reduce__"] = __reduce__
+
+    slotted_cls: Type = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    _replace_class_cells(cls_dict.values(), cls, slotted_cls)
+    return slotted_cls
+
+
+def _replace_class_cells(values: Iterable, old_cls: type, new_cls: type):
+    # methods using a zero-argument super() refer to the original class
+    # through their __class__ cell, point them to the new class instead
+    for value in values:
+        if isinstance(value, property):
+            functions = [value.fget, value.fset, value.fdel]
+        else:
+            functions = [getattr(value, "__func__", value)]
+
+        for function in functions:
+            for cell in getattr(function, "__closure__", None) or ():
+                try:
+                    contents = cell.cell_contents
+                except ValueError:  # empty cell
+                    continue
+
+                if contents is old_cls:
+                    cell.cell_contents = new_cls
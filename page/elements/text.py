@@ -2,12 +2,19 @@ from dataclasses import dataclass, field
 from typing import Optional
 from page.exceptions import PageXMLError
 from page.elements import Element
+from page.elements.slots import add_slots
+from page.elements.children import group_children, first_child
 from page.constants import NsMap
 from lxml import etree
 
 
+@add_slots
 @dataclass
 class Text(Element):
+    _CHILD_TAGS = ("PlainText", "Unicode")
+
+    __slots__ = ("_content_hash",)
+
     index: Optional[int]
     unicode: str
     plain_text: Optional[str] = field(default=None)
@@ -37,8 +44,9 @@ class Text(Element):
                     f"confidence {conf} is not between 0 and 1"
                 )
 
-        plaintext_xml = textequiv_xml.find("./PlainText", nsmap)
-        unicode_xml = textequiv_xml.find("./Unicode", nsmap)
+        children = group_children(textequiv_xml, nsmap, Text._CHILD_TAGS)
+        plaintext_xml = first_child(children, "PlainText")
+        unicode_xml = first_child(children, "Unicode")
 
         index = textequiv_xml.get("index")
 
@@ -1,8 +1,13 @@
 from page.elements.element import Element
 from page.elements.coords import Coordinates
 from page.elements.indexed import IndexedElement
+from page.elements.slots import add_slots
+from page.elements.children import group_children, first_child
 from page.elements.glyph import Glyph
 from page.elements.text import Text
+from page.elements.lazy import parse_elements
+from page.elements.options import ParseOptions, ParseDepth
+from page.elements.options import DEFAULT_PARSE_OPTIONS
 from page.constants import NsMap
 from page.exceptions import PageXMLError
 from typing import Iterable, List, Optional
@@ -10,29 +15,50 @@ from lxml import etree
 from dataclasses import dataclass
 
 
+@add_slots
 @dataclass
 class Word(Element):
+    _CHILD_TAGS = ("Coords", "Glyph", "TextEquiv")
+    _SHALLOW_CHILD_TAGS = ("Coords", "TextEquiv")
+
+    __slots__ = ("_content_hash",)
+
     word_id: str
     coords: Coordinates
     glyphs: List[Glyph]
     text: Optional[Text]
 
     @staticmethod
-    def from_element(word_xml: etree.ElementBase, nsmap: NsMap) -> "Word":
+    def from_element(
+        word_xml: etree.ElementBase, nsmap: NsMap,
+        options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> "Word":
         word_id = word_xml.get("id")
         if word_id is None:
             raise PageXMLError("Word is missing an id attribute")
 
-        coords_xml = word_xml.find("./Coords", namespaces=nsmap)
+        parse_glyphs = options.depth >= ParseDepth.GLYPH
+        children = group_children(
+            word_xml, nsmap,
+            Word._CHILD_TAGS if parse_glyphs else Word._SHALLOW_CHILD_TAGS
+        )
+
+        coords_xml = first_child(children, "Coords")
         if coords_xml is None:
             raise PageXMLError("Word is missing Coords element")
 
-        coords = Coordinates.from_element(coords_xml, nsmap)
+        coords = Coordinates.from_element(coords_xml, nsmap, options)
 
-        glyph_xmls = word_xml.findall("./Glyph", namespaces=nsmap)
-        glyphs = [Glyph.from_element(xml, nsmap) for xml in glyph_xmls]
+        if parse_glyphs:
+            glyphs = parse_elements(
+                children["Glyph"],
+                lambda xml: Glyph.from_element(xml, nsmap, options),
+                options.lazy
+            )
+        else:
+            glyphs = []
 
-        textequiv_xmls = word_xml.findall("./TextEquiv", namespaces=nsmap)
+        textequiv_xmls = children["TextEquiv"]
         textequiv_count = len(textequiv_xmls)
 
         if textequiv_count == 0:
@@ -52,19 +78,33 @@ class Word(Element):
         for glyph in self.glyphs:
             word_xml.append(glyph.to_element(nsmap))
 
-        if self.text is not None:
-            word_xml.append(self.text.to_element(nsmap))
+        for text in self._texts():
+            word_xml.append(text.to_element(nsmap))
 
         return word_xml
 
+    def _texts(self) -> List[Text]:
+        """Returns the texts which are written as TextEquiv elements."""
+        return [] if self.text is None else [self.text]
+
 
 class IndexedWord(Word, IndexedElement[int, Text]):
+    __slots__ = ("_index",)
+
     def __init__(
         self, word_id: str, coords: Coordinates,
         glyphs: List[Glyph], texts: List[Text]
     ):
-        super(Word, self).__init__(texts, lambda text: text.index)
+        super(Word, self).__init__(texts)
         super().__init__(word_id, coords, glyphs, self.get_from_index(0))
 
     def texts(self) -> Iterable[Text]:
         return self.objects()
+
+    def __reduce__(self):
+        return IndexedWord, (
+            self.word_id, self.coords, self.glyphs, list(self.texts())
+        )
+
+    def _texts(self) -> List[Text]:
+        return list(self.texts())
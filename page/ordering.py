@@ -0,0 +1,136 @@
+"""Inferring a reading order from the geometry of a page.
+
+Many PAGE-XML files, e.g. the output of OCR engines, do not contain a
+ReadingOrder. infer_reading_order derives one with the recursive XY-cut
+algorithm: the bounding boxes of the regions are split into rows at
+horizontal gaps and into columns at vertical gaps, always at the direction
+with the widest gap, until no gap is left. Rows are read top to bottom,
+columns left to right.
+
+The gaps are found with a sweep over the boxes sorted by their start
+coordinates, so each level of the recursion takes O(n log n).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from page.elements.element import Element
+from page.elements.geometry import BBox
+from page.elements.page import Page
+from page.elements.reading_order import ReadingOrder, OrderedGroup
+from page.elements.region_ref import RegionRefIndexed
+
+INFERRED_GROUP_ID = "inferred_reading_order"
+
+
+def _split(
+    bboxes: Sequence[BBox], items: List[int], axis: int, min_gap: float
+) -> Tuple[List[List[int]], Optional[float]]:
+    """Splits the items at all gaps along one axis (0 for x, 1 for y) and
+    returns the segments in ascending order along with the widest gap."""
+
+    start, stop = axis, axis + 2
+    items = sorted(items, key=lambda item: bboxes[item][start])
+
+    segments = [[items[0]]]
+    end = bboxes[items[0]][stop]
+    widest: Optional[float] = None
+
+    for item in items[1:]:
+        bbox = bboxes[item]
+        gap = bbox[start] - end
+
+        if gap > min_gap:
+            segments.append([item])
+            if widest is None or gap > widest:
+                widest = gap
+        else:
+            segments[-1].append(item)
+
+        end = max(end, bbox[stop])
+
+    return segments, widest
+
+
+def xy_cut(bboxes: Sequence[BBox], min_gap: float = 0) -> List[int]:
+    """Orders bounding boxes with the recursive XY-cut algorithm.
+
+    Parameters
+    ----------
+    bboxes : Sequence[Tuple[int, int, int, int]]
+        The boxes as (min x, min y, max x, max y).
+    min_gap : float
+        Boxes are only separated by gaps wider than this.
+
+    Returns
+    -------
+    List[int]
+        The indices of the boxes in reading order. Boxes which cannot be
+        separated by any gap are ordered by their top and then their left
+        edges.
+    """
+
+    order: List[int] = []
+    # an explicit stack, since the recursion can be as deep as the number
+    # of boxes (e.g. for a staircase of boxes)
+    stack = [list(range(len(bboxes)))] if bboxes else []
+
+    while stack:
+        items = stack.pop()
+
+        if len(items) == 1:
+            order.append(items[0])
+            continue
+
+        rows, row_gap = _split(bboxes, items, 1, min_gap)
+        columns, column_gap = _split(bboxes, items, 0, min_gap)
+
+        if row_gap is None and column_gap is None:
+            order.extend(sorted(
+                items, key=lambda item: (bboxes[item][1], bboxes[item][0])
+            ))
+        elif column_gap is not None and (
+            row_gap is None or column_gap > row_gap
+        ):
+            stack.extend(reversed(columns))
+        else:
+            stack.extend(reversed(rows))
+
+    return order
+
+
+def order_elements(
+    elements: Sequence[Element], min_gap: float = 0
+) -> List[Element]:
+    """Returns elements with coordinates (e.g. the regions of a page or the
+    lines of a region) in the order determined by xy_cut."""
+
+    order = xy_cut([element.coords.bbox for element in elements], min_gap)
+    return [elements[index] for index in order]
+
+
+def infer_reading_order(
+    page: Page, min_gap: float = 0
+) -> Optional[ReadingOrder]:
+    """Infers a reading order for the top-level regions of a page, see the
+    module documentation.
+
+    Returns
+    -------
+    page.elements.ReadingOrder, optional
+        A reading order with a single OrderedGroup, which references the
+        regions in reading order. Regions without an id are left out,
+        since they cannot be referenced. None if no region has an id,
+        since PAGE-XML does not allow empty groups.
+    """
+
+    regions = [
+        region for region in page.regions if region.region_id is not None
+    ]
+    if not regions:
+        return None
+
+    refs = [
+        RegionRefIndexed(region.region_id, index)
+        for index, region in enumerate(order_elements(regions, min_gap))
+    ]
+    return ReadingOrder(OrderedGroup(INFERRED_GROUP_ID, refs))
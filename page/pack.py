@@ -0,0 +1,327 @@
+"""A single-file "corpus pack" of many PAGE-XML documents.
+
+Storing millions of pages as single files strains most file systems. A
+pack concatenates independently gzip-compressed PAGE-XML documents into
+one file, followed by an index. Each document has a key, by default its
+pcGtsId or the name of its file.
+
+The index consists of fixed-width tables, which are read straight from
+the memory-mapped file. Loading the k-th document therefore takes O(1),
+and loading a document by its key takes O(log n), without reading the
+index into memory or touching any other document. The layout is::
+
+    magic (8 bytes)
+    document 0, ..., document n - 1       gzip-compressed PAGE-XML
+    document offsets (n + 1 uint64)       offset of every document and
+                                          the end of the last document
+    key offsets (n + 1 uint64)            relative to the key data
+    key data                              UTF-8 keys in document order
+    sorted keys (n uint64)                document indices sorted by key
+    trailer (48 bytes)                    n and the offsets of the four
+                                          tables above, then the magic
+
+All integers are little-endian.
+"""
+
+import io
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterator, Optional, Union
+
+from page.compression import GZIP, compress, detect_compression
+from page.constants import NsMap, DEFAULT_NAMESPACE_MAP
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
+from page.elements.pcgts import PcGts
+from page.exceptions import PageXMLError
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+MAGIC = b"PGPACK\x00\x01"
+
+_UINT64 = struct.Struct("<Q")
+_TRAILER = struct.Struct("<5Q8s")
+
+
+def _uint64_array() -> array:
+    values = array("Q")
+    if values.itemsize != 8:
+        values = array("L")
+    return values
+
+
+def _to_little_endian(values: array) -> bytes:
+    if values.itemsize != 8:
+        raise RuntimeError("no 64 bit integer array type available")
+
+    if struct.pack("=H", 1) != struct.pack("<H", 1):
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+class PackWriter:
+    """Writes a corpus pack, see the module documentation.
+
+    The writer is a context manager, the index is written when it is
+    left (if this fails, the incomplete file is removed). Documents are
+    written as they are added, only their offsets and keys are kept in
+    memory::
+
+        with PackWriter("corpus.pgpack") as pack:
+            for path in paths:
+                pack.add_file(path)
+
+    Keys have to be unique. Adding a key a second time raises a ValueError
+    before anything is written, and the writer remains usable.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to write.
+    compresslevel : int
+        The gzip compression level of the documents.
+    """
+
+    def __init__(self, path: PathLike, compresslevel: int = 6):
+        self.path = path
+        self.compresslevel = compresslevel
+        self._file = None
+        self._offsets = _uint64_array()
+        self._key_offsets = _uint64_array()
+        self._key_data = bytearray()
+        self._keys = set()
+
+    def __enter__(self) -> "PackWriter":
+        self._file = open(self.path, "wb")
+        self._file.write(MAGIC)
+        self._offsets.append(len(MAGIC))
+        self._key_offsets.append(0)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self._write_index()
+        except BaseException:
+            # a pack without an index cannot be read
+            self._file.close()
+            os.remove(self.path)
+            raise
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return len(self._key_offsets) - 1
+
+    def _add(self, key: str, data: bytes):
+        if self._file is None:
+            raise ValueError("the writer has not been entered")
+
+        if key in self._keys:
+            raise ValueError(f"the key '{key}' is not unique")
+
+        if detect_compression(data) is None:
+            data = compress(data, GZIP, self.compresslevel)
+
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+        self._key_data += key.encode("utf-8")
+        self._key_offsets.append(len(self._key_data))
+        self._keys.add(key)
+
+    def add(
+        self, pcgts: PcGts, key: Optional[str] = None,
+        nsmap: NsMap = DEFAULT_NAMESPACE_MAP
+    ):
+        """Adds a document, by default keyed by its pcGtsId."""
+
+        if key is None:
+            key = pcgts.pc_gts_id
+
+        if key is None:
+            raise ValueError("the document has no pcGtsId, pass a key")
+
+        self._add(key, pcgts.to_bytes(nsmap))
+
+    def add_file(self, path: PathLike, key: Optional[str] = None):
+        """Adds a PAGE-XML file as it is, by default keyed by its file name.
+        Files compressed with gzip, bz2 or xz are not compressed again."""
+
+        if key is None:
+            key = os.path.basename(os.fspath(path))
+
+        with open(path, "rb") as file:
+            self._add(key, file.read())
+
+    def _key(self, index: int) -> bytes:
+        start, end = self._key_offsets[index], self._key_offsets[index + 1]
+        return bytes(self._key_data[start:end])
+
+    def _write_index(self):
+        n = len(self)
+        order = sorted(range(n), key=self._key)
+        sorted_keys = _uint64_array()
+        sorted_keys.extend(order)
+
+        offsets_position = self._offsets[-1]
+        key_offsets_position = offsets_position + 8 * (n + 1)
+        key_data_position = key_offsets_position + 8 * (n + 1)
+        sorted_position = key_data_position + len(self._key_data)
+
+        self._file.write(_to_little_endian(self._offsets))
+        self._file.write(_to_little_endian(self._key_offsets))
+        self._file.write(self._key_data)
+        self._file.write(_to_little_endian(sorted_keys))
+        self._file.write(_TRAILER.pack(
+            n, offsets_position, key_offsets_position, key_data_position,
+            sorted_position, MAGIC
+        ))
+
+
+class CorpusPack:
+    """Random access to the documents of a corpus pack.
+
+    The pack is memory-mapped, so opening it is cheap regardless of its
+    size, and it can be shared between processes after forking. It is a
+    context manager, which closes the pack when it is left::
+
+        with CorpusPack("corpus.pgpack") as pack:
+            pcgts = pack[random.randrange(len(pack))]
+            pcgts = pack.get("page_0001.xml")
+
+    Raises
+    ------
+    PageXMLError
+        If the file is not a (complete) corpus pack.
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = path
+
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                # empty files cannot be mapped
+                raise PageXMLError(f"{os.fspath(path)} is not a corpus pack")
+
+        size = len(self._map)
+
+        if (
+            size < len(MAGIC) + _TRAILER.size
+            or self._map[:len(MAGIC)] != MAGIC
+            or self._map[size - len(MAGIC):] != MAGIC
+        ):
+            self._map.close()
+            raise PageXMLError(
+                f"{os.fspath(path)} is not a complete corpus pack"
+            )
+
+        (
+            self._n, self._offsets, self._key_offsets, self._key_data,
+            self._sorted, _
+        ) = _TRAILER.unpack_from(self._map, size - _TRAILER.size)
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self) -> "CorpusPack":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _uint64(self, table: int, index: int) -> int:
+        return _UINT64.unpack_from(self._map, table + 8 * index)[0]
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._n
+
+        if not 0 <= index < self._n:
+            raise IndexError("document index out of range")
+
+        return index
+
+    def key(self, index: int) -> str:
+        """Returns the key of the document with the given index."""
+
+        index = self._check_index(index)
+        start = self._key_data + self._uint64(self._key_offsets, index)
+        end = self._key_data + self._uint64(self._key_offsets, index + 1)
+        return self._map[start:end].decode("utf-8")
+
+    def keys(self) -> Iterator[str]:
+        """Yields the keys of all documents in the order of the pack."""
+
+        for index in range(self._n):
+            yield self.key(index)
+
+    def index_of(self, key: str) -> Optional[int]:
+        """Returns the index of the document with the given key, or None if
+        there is no such document."""
+
+        encoded = key.encode("utf-8")
+        low, high = 0, self._n
+
+        while low < high:
+            middle = (low + high) // 2
+            index = self._uint64(self._sorted, middle)
+            start = self._key_data + self._uint64(self._key_offsets, index)
+            end = self._key_data + self._uint64(self._key_offsets, index + 1)
+            middle_key = self._map[start:end]
+
+            if middle_key == encoded:
+                return index
+            elif middle_key < encoded:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        return self.index_of(key) is not None
+
+    def raw(self, index: int) -> bytes:
+        """Returns the compressed PAGE-XML of the document with the given
+        index."""
+
+        index = self._check_index(index)
+        start = self._uint64(self._offsets, index)
+        end = self._uint64(self._offsets, index + 1)
+        return self._map[start:end]
+
+    def load(
+        self, index: int, options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> PcGts:
+        """Parses the document with the given index."""
+
+        pcgts = PcGts.from_file(io.BytesIO(self.raw(index)), options)
+        if pcgts is None:
+            raise PageXMLError(
+                f"document {self.key(index)} is not a pagecontent file"
+            )
+
+        return pcgts
+
+    def __getitem__(self, index: int) -> PcGts:
+        return self.load(index)
+
+    def get(
+        self, key: str, options: ParseOptions = DEFAULT_PARSE_OPTIONS
+    ) -> Optional[PcGts]:
+        """Parses the document with the given key, returning None if there
+        is no such document."""
+
+        index = self.index_of(key)
+        return None if index is None else self.load(index, options)
@@ -0,0 +1,149 @@
+"""Loading many PAGE-XML documents in parallel using a process pool."""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+from lxml import etree
+
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
+from page.elements.pcgts import PcGts
+from page.exceptions import PageXMLError
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# errors which concern a single file and do not abort the whole batch
+LOAD_ERRORS = (PageXMLError, etree.XMLSyntaxError, OSError)
+
+
+def _syntax_error_result(
+    path: PathLike, message: str, code: int, line: int, column: int,
+    filename: Optional[str]
+) -> "LoadResult":
+    error = etree.XMLSyntaxError(message, code, line, column, filename)
+    return LoadResult(path, None, error)
+
+
+@dataclass
+class LoadResult:
+    """The outcome of loading a single file with load_many.
+
+    Attributes
+    ----------
+    path : str or os.PathLike
+        The path of the file, as it was passed to load_many, or the name
+        of the member for files in archives (see page.archive).
+    pcgts : PcGts, optional
+        The parsed document, or None if the file could not be loaded or
+        is not a pagecontent file (see PcGts.from_file).
+    error : Exception, optional
+        The PageXMLError, lxml.etree.XMLSyntaxError or OSError which
+        occurred while loading the file, if any.
+    """
+
+    path: PathLike
+    pcgts: Optional[PcGts]
+    error: Optional[Exception] = None
+
+    def __reduce__(self):
+        if isinstance(self.error, etree.XMLSyntaxError):
+            # lxml errors carry an error log which cannot be pickled,
+            # so recreate the error in the receiving process instead
+            line, column = self.error.position
+            return _syntax_error_result, (
+                self.path, self.error.msg, self.error.code, line, column,
+                self.error.filename
+            )
+
+        return LoadResult, (self.path, self.pcgts, self.error)
+
+
+def load_file(path: PathLike, options: ParseOptions) -> LoadResult:
+    """Loads a single file, returning errors as part of the LoadResult."""
+
+    try:
+        return LoadResult(path, PcGts.from_file(os.fspath(path), options))
+    except LOAD_ERRORS as error:
+        return LoadResult(path, None, error)
+
+
+def _load_chunk(
+    paths: List[PathLike], options: ParseOptions
+) -> List[LoadResult]:
+    return [load_file(path, options) for path in paths]
+
+
+def chunks_of(items: Iterable, chunksize: int) -> Iterator[list]:
+    """Splits items into lists of (at most) chunksize items."""
+
+    iterator = iter(items)
+
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def map_chunks(
+    load_chunk: Callable[..., List[LoadResult]], chunks: Iterator[tuple],
+    workers: Optional[int], ordered: bool
+) -> Iterator[LoadResult]:
+    """Calls load_chunk(*args) for every tuple of args in chunks in a
+    process pool with the given number of workers, and yields the results
+    of all calls."""
+
+    workers = workers or os.cpu_count() or 1
+    # only keep a few chunks in flight, so that neither the paths nor the
+    # results of a huge corpus pile up in memory
+    max_pending = 2 * workers
+    pending: "deque[Future]" = deque()
+
+    with ProcessPoolExecutor(workers) as executor:
+        def submit_chunks():
+            for args in islice(chunks, max_pending - len(pending)):
+                pending.append(executor.submit(load_chunk, *args))
+
+        try:
+            submit_chunks()
+
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+
+                for future in done:
+                    yield from future.result()
+
+                submit_chunks()
+        finally:
+            # the consumer might stop iterating early
+            for future in pending:
+                future.cancel()
+
+
+def load_many(
+    paths: Iterable[PathLike], workers: Optional[int] = None,
+    chunksize: int = 16, ordered: bool = True,
+    options: ParseOptions = DEFAULT_PARSE_OPTIONS
+) -> Iterator[LoadResult]:
+    """Loads many PAGE-XML files in parallel, see PcGts.load_many."""
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    if workers == 0:
+        for path in paths:
+            yield load_file(path, options)
+
+        return
+
+    chunks = ((chunk, options) for chunk in chunks_of(paths, chunksize))
+    yield from map_chunks(_load_chunk, chunks, workers, ordered)
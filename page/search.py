@@ -0,0 +1,807 @@
+"""An inverted full-text index over the lines and words of many documents.
+
+The text of every line is split into normalized tokens (see tokenize). Each
+token has a posting list of the elements it occurs in and its position in
+the line. If the words of a line have a text, the words are indexed and
+their positions are counted across the line. Otherwise the line itself is
+indexed. A hit therefore carries the ids and bounding boxes of the
+matching words, or of the line, which is what a search interface needs for
+highlighting::
+
+    index = TextIndex()
+    index.add("page_0001", pcgts)
+
+    for hit in index.search('anno domi*'):
+        for element_id, bbox in hit.elements:
+            ...
+
+Phrases match consecutive tokens of the same line, a trailing * turns the
+last token into a prefix. A query only iterates the postings of its rarest
+token and looks up the other tokens in their posting lists, which are
+sorted by line. Hits are found in order, so a limit ends the search early.
+
+An index can be saved to a single file and opened again. The file is
+memory-mapped and its tables are used in place: the terms are sorted, so
+looking up a term or a prefix is a binary search, and only the posting
+lists of the query terms are read. Documents added to an opened index are
+kept in memory, removed documents are skipped by the queries, and both are
+merged into the file by the next save. The layout of the file is::
+
+    magic (8 bytes)
+    key offsets (d + 1 uint64)        relative to the key data
+    key data                          UTF-8 document keys
+    sorted keys (d uint32)            document numbers sorted by key
+    element documents (e uint32)      document number of every element
+    element lines (e uint32)          element number of the line of every
+                                      element (a line refers to itself)
+    bounding boxes (4 e int32)        min x, min y, max x, max y
+    id offsets (e + 1 uint64)         relative to the id data
+    id data                           UTF-8 element ids
+    term offsets (t + 1 uint64)       relative to the term data
+    term data                         UTF-8 terms, sorted bytewise
+    posting offsets (t + 1 uint64)    in postings
+    postings (2 p uint32)             element and position of every posting
+    trailer (120 bytes)               d, e, t, the offsets of the twelve
+                                      tables above, then the magic
+
+Every table starts at a multiple of 8 bytes, all integers are
+little-endian.
+"""
+
+import bisect
+import heapq
+import itertools
+import mmap
+import os
+import re
+import struct
+import sys
+import unicodedata
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set
+from typing import Tuple, Union
+
+from page.elements.geometry import BBox
+from page.elements.line import Line
+from page.elements.pcgts import PcGts
+from page.exceptions import PageXMLError
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+MAGIC = b"PGTIDX\x01\x00"
+
+_TOKEN = re.compile(r"\w+")
+_TRAILER = struct.Struct("<15Q8s")
+_ALIGNMENT = 8
+# sorts after all terms starting with a prefix, since UTF-8 never contains
+# the byte 0xff
+_PREFIX_END = b"\xff"
+
+
+def normalize(text: str) -> str:
+    """Normalizes text for the index: compatibility characters (e.g.
+    ligatures like "ﬁ") are decomposed and the case is folded."""
+
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into normalized tokens, i.e. runs of letters, digits and
+    underscores."""
+
+    return _TOKEN.findall(normalize(text))
+
+
+@dataclass
+class SearchHit:
+    """A match of a query.
+
+    Attributes
+    ----------
+    document : str
+        The key of the document.
+    line_id : str
+        The id of the line containing the match.
+    line_bbox : Tuple[int, int, int, int]
+        The bounding box of the line.
+    elements : List[Tuple[str, Tuple[int, int, int, int]]]
+        The ids and bounding boxes of the matching words in line order, or
+        of the line if its words are not indexed.
+    """
+
+    document: str
+    line_id: str
+    line_bbox: BBox
+    elements: List[Tuple[str, BBox]]
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _table(
+    view: memoryview, offset: int, count: int, typecode: str
+) -> Sequence[int]:
+    """Returns count integers of the little-endian table at offset, without
+    copying them if possible."""
+
+    size = array(typecode).itemsize
+    table = view[offset:offset + count * size].cast(typecode)
+
+    if sys.byteorder != "little":
+        values = array(typecode, table)
+        table.release()
+        values.byteswap()
+        return values
+
+    return table
+
+
+class _MappedIndex:
+    """The tables of a saved index in a memory-mapped file."""
+
+    def __init__(self, path: PathLike):
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                # empty files cannot be mapped
+                raise PageXMLError(f"{os.fspath(path)} is not a text index")
+
+        size = len(self._map)
+
+        if (
+            size < len(MAGIC) + _TRAILER.size
+            or self._map[:len(MAGIC)] != MAGIC
+            or self._map[size - len(MAGIC):] != MAGIC
+        ):
+            self._map.close()
+            raise PageXMLError(
+                f"{os.fspath(path)} is not a complete text index"
+            )
+
+        (
+            self.documents, self.elements, self.terms,
+            key_offsets, key_data, sorted_keys, element_documents,
+            element_lines, bboxes, id_offsets, id_data, term_offsets,
+            term_data, posting_offsets, postings, _
+        ) = _TRAILER.unpack_from(self._map, size - _TRAILER.size)
+
+        d, e, t = self.documents, self.elements, self.terms
+        self._view = memoryview(self._map)
+        self._tables = [
+            _table(self._view, key_offsets, d + 1, "Q"),
+            _table(self._view, sorted_keys, d, "I"),
+            _table(self._view, element_documents, e, "I"),
+            _table(self._view, element_lines, e, "I"),
+            _table(self._view, bboxes, 4 * e, "i"),
+            _table(self._view, id_offsets, e + 1, "Q"),
+            _table(self._view, term_offsets, t + 1, "Q"),
+            _table(self._view, posting_offsets, t + 1, "Q"),
+        ]
+        (
+            self._key_offsets, self._sorted_keys, self.element_documents,
+            self.element_lines, self.bboxes, self._id_offsets,
+            self._term_offsets, self._posting_offsets
+        ) = self._tables
+        self._key_data = key_data
+        self._id_data = id_data
+        self._term_data = term_data
+        self._postings = postings
+
+    def close(self):
+        for table in self._tables:
+            if isinstance(table, memoryview):
+                table.release()
+
+        self._view.release()
+        self._map.close()
+
+    def _bytes(self, data: int, offsets: Sequence[int], index: int) -> bytes:
+        return self._map[data + offsets[index]:data + offsets[index + 1]]
+
+    def key(self, document: int) -> str:
+        return self._bytes(
+            self._key_data, self._key_offsets, document
+        ).decode("utf-8")
+
+    def document(self, key: str) -> Optional[int]:
+        encoded = key.encode("utf-8")
+        low, high = 0, self.documents
+
+        while low < high:
+            middle = (low + high) // 2
+            document = self._sorted_keys[middle]
+            middle_key = self._bytes(
+                self._key_data, self._key_offsets, document
+            )
+
+            if middle_key == encoded:
+                return document
+            elif middle_key < encoded:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+    def element_id(self, element: int) -> str:
+        return self._bytes(
+            self._id_data, self._id_offsets, element
+        ).decode("utf-8")
+
+    def term(self, index: int) -> bytes:
+        return self._bytes(self._term_data, self._term_offsets, index)
+
+    def _bisect(self, term: bytes) -> int:
+        """Returns the index of the first term which is not less than
+        term."""
+
+        low, high = 0, self.terms
+
+        while low < high:
+            middle = (low + high) // 2
+            if self.term(middle) < term:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def term_range(self, term: str, prefix: bool) -> range:
+        """Returns the indices of the term, or of all terms starting with
+        it."""
+
+        encoded = term.encode("utf-8")
+        start = self._bisect(encoded)
+
+        if not prefix:
+            found = start < self.terms and self.term(start) == encoded
+            return range(start, start + found)
+
+        # the terms starting with a prefix follow each other
+        return range(start, self._bisect(encoded + _PREFIX_END))
+
+    def postings(self, index: int) -> Sequence[int]:
+        """Returns the flat (element, position) pairs of a term, without
+        copying them if possible."""
+
+        start = self._posting_offsets[index]
+        end = self._posting_offsets[index + 1]
+        return _table(
+            self._view, self._postings + 8 * start, 2 * (end - start), "I"
+        )
+
+
+class _FileWriter:
+    """Writes the tables of an index, each aligned to 8 bytes."""
+
+    def __init__(self, file):
+        self._file = file
+        self._file.write(MAGIC)
+        self.position = len(MAGIC)
+        self.offsets: List[int] = []
+
+    def table(self, data: bytes):
+        padding = -self.position % _ALIGNMENT
+        self._file.write(b"\x00" * padding)
+        self.position += padding
+
+        self.offsets.append(self.position)
+        self._file.write(data)
+        self.position += len(data)
+
+    def trailer(self, documents: int, elements: int, terms: int):
+        self._file.write(b"\x00" * (-self.position % _ALIGNMENT))
+        self._file.write(_TRAILER.pack(
+            documents, elements, terms, *self.offsets, MAGIC
+        ))
+
+
+def _string_table(strings: Sequence[bytes]) -> Tuple[bytes, bytes]:
+    offsets = array("Q", [0])
+    position = 0
+
+    for string in strings:
+        position += len(string)
+        offsets.append(position)
+
+    return _little_endian(offsets), b"".join(strings)
+
+
+class _PostingCursor:
+    """Finds postings of lines in a posting list. Posting lists are sorted
+    by element, and therefore by line and position. The lines have to be
+    looked up in increasing order, so every search gallops forward from
+    the previous one, which takes O(log d) for a distance of d postings."""
+
+    __slots__ = ("flat", "element_line", "index")
+
+    def __init__(
+        self, flat: Sequence[int], element_line: Callable[[int], int]
+    ):
+        self.flat = flat
+        self.element_line = element_line
+        # all postings before index belong to previous lines
+        self.index = 0
+
+    def find(self, line: int, position: int) -> Optional[int]:
+        """Returns the element of the posting at the position of the line,
+        or None."""
+
+        flat, count = self.flat, len(self.flat) // 2
+        low = probe = self.index
+        step = 1
+
+        while probe < count and flat[2 * probe] < line:
+            low = probe + 1
+            probe = low + step
+            step *= 2
+
+        high = min(probe, count)
+        while low < high:
+            middle = (low + high) // 2
+            if flat[2 * middle] < line:
+                low = middle + 1
+            else:
+                high = middle
+
+        self.index = low
+
+        # the postings of the line follow each other, and the elements of
+        # a line are numbered after it
+        for i in range(2 * low, 2 * count, 2):
+            element = flat[i]
+            if self.element_line(element) != line:
+                break
+
+            if flat[i + 1] >= position:
+                return element if flat[i + 1] == position else None
+
+        return None
+
+
+def _merge_postings(
+    postings: List[Sequence[int]]
+) -> Iterator[Tuple[int, int]]:
+    """Yields the (element, position) pairs of several posting lists in
+    order."""
+
+    pairs = [zip(it, it) for it in map(iter, postings)]
+    if len(pairs) == 1:
+        return pairs[0]
+
+    return heapq.merge(*pairs)
+
+
+class TextIndex:
+    """An inverted index of the text of the lines and words of documents,
+    see the module documentation.
+
+    Parameters
+    ----------
+    path : str or os.PathLike, optional
+        A file written by save, which is memory-mapped. By default, the
+        index is empty.
+
+    Raises
+    ------
+    PageXMLError
+        If the file is not a (complete) text index.
+    """
+
+    def __init__(self, path: Optional[PathLike] = None):
+        self._mapped = None if path is None else _MappedIndex(path)
+        # documents and elements are numbered across the mapped index and
+        # the documents which were added afterwards
+        self._first_document = self._first_element = 0
+        if self._mapped is not None:
+            self._first_document = self._mapped.documents
+            self._first_element = self._mapped.elements
+
+        self._keys: List[str] = []
+        self._documents: Dict[str, int] = {}
+        self._removed: Set[int] = set()
+
+        self._element_documents = array("I")
+        self._element_lines = array("I")
+        self._bboxes = array("i")
+        self._element_ids: List[str] = []
+
+        self._postings: Dict[str, array] = {}
+        self._sorted_terms: Optional[List[bytes]] = None
+
+    def close(self):
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+
+    def __enter__(self) -> "TextIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _document_count(self) -> int:
+        return self._first_document + len(self._keys)
+
+    def __len__(self) -> int:
+        return self._document_count() - len(self._removed)
+
+    def _key(self, document: int) -> str:
+        if document < self._first_document:
+            return self._mapped.key(document)
+
+        return self._keys[document - self._first_document]
+
+    def _document(self, key: str) -> Optional[int]:
+        document = self._documents.get(key)
+
+        if document is None and self._mapped is not None:
+            document = self._mapped.document(key)
+
+        if document is None or document in self._removed:
+            return None
+
+        return document
+
+    def __contains__(self, key: str) -> bool:
+        return self._document(key) is not None
+
+    def keys(self) -> Iterator[str]:
+        """Yields the keys of all documents in the order they were added."""
+
+        for document in range(self._document_count()):
+            if document not in self._removed:
+                yield self._key(document)
+
+    def _add_element(
+        self, document: int, line: int, element_id: str, bbox: BBox
+    ) -> int:
+        self._element_documents.append(document)
+        self._element_lines.append(line)
+        self._bboxes.extend(bbox)
+        self._element_ids.append(element_id)
+        return self._first_element + len(self._element_ids) - 1
+
+    def _add_tokens(self, element: int, text: str, position: int) -> int:
+        for token in tokenize(text):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = array("I")
+                self._sorted_terms = None
+
+            postings.append(element)
+            postings.append(position)
+            position += 1
+
+        return position
+
+    def add(self, key: str, pcgts: PcGts):
+        """Indexes the lines of a document (including those of nested
+        regions). A document which was added with the same key before is
+        replaced."""
+
+        self.remove(key)
+
+        document = self._document_count()
+        self._keys.append(key)
+        self._documents[key] = document
+
+        for line in pcgts.page.iter_elements(Line):
+            line_element = self._first_element + len(self._element_ids)
+            self._add_element(
+                document, line_element, line.line_id, line.coords.bbox
+            )
+
+            if any(word.text is not None for word in line.words):
+                position = 0
+                for word in line.words:
+                    element = self._add_element(
+                        document, line_element, word.word_id,
+                        word.coords.bbox
+                    )
+                    if word.text is not None:
+                        position = self._add_tokens(
+                            element, word.text.unicode, position
+                        )
+            elif line.text is not None:
+                self._add_tokens(line_element, line.text.unicode, 0)
+
+    def remove(self, key: str) -> bool:
+        """Removes a document from the index, returning False if it was not
+        part of the index."""
+
+        document = self._document(key)
+        if document is None:
+            return False
+
+        self._removed.add(document)
+        self._documents.pop(key, None)
+        return True
+
+    def _memory_terms(self, term: str, prefix: bool) -> List[bytes]:
+        """Returns the encoded in-memory term, or all in-memory terms
+        starting with it."""
+
+        encoded = term.encode("utf-8")
+        if not prefix:
+            return [encoded] if term in self._postings else []
+
+        # sorted like the terms of the mapped index
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(
+                term.encode("utf-8") for term in self._postings
+            )
+
+        terms = self._sorted_terms
+        start = bisect.bisect_left(terms, encoded)
+        end = bisect.bisect_left(terms, encoded + _PREFIX_END, start)
+        return terms[start:end]
+
+    def terms(self, prefix: str = "") -> Iterator[str]:
+        """Yields the indexed (normalized) terms starting with prefix in
+        bytewise order, including terms which only occur in removed
+        documents."""
+
+        prefix = normalize(prefix)
+        mapped: Iterator[bytes] = iter(())
+        if self._mapped is not None:
+            mapped = (
+                self._mapped.term(index)
+                for index in self._mapped.term_range(prefix, True)
+            )
+
+        previous = None
+        for term in heapq.merge(mapped, self._memory_terms(prefix, True)):
+            if term != previous:
+                yield term.decode("utf-8")
+                previous = term
+
+    def _postings_of(self, term: str, prefix: bool) -> List[Sequence[int]]:
+        """Returns the flat (element, position) pairs of a term, or of all
+        terms starting with it, from the mapped index and from memory."""
+
+        postings: List[Sequence[int]] = []
+        if self._mapped is not None:
+            for index in self._mapped.term_range(term, prefix):
+                postings.append(self._mapped.postings(index))
+
+        for memory_term in self._memory_terms(term, prefix):
+            postings.append(self._postings[memory_term.decode("utf-8")])
+
+        return postings
+
+    def _lookup(
+        self, postings: List[Sequence[int]], candidates: int
+    ) -> Callable[[int, int], Optional[int]]:
+        """Returns a function which finds the element of the posting at a
+        position of a line among the posting lists of a token, which has to
+        be called with increasing lines. Each of the given number of
+        candidates is looked up in every list, unless the lists are so
+        many that mapping all postings at once is cheaper (which may be the
+        case for a prefix)."""
+
+        if candidates * len(postings) <= sum(map(len, postings)) // 2:
+            cursors = [
+                _PostingCursor(flat, self._element_line) for flat in postings
+            ]
+
+            def find(line: int, position: int) -> Optional[int]:
+                for cursor in cursors:
+                    element = cursor.find(line, position)
+                    if element is not None:
+                        return element
+                return None
+
+            return find
+
+        positions = {}
+        for flat in postings:
+            it = iter(flat)
+            for element, position in zip(it, it):
+                positions[self._element_line(element), position] = element
+
+        return lambda line, position: positions.get((line, position))
+
+    def _element_line(self, element: int) -> int:
+        if element < self._first_element:
+            return self._mapped.element_lines[element]
+
+        return self._element_lines[element - self._first_element]
+
+    def _element_document(self, element: int) -> int:
+        if element < self._first_element:
+            return self._mapped.element_documents[element]
+
+        return self._element_documents[element - self._first_element]
+
+    def _element_id(self, element: int) -> str:
+        if element < self._first_element:
+            return self._mapped.element_id(element)
+
+        return self._element_ids[element - self._first_element]
+
+    def _bbox(self, element: int) -> BBox:
+        if element < self._first_element:
+            bboxes, start = self._mapped.bboxes, 4 * element
+        else:
+            bboxes = self._bboxes
+            start = 4 * (element - self._first_element)
+
+        return tuple(bboxes[start:start + 4])
+
+    def search(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[SearchHit]:
+        """Finds the occurrences of a phrase.
+
+        Parameters
+        ----------
+        query : str
+            The phrase, which is tokenized like the indexed text. All of
+            its tokens have to occur consecutively in a line. If the query
+            ends with *, its last token is a prefix.
+        limit : int, optional
+            The maximal number of hits. By default, all hits are returned.
+
+        Returns
+        -------
+        List[SearchHit]
+            The hits in the order the documents were added and the lines
+            occur in them.
+        """
+
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        prefix = query.rstrip().endswith("*")
+        postings = [
+            self._postings_of(token, prefix and i == len(tokens) - 1)
+            for i, token in enumerate(tokens)
+        ]
+
+        hits = self._hits(postings)
+        try:
+            return list(itertools.islice(hits, limit))
+        finally:
+            # views of a mapped index would keep it from being closed
+            hits.close()
+            for flat in itertools.chain.from_iterable(postings):
+                if isinstance(flat, memoryview):
+                    flat.release()
+
+    def _hits(
+        self, postings: List[List[Sequence[int]]]
+    ) -> Iterator[SearchHit]:
+        """Yields the hits of the tokens with the given posting lists in
+        order. Only the postings of the rarest token are iterated, the
+        other tokens are looked up at the following or preceding
+        positions."""
+
+        counts = [sum(map(len, lists)) // 2 for lists in postings]
+        rarest = min(range(len(postings)), key=counts.__getitem__)
+        lookups = [
+            None if i == rarest else self._lookup(lists, counts[rarest])
+            for i, lists in enumerate(postings)
+        ]
+
+        for element, position in _merge_postings(postings[rarest]):
+            start = position - rarest
+            if start < 0:
+                continue
+
+            line = self._element_line(element)
+            elements = [
+                element if lookup is None else lookup(line, start + i)
+                for i, lookup in enumerate(lookups)
+            ]
+
+            if None not in elements and (
+                self._element_document(line) not in self._removed
+            ):
+                yield self._hit(line, elements)
+
+    def _hit(self, line: int, elements: List[int]) -> SearchHit:
+        line_id, line_bbox = self._element_id(line), self._bbox(line)
+        matches = []
+
+        for i, element in enumerate(elements):
+            # a word may contain several tokens of the phrase
+            if i > 0 and elements[i - 1] == element:
+                continue
+
+            if element == line:
+                matches.append((line_id, line_bbox))
+            else:
+                matches.append(
+                    (self._element_id(element), self._bbox(element))
+                )
+
+        return SearchHit(
+            self._key(self._element_document(line)), line_id, line_bbox,
+            matches
+        )
+
+    def save(self, path: PathLike):
+        """Writes the index to a file, which can be opened with
+        TextIndex(path). Removed documents are left out. The file is written
+        next to path and then renamed, so path may be the file of this
+        index."""
+
+        documents = [
+            document for document in range(self._document_count())
+            if document not in self._removed
+        ]
+        new_documents = {
+            document: new for new, document in enumerate(documents)
+        }
+
+        element_count = self._first_element + len(self._element_ids)
+        # the new numbers of the elements of the remaining documents
+        new_elements = array("l", [-1]) * element_count
+        elements = []
+        for element in range(element_count):
+            if self._element_document(element) in new_documents:
+                new_elements[element] = len(elements)
+                elements.append(element)
+
+        keys = [self._key(document).encode("utf-8") for document in documents]
+        key_offsets, key_data = _string_table(keys)
+        sorted_keys = array(
+            "I", sorted(range(len(keys)), key=keys.__getitem__)
+        )
+
+        element_documents = array("I", [
+            new_documents[self._element_document(element)]
+            for element in elements
+        ])
+        element_lines = array("I", [
+            new_elements[self._element_line(element)] for element in elements
+        ])
+        bboxes = array("i")
+        for element in elements:
+            bboxes.extend(self._bbox(element))
+        id_offsets, id_data = _string_table([
+            self._element_id(element).encode("utf-8") for element in elements
+        ])
+
+        terms = []
+        posting_offsets = array("Q", [0])
+        postings = array("I")
+        for term in self.terms():
+            for flat in self._postings_of(term, False):
+                it = iter(flat)
+                for element, position in zip(it, it):
+                    if new_elements[element] >= 0:
+                        postings.append(new_elements[element])
+                        postings.append(position)
+
+            if len(postings) // 2 > posting_offsets[-1]:
+                terms.append(term.encode("utf-8"))
+                posting_offsets.append(len(postings) // 2)
+
+        term_offsets, term_data = _string_table(terms)
+
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, "wb") as file:
+            writer = _FileWriter(file)
+            for table in (
+                key_offsets, key_data, _little_endian(sorted_keys),
+                _little_endian(element_documents),
+                _little_endian(element_lines), _little_endian(bboxes),
+                id_offsets, id_data, term_offsets, term_data,
+                _little_endian(posting_offsets), _little_endian(postings)
+            ):
+                writer.table(table)
+            writer.trailer(len(documents), len(elements), len(terms))
+
+        os.replace(temporary, path)
@@ -0,0 +1,310 @@
+"""Serializing PcGts documents into PAGE-XML without building lxml elements.
+
+The serializer writes the text of every element straight into a list of
+strings, which is joined and encoded once at the end. Its output is byte
+for byte identical to serializing the element tree of PcGts.to_element
+with lxml.etree.tostring, i.e. ASCII with character references and the
+same escaping, indentation and namespace declarations.
+"""
+
+import re
+from typing import List, Optional, Union
+from lxml import etree
+
+from page.constants import NsMap, DEFAULT_NAMESPACE_MAP
+from page.elements.coords import Coordinates
+from page.elements.glyph import Glyph
+from page.elements.line import Line
+from page.elements.metadata import Metadata
+from page.elements.page import Page
+from page.elements.pcgts import PcGts
+from page.elements.point import points_to_string
+from page.elements.reading_order import (
+    ReadingOrder, GroupIndexed, OrderedGroup, OrderedGroupIndexed,
+    UnorderedGroup, UnorderedGroupIndexed
+)
+from page.elements.region import Region, TextRegion
+from page.elements.region_ref import RegionRef, RegionRefIndexed
+from page.elements.text import Text
+from page.elements.word import Word
+
+INDENT = "  "
+
+# characters which lxml refuses to serialize
+_INVALID_CHARS_RE = re.compile(
+    "[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]"
+)
+
+
+def _group_tag(group: Union[OrderedGroup, UnorderedGroup]) -> str:
+    if isinstance(group, OrderedGroupIndexed):
+        return "OrderedGroupIndexed"
+    elif isinstance(group, UnorderedGroupIndexed):
+        return "UnorderedGroupIndexed"
+    elif isinstance(group, OrderedGroup):
+        return "OrderedGroup"
+    else:
+        return "UnorderedGroup"
+
+
+def _escape_text(text: str) -> str:
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    return text
+
+
+def _escape_attrib(value: str) -> str:
+    value = _escape_text(value)
+    if '"' in value:
+        value = value.replace('"', "&quot;")
+    if "\n" in value:
+        value = value.replace("\n", "&#10;")
+    if "\t" in value:
+        value = value.replace("\t", "&#9;")
+    return value
+
+
+class _Serializer:
+    def __init__(self, pretty_print: bool):
+        self.parts: List[str] = []
+        self.pretty_print = pretty_print
+
+    def newline(self, depth: int):
+        if self.pretty_print:
+            self.parts.append("\n" + INDENT * depth)
+
+    def start(self, tag: str, attrib: str = ""):
+        self.parts.append(f"<{tag}{attrib}>")
+
+    def end(self, tag: str, depth: int):
+        self.newline(depth)
+        self.parts.append(f"</{tag}>")
+
+    def leaf(self, tag: str, text: Optional[str], depth: int):
+        self.newline(depth)
+
+        if text is None:
+            self.parts.append(f"<{tag}/>")
+        else:
+            self.parts.append(f"<{tag}>{_escape_text(text)}</{tag}>")
+
+    def coords(self, coords: Coordinates, tag: str, depth: int):
+        self.newline(depth)
+        self.parts.append(
+            f'<{tag} points="{points_to_string(coords.points)}"/>'
+        )
+
+    def text(self, text: Text, depth: int):
+        attrib = ""
+        if text.conf is not None:
+            attrib += f' conf="{text.conf}"'
+        if text.index is not None:
+            attrib += f' index="{text.index}"'
+
+        self.newline(depth)
+        self.start("TextEquiv", attrib)
+        self.leaf("Unicode", text.unicode, depth + 1)
+
+        if text.plain_text is not None:
+            self.leaf("PlainText", text.plain_text, depth + 1)
+
+        self.end("TextEquiv", depth)
+
+    def glyph(self, glyph: Glyph, depth: int):
+        self.newline(depth)
+        self.start("Glyph", f' id="{_escape_attrib(glyph.glyph_id)}"')
+        self.coords(glyph.coords, "Coords", depth + 1)
+
+        for text in glyph._texts():
+            self.text(text, depth + 1)
+
+        self.end("Glyph", depth)
+
+    def word(self, word: Word, depth: int):
+        self.newline(depth)
+        self.start("Word", f' id="{_escape_attrib(word.word_id)}"')
+        self.coords(word.coords, "Coords", depth + 1)
+
+        for glyph in word.glyphs:
+            self.glyph(glyph, depth + 1)
+
+        for text in word._texts():
+            self.text(text, depth + 1)
+
+        self.end("Word", depth)
+
+    def line(self, line: Line, depth: int):
+        self.newline(depth)
+        self.start("TextLine", f' id="{_escape_attrib(line.line_id)}"')
+        self.coords(line.coords, "Coords", depth + 1)
+
+        if line.baseline is not None:
+            self.coords(line.baseline, "Baseline", depth + 1)
+
+        for word in line.words:
+            self.word(word, depth + 1)
+
+        for text in line._texts():
+            self.text(text, depth + 1)
+
+        self.end("TextLine", depth)
+
+    def region(self, region: Region, depth: int):
+        if not isinstance(region, TextRegion):
+            # fall back to lxml for other region types
+            region_xml = region.to_element({})
+            if self.pretty_print:
+                etree.indent(region_xml, INDENT, level=depth)
+
+            self.newline(depth)
+            self.parts.append(etree.tostring(region_xml, encoding="unicode"))
+            return
+
+        attrib = "".join(
+            f' {name}="{_escape_attrib(value)}"'
+            for name, value in region._attrib().items()
+        )
+
+        self.newline(depth)
+        self.start("TextRegion", attrib)
+        self.coords(region.coords, "Coords", depth + 1)
+
+        for child in region.children:
+            self.region(child, depth + 1)
+
+        for line in region.lines:
+            self.line(line, depth + 1)
+
+        self.end("TextRegion", depth)
+
+    def group(
+        self, group: Union[OrderedGroup, UnorderedGroup, RegionRef],
+        depth: int
+    ):
+        self.newline(depth)
+
+        if isinstance(group, RegionRefIndexed):
+            self.parts.append(
+                f'<RegionRefIndexed regionRef="{_escape_attrib(group.ref)}"'
+                f' index="{group.index}"/>'
+            )
+            return
+        elif isinstance(group, RegionRef):
+            self.parts.append(
+                f'<RegionRef regionRef="{_escape_attrib(group.ref)}"/>'
+            )
+            return
+
+        tag = _group_tag(group)
+        attrib = f' id="{_escape_attrib(str(group.group_id))}"'
+
+        if isinstance(group, GroupIndexed):
+            attrib += f' index="{group.index}"'
+        if group.caption is not None:
+            attrib += f' caption="{_escape_attrib(group.caption)}"'
+
+        if not group.children:
+            self.parts.append(f"<{tag}{attrib}/>")
+            return
+
+        self.start(tag, attrib)
+
+        for child in group.children:
+            self.group(child, depth + 1)
+
+        self.end(tag, depth)
+
+    def reading_order(self, reading_order: ReadingOrder, depth: int):
+        self.newline(depth)
+        self.start("ReadingOrder")
+        self.group(reading_order.root, depth + 1)
+        self.end("ReadingOrder", depth)
+
+    def metadata(self, metadata: Metadata, depth: int):
+        self.newline(depth)
+        self.start("Metadata")
+        self.leaf("Creator", metadata.creator, depth + 1)
+        self.leaf("Created", metadata.created.isoformat(), depth + 1)
+        self.leaf("LastChange", metadata.last_change.isoformat(), depth + 1)
+
+        if metadata.comments is not None:
+            self.leaf("Comments", metadata.comments, depth + 1)
+
+        self.end("Metadata", depth)
+
+    def page(self, page: Page, depth: int):
+        width, height = page.image_size
+        attrib = (
+            f' imageWidth="{width}" imageHeight="{height}"'
+            f' imageFilename="{_escape_attrib(page.image_filename)}"'
+        )
+
+        self.newline(depth)
+
+        if page.reading_order is None and not page.regions:
+            self.parts.append(f"<Page{attrib}/>")
+            return
+
+        self.start("Page", attrib)
+
+        if page.reading_order is not None:
+            self.reading_order(page.reading_order, depth + 1)
+
+        for region in page.regions:
+            self.region(region, depth + 1)
+
+        self.end("Page", depth)
+
+    def pcgts(self, pcgts: PcGts, nsmap: NsMap):
+        attrib = "".join(
+            f' xmlns="{_escape_attrib(uri)}"' if prefix is None
+            else f' xmlns:{prefix}="{_escape_attrib(uri)}"'
+            for prefix, uri in nsmap.items()
+        )
+
+        if pcgts.pc_gts_id is not None:
+            attrib += f' pcGtsId="{_escape_attrib(pcgts.pc_gts_id)}"'
+
+        self.start("PcGts", attrib)
+        self.metadata(pcgts.metadata, 1)
+        self.page(pcgts.page, 1)
+        self.end("PcGts", 0)
+
+        if self.pretty_print:
+            self.parts.append("\n")
+
+
+def to_string(
+    pcgts: PcGts, nsmap: NsMap = DEFAULT_NAMESPACE_MAP,
+    pretty_print: bool = True
+) -> str:
+    """Serializes a PcGts document into a PAGE-XML string."""
+
+    serializer = _Serializer(pretty_print)
+    serializer.pcgts(pcgts, nsmap)
+    document = "".join(serializer.parts)
+
+    if _INVALID_CHARS_RE.search(document) is not None:
+        # the same error as lxml raises for such strings
+        raise ValueError(
+            "All strings must be XML compatible: Unicode or ASCII, "
+            "no NULL bytes or control characters"
+        )
+
+    return document
+
+
+def to_bytes(
+    pcgts: PcGts, nsmap: NsMap = DEFAULT_NAMESPACE_MAP,
+    pretty_print: bool = True
+) -> bytes:
+    """Serializes a PcGts document into PAGE-XML, see PcGts.to_bytes."""
+
+    document = to_string(pcgts, nsmap, pretty_print)
+    return document.encode("ascii", "xmlcharrefreplace")
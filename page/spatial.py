@@ -0,0 +1,333 @@
+"""A spatial index over the regions, lines, words and glyphs of a page.
+
+The index is a uniform grid over the bounding boxes of the elements.
+Queries first collect the elements whose bounding boxes match and then
+check the exact polygons of these candidates. Usually the index is not
+used directly, but through Page.query_bbox, Page.query_point and
+Page.nearest.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from page.elements.element import Element
+from page.elements.coords import Coordinates
+from page.elements.geometry import polygon_bbox
+from page.elements.page import Page, ElementTypes
+
+BBox = Tuple[float, float, float, float]
+Polygon = List[Tuple[float, float]]
+
+
+def _polygon(coords: Coordinates) -> Polygon:
+    if coords.is_array():
+        return [(x, y) for x, y in coords.points.tolist()]
+    else:
+        return [(p.x, p.y) for p in coords.points]
+
+
+def _edges(polygon: Polygon) -> Iterable[Tuple[Tuple[float, float], ...]]:
+    return zip(polygon, polygon[1:] + polygon[:1])
+
+
+def _on_segment(x: float, y: float, a, b) -> bool:
+    (ax, ay), (bx, by) = a, b
+    return (
+        (bx - ax) * (y - ay) == (by - ay) * (x - ax)
+        and min(ax, bx) <= x <= max(ax, bx)
+        and min(ay, by) <= y <= max(ay, by)
+    )
+
+
+def polygon_contains(polygon: Polygon, x: float, y: float) -> bool:
+    """Returns True if the point lies inside the polygon or on its
+    boundary."""
+
+    inside = False
+
+    for a, b in _edges(polygon):
+        if _on_segment(x, y, a, b):
+            return True
+
+        (ax, ay), (bx, by) = a, b
+        if (ay > y) != (by > y):
+            crossing = ax + (y - ay) * (bx - ax) / (by - ay)
+            if x < crossing:
+                inside = not inside
+
+    return inside
+
+
+def _orientation(a, b, c) -> int:
+    value = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+    return (value > 0) - (value < 0)
+
+
+def _segments_intersect(a, b, c, d) -> bool:
+    o1, o2 = _orientation(a, b, c), _orientation(a, b, d)
+    o3, o4 = _orientation(c, d, a), _orientation(c, d, b)
+
+    if o1 != o2 and o3 != o4:
+        return True
+
+    return (
+        (o1 == 0 and _on_segment(c[0], c[1], a, b))
+        or (o2 == 0 and _on_segment(d[0], d[1], a, b))
+        or (o3 == 0 and _on_segment(a[0], a[1], c, d))
+        or (o4 == 0 and _on_segment(b[0], b[1], c, d))
+    )
+
+
+def polygon_intersects_bbox(polygon: Polygon, bbox: BBox) -> bool:
+    """Returns True if the polygon and the rectangle overlap or touch."""
+
+    x0, y0, x1, y1 = bbox
+
+    if any(x0 <= x <= x1 and y0 <= y <= y1 for x, y in polygon):
+        return True
+
+    corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+
+    if any(polygon_contains(polygon, x, y) for x, y in corners):
+        return True
+
+    return any(
+        _segments_intersect(a, b, c, d)
+        for a, b in _edges(polygon)
+        for c, d in _edges(corners)
+    )
+
+
+def _segment_distance(x: float, y: float, a, b) -> float:
+    (ax, ay), (bx, by) = a, b
+    dx, dy = bx - ax, by - ay
+    length = dx * dx + dy * dy
+
+    if length == 0:
+        t = 0.0
+    else:
+        t = max(0.0, min(1.0, ((x - ax) * dx + (y - ay) * dy) / length))
+
+    return math.hypot(x - (ax + t * dx), y - (ay + t * dy))
+
+
+def polygon_distance(polygon: Polygon, x: float, y: float) -> float:
+    """Returns the distance of the point to the polygon, which is 0 for
+    points inside the polygon."""
+
+    if polygon_contains(polygon, x, y):
+        return 0.0
+
+    return min(_segment_distance(x, y, a, b) for a, b in _edges(polygon))
+
+
+def _bbox_distance(bbox: BBox, x: float, y: float) -> float:
+    x0, y0, x1, y1 = bbox
+    return math.hypot(max(x0 - x, 0, x - x1), max(y0 - y, 0, y - y1))
+
+
+class SpatialIndex:
+    """A uniform grid over the bounding boxes of elements with coordinates.
+
+    The index does not track changes of the elements, it has to be
+    rebuilt after coordinates were changed or elements were added or
+    removed.
+
+    Parameters
+    ----------
+    elements : Iterable[page.elements.Element]
+        Elements with a coords attribute, e.g. regions, lines, words and
+        glyphs. Results are returned in the order of this iterable.
+    """
+
+    def __init__(self, elements: Iterable[Element]):
+        self._elements: List[Element] = []
+        self._polygons: List[Polygon] = []
+        self._bboxes: List[BBox] = []
+
+        for element in elements:
+            # the bounding box is computed from the same points as the
+            # polygon, even if the cache of the coordinates is outdated
+            polygon = _polygon(element.coords)
+            self._elements.append(element)
+            self._polygons.append(polygon)
+            self._bboxes.append(polygon_bbox(polygon))
+
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+
+        if not self._bboxes:
+            self._origin, self._cell_size = (0, 0), 1
+            return
+
+        min_x = min(bbox[0] for bbox in self._bboxes)
+        min_y = min(bbox[1] for bbox in self._bboxes)
+        max_x = max(bbox[2] for bbox in self._bboxes)
+        max_y = max(bbox[3] for bbox in self._bboxes)
+
+        # about one element per cell, if the elements were spread evenly
+        area = max(max_x - min_x, 1) * max(max_y - min_y, 1)
+        self._origin = (min_x, min_y)
+        self._cell_size = max(math.sqrt(area / len(self._bboxes)), 1)
+
+        for index, bbox in enumerate(self._bboxes):
+            for cell in self._cells(bbox):
+                self._grid.setdefault(cell, []).append(index)
+
+    @staticmethod
+    def from_page(page: Page) -> "SpatialIndex":
+        """Indexes all regions (including nested ones), lines, words and
+        glyphs of a page."""
+        return SpatialIndex(page.iter_elements())
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        origin_x, origin_y = self._origin
+        return (
+            math.floor((x - origin_x) / self._cell_size),
+            math.floor((y - origin_y) / self._cell_size)
+        )
+
+    def _cells(self, bbox: BBox) -> Iterable[Tuple[int, int]]:
+        cx0, cy0 = self._cell(bbox[0], bbox[1])
+        cx1, cy1 = self._cell(bbox[2], bbox[3])
+        return (
+            (cx, cy)
+            for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)
+        )
+
+    def _candidates(self, bbox: BBox) -> Set[int]:
+        cx0, cy0 = self._cell(bbox[0], bbox[1])
+        cx1, cy1 = self._cell(bbox[2], bbox[3])
+
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._grid):
+            # cheaper to look at the occupied cells only
+            cells: Iterable[Tuple[int, int]] = [
+                (cx, cy) for cx, cy in self._grid
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1
+            ]
+        else:
+            cells = self._cells(bbox)
+
+        candidates: Set[int] = set()
+
+        for cell in cells:
+            candidates.update(self._grid.get(cell, ()))
+
+        return candidates
+
+    def _matches_type(
+        self, index: int, types: Optional[ElementTypes]
+    ) -> bool:
+        return types is None or isinstance(self._elements[index], types)
+
+    def query_bbox(
+        self, bbox: Sequence[float], types: Optional[ElementTypes] = None,
+        exact: bool = True
+    ) -> List[Element]:
+        """Returns the elements which intersect a rectangle.
+
+        Parameters
+        ----------
+        bbox : (float, float, float, float)
+            The rectangle as (min x, min y, max x, max y), inclusive.
+        types : type or tuple of types, optional
+            Only elements of these types are returned, e.g. Line.
+        exact : bool
+            If False, all elements whose bounding boxes intersect the
+            rectangle are returned, without checking their polygons.
+        """
+
+        x0, y0, x1, y1 = bbox
+        if x0 > x1 or y0 > y1:
+            raise ValueError(f"invalid bounding box {tuple(bbox)}")
+
+        bbox = (x0, y0, x1, y1)
+        result = []
+
+        for index in sorted(self._candidates(bbox)):
+            ex0, ey0, ex1, ey1 = self._bboxes[index]
+
+            if (
+                ex0 > x1 or ex1 < x0 or ey0 > y1 or ey1 < y0
+                or not self._matches_type(index, types)
+            ):
+                continue
+
+            if not exact or polygon_intersects_bbox(
+                self._polygons[index], bbox
+            ):
+                result.append(self._elements[index])
+
+        return result
+
+    def query_point(
+        self, x: float, y: float, types: Optional[ElementTypes] = None
+    ) -> List[Element]:
+        """Returns the elements whose polygons contain a point, including
+        points on their boundary."""
+
+        result = []
+
+        for index in sorted(self._grid.get(self._cell(x, y), ())):
+            ex0, ey0, ex1, ey1 = self._bboxes[index]
+
+            if (
+                ex0 <= x <= ex1 and ey0 <= y <= ey1
+                and self._matches_type(index, types)
+                and polygon_contains(self._polygons[index], x, y)
+            ):
+                result.append(self._elements[index])
+
+        return result
+
+    def nearest(
+        self, x: float, y: float, k: int = 1,
+        types: Optional[ElementTypes] = None
+    ) -> List[Tuple[Element, float]]:
+        """Returns the k elements closest to a point along with their
+        distances, closest first. The distance is measured to the polygon
+        of an element and is 0 for elements containing the point."""
+
+        if k < 1:
+            return []
+
+        origin_x, origin_y = self._origin
+        size = self._cell_size
+
+        def cell_distance(cell: Tuple[int, int]) -> float:
+            cx, cy = cell
+            return _bbox_distance((
+                origin_x + cx * size, origin_y + cy * size,
+                origin_x + (cx + 1) * size, origin_y + (cy + 1) * size
+            ), x, y)
+
+        best: List[Tuple[float, int]] = []
+        seen: Set[int] = set()
+
+        for distance, cell in sorted(
+            (cell_distance(cell), cell) for cell in self._grid
+        ):
+            if len(best) == k and distance > best[-1][0]:
+                break
+
+            for index in self._grid[cell]:
+                if index in seen or not self._matches_type(index, types):
+                    continue
+
+                seen.add(index)
+
+                if (
+                    len(best) == k
+                    and _bbox_distance(self._bboxes[index], x, y) > best[-1][0]
+                ):
+                    continue
+
+                best.append(
+                    (polygon_distance(self._polygons[index], x, y), index)
+                )
+                best.sort()
+                del best[k:]
+
+        return [(self._elements[index], distance) for distance, index in best]
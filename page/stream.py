@@ -0,0 +1,228 @@
+"""Streaming readers for large PAGE-XML documents.
+
+In contrast to PcGts.from_file, these readers never hold the complete
+document in memory. They are built on lxml's iterparse and yield every
+TextRegion (or TextLine) as soon as its end tag has been read. The lxml
+elements which have already been consumed are cleared afterwards, so the
+peak memory usage is bounded by the largest single region (or line).
+Compressed documents are decompressed on the fly, see page.compression.
+"""
+
+import os
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+from pathlib import Path
+from lxml import etree
+
+from page.compression import open_source
+from page.constants import NsMap
+from page.exceptions import PageXMLError
+from page.elements.line import Line
+from page.elements.metadata import Metadata
+from page.elements.page import Page
+from page.elements.region import TextRegion
+from page.elements.options import ParseOptions, DEFAULT_PARSE_OPTIONS
+
+Source = Union[str, Path, BinaryIO]
+
+HEADER_CHUNK_SIZE = 4096
+
+
+def _localname(xml: etree.ElementBase) -> str:
+    return etree.QName(xml.tag).localname
+
+
+def _release(xml: etree.ElementBase):
+    """Frees a consumed element together with all its preceding siblings.
+
+    The element itself is kept (but emptied), since lxml still needs it
+    to attach the following siblings while parsing.
+    """
+
+    xml.clear(keep_tail=True)
+    parent = xml.getparent()
+
+    if parent is not None:
+        while xml.getprevious() is not None:
+            del parent[0]
+
+
+def _iterparse(
+    source: Source, tags: tuple
+) -> Iterator[tuple]:
+    """Yields (nsmap, element) for every closed element with one of the
+    given local names, provided that the document root is a PcGts tag."""
+
+    with open_source(source) as parse_source:
+        events = etree.iterparse(
+            parse_source, events=("start", "end"),
+            tag=("{*}PcGts",) + tuple("{*}" + tag for tag in tags)
+        )
+        nsmap: Optional[NsMap] = None
+
+        for event, xml in events:
+            if nsmap is None:
+                if event != "start" or _localname(xml) != "PcGts":
+                    # this is not a pagecontent file
+                    return
+
+                nsmap = xml.nsmap
+            elif event == "end" and xml.getparent() is not None:
+                yield nsmap, xml
+
+
+def iter_regions(
+    source: Source, options: ParseOptions = DEFAULT_PARSE_OPTIONS
+) -> Iterator[TextRegion]:
+    """Yields all top-level TextRegions of a PcGts document, one at a time.
+
+    Nested regions are not yielded separately, they are contained in the
+    children of their enclosing region (unless no enclosing region is
+    selected by the options). Nothing is yielded if the document is not a
+    pagecontent file.
+
+    Parameters
+    ----------
+    source : str, pathlib.Path or binary file object
+        The PAGE-XML document to read.
+    options : page.elements.ParseOptions
+        Options for parsing each region, e.g. its depth. Lazy parsing
+        is not supported, since the consumed elements are released.
+
+    Raises
+    ------
+    PageXMLError
+        If a region does not conform to the PAGE-XML specification.
+    lxml.etree.XMLSyntaxError
+        If the document is not well-formed XML.
+    """
+
+    if options.lazy:
+        raise ValueError("lazy parsing is not supported when streaming")
+
+    for nsmap, region_xml in _iterparse(source, ("TextRegion",)):
+        parent_xml = region_xml.getparent()
+
+        if _localname(parent_xml) == "Page":
+            if options.selects_region(region_xml):
+                yield TextRegion.from_element(region_xml, nsmap, options)
+
+            _release(region_xml)
+        elif options.selects_region(region_xml) and not any(
+            options.selects_region(ancestor_xml)
+            for ancestor_xml in region_xml.iterancestors("{*}TextRegion")
+        ):
+            # a nested region takes the place of its enclosing regions if
+            # none of them is selected, see ParseOptions
+            yield TextRegion.from_element(region_xml, nsmap, options)
+            _release(region_xml)
+
+
+def iter_lines(
+    source: Source, options: ParseOptions = DEFAULT_PARSE_OPTIONS
+) -> Iterator[Line]:
+    """Yields all TextLines of a PcGts document in document order,
+    regardless of the (possibly nested) region they are contained in.
+
+    See iter_regions for a description of the parameters.
+    """
+
+    if options.lazy:
+        raise ValueError("lazy parsing is not supported when streaming")
+
+    for nsmap, xml in _iterparse(source, ("TextRegion", "TextLine")):
+        if _localname(xml) == "TextLine":
+            if options.selects_region(xml.getparent()):
+                yield Line.from_element(xml, nsmap, options)
+
+            _release(xml)
+        elif _localname(xml.getparent()) == "Page":
+            # all lines of this region have been consumed already
+            _release(xml)
+
+
+@dataclass
+class PageHeader:
+    """The id, the metadata and the attributes of the Page element of a
+    pagecontent file, see scan_header."""
+
+    pc_gts_id: Optional[str]
+    metadata: Metadata
+    image_size: Tuple[int, int]
+    image_filename: str
+
+
+def _scan_header_event(
+    event: str, xml: etree.ElementBase, root: etree.ElementBase,
+    metadata: Optional[Metadata]
+) -> Tuple[Optional[Metadata], Optional[PageHeader]]:
+    """Handles an event of a child of the PcGts element for scan_header.
+    Returns the metadata read so far, and the header once the start tag of
+    the Page element has been read."""
+
+    if event == "end" and _localname(xml) == "Metadata":
+        return Metadata.from_element(xml, root.nsmap), None
+
+    if event == "start" and _localname(xml) == "Page":
+        if metadata is None:
+            raise PageXMLError("PcGts tag is missing Metadata tag")
+
+        image_size, image_filename = Page.parse_attributes(xml)
+        return metadata, PageHeader(
+            root.get("pcGtsId"), metadata, image_size, image_filename
+        )
+
+    return metadata, None
+
+
+def scan_header(
+    source: Source, chunk_size: int = HEADER_CHUNK_SIZE
+) -> Optional[PageHeader]:
+    """Reads the header of a pagecontent file, i.e. everything up to the
+    start tag of its Page element, which usually lies within the first few
+    kilobytes. The rest of the file is neither read nor parsed. Returns None
+    if the file is not a pagecontent file.
+
+    Parameters
+    ----------
+    source : str, pathlib.Path or file object
+        The (possibly compressed) file to read.
+    chunk_size : int
+        The number of bytes which are read at once.
+    """
+
+    parser = etree.XMLPullParser(events=("start", "end"))
+
+    with ExitStack() as stack:
+        file = stack.enter_context(open_source(source))
+        if isinstance(file, (str, os.PathLike)):
+            file = stack.enter_context(open(file, "rb"))
+
+        root: Optional[etree.ElementBase] = None
+        metadata: Optional[Metadata] = None
+
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            parser.feed(chunk)
+
+            for event, xml in parser.read_events():
+                if root is None:
+                    if _localname(xml) != "PcGts":
+                        # this is not a pagecontent file
+                        return None
+
+                    root = xml
+                elif xml.getparent() is root:
+                    metadata, header = _scan_header_event(
+                        event, xml, root, metadata
+                    )
+                    if header is not None:
+                        return header
+
+        # raises an error for incomplete documents
+        parser.close()
+
+    if root is None:
+        return None
+
+    raise PageXMLError("PcGts tag does not contain a Page")
@@ -0,0 +1,242 @@
+"""Documents and elements shared by several test modules."""
+
+import random
+from lxml import etree
+
+PCGTS_DOCUMENT = b"""<PcGts>
+    <Metadata>
+        <Creator>Test Creator</Creator>
+        <Created>2021-10-21T18:37:36</Created>
+        <LastChange>1970-01-01T00:00:00</LastChange>
+    </Metadata>
+    <Page imageFilename="test.png" imageWidth="1024" imageHeight="768">
+        <TextRegion id="r0" type="paragraph">
+            <Coords points="0,0 1,1 2,2" />
+            <TextLine id="l0">
+                <Coords points="0,0 1,1 2,2" />
+                <Word id="l0_w0">
+                    <Coords points="0,0 1,1 2,2" />
+                    <Glyph id="l0_w0_g0">
+                        <Coords points="0,0 1,1" />
+                        <TextEquiv><Unicode>a</Unicode></TextEquiv>
+                    </Glyph>
+                    <TextEquiv><Unicode>a</Unicode></TextEquiv>
+                </Word>
+                <TextEquiv><Unicode>a</Unicode></TextEquiv>
+            </TextLine>
+        </TextRegion>
+        <TextRegion id="r1" type="paragraph">
+            <Coords points="2,2 1,1 0,1" />
+        </TextRegion>
+    </Page>
+</PcGts>"""
+
+RICH_DOCUMENT = """<PcGts pcGtsId="rich">
+    <Metadata>
+        <Creator>Test Creator</Creator>
+        <Created>2021-10-21T18:37:36+02:00</Created>
+        <LastChange>1970-01-01T00:00:00</LastChange>
+        <Comments>Grüße</Comments>
+    </Metadata>
+    <Page imageFilename="test.png" imageWidth="1024" imageHeight="768">
+        <ReadingOrder>
+            <OrderedGroup id="g0" caption="main">
+                <RegionRefIndexed regionRef="r0" index="0" />
+                <UnorderedGroupIndexed id="g1" index="1">
+                    <RegionRef regionRef="r1" />
+                    <OrderedGroup id="g2">
+                        <RegionRefIndexed regionRef="r2" index="-1" />
+                    </OrderedGroup>
+                </UnorderedGroupIndexed>
+            </OrderedGroup>
+        </ReadingOrder>
+        <TextRegion id="r0" type="heading">
+            <Coords points="0,0 1000,1 2,70000" />
+            <TextRegion id="r2">
+                <Coords points="5,5 6,6" />
+            </TextRegion>
+            <TextLine id="l0">
+                <Coords points="0,0 1,1 2,2" />
+                <Baseline points="0,1 2,1" />
+                <Word id="l0_w0">
+                    <Coords points="0,0 1,1 2,2" />
+                    <TextEquiv index="1" conf="0.25">
+                        <PlainText>ab</PlainText>
+                        <Unicode>ab</Unicode>
+                    </TextEquiv>
+                    <TextEquiv index="2"><Unicode>äb</Unicode></TextEquiv>
+                </Word>
+                <TextEquiv conf="1"><Unicode>ab 😀</Unicode></TextEquiv>
+            </TextLine>
+        </TextRegion>
+        <TextRegion id="r1">
+            <Coords points="2,2 1,1 0,1" />
+        </TextRegion>
+    </Page>
+</PcGts>""".encode("utf-8")
+
+# a heading and a paragraph with two lines
+LINE_DOCUMENT = b"""<PcGts pcGtsId="catalog">
+    <Metadata>
+        <Creator>Catalog</Creator>
+        <Created>2021-10-21T18:37:36</Created>
+        <LastChange>2021-10-21T18:37:36</LastChange>
+    </Metadata>
+    <Page imageFilename="scan.png" imageWidth="2000" imageHeight="3000">
+        <TextRegion id="h0" type="heading">
+            <Coords points="100,100 900,100 900,200 100,200" />
+        </TextRegion>
+        <TextRegion id="p0" type="paragraph">
+            <Coords points="100,300 900,300 900,900 100,900" />
+            <TextLine id="p0l0">
+                <Coords points="100,300 900,300 900,350 100,350" />
+                <TextEquiv><Unicode>Anno Domini 1492</Unicode></TextEquiv>
+            </TextLine>
+            <TextLine id="p0l1">
+                <Coords points="100,400 900,400 900,450 100,450" />
+                <TextEquiv><Unicode>domini nostri</Unicode></TextEquiv>
+            </TextLine>
+        </TextRegion>
+    </Page>
+</PcGts>"""
+
+# the words of the first line are indexed, the second line has no words
+WORD_DOCUMENT = b"""<PcGts>
+    <Metadata>
+        <Creator>Test</Creator>
+        <Created>2021-10-21T18:37:36</Created>
+        <LastChange>2021-10-21T18:37:36</LastChange>
+    </Metadata>
+    <Page imageFilename="test.png" imageWidth="1000" imageHeight="1000">
+        <TextRegion id="r0">
+            <Coords points="0,0 500,0 500,500 0,500" />
+            <TextRegion id="r1">
+                <Coords points="0,0 500,0 500,100 0,100" />
+                <TextLine id="l0">
+                    <Coords points="0,0 500,0 500,50 0,50" />
+                    <Word id="w0">
+                        <Coords points="0,0 100,0 100,50 0,50" />
+                        <TextEquiv><Unicode>Anno</Unicode></TextEquiv>
+                    </Word>
+                    <Word id="w1">
+                        <Coords points="120,0 200,0 200,50 120,50" />
+                    </Word>
+                    <Word id="w2">
+                        <Coords points="220,0 300,0 300,50 220,50" />
+                        <TextEquiv><Unicode>DOMINI,</Unicode></TextEquiv>
+                    </Word>
+                    <Word id="w3">
+                        <Coords points="320,0 480,0 480,50 320,50" />
+                        <TextEquiv><Unicode>\xef\xac\x81nis-terrae</Unicode>
+                        </TextEquiv>
+                    </Word>
+                    <TextEquiv><Unicode>ignored</Unicode></TextEquiv>
+                </TextLine>
+            </TextRegion>
+            <TextLine id="l1">
+                <Coords points="0,200 500,200 500,250 0,250" />
+                <TextEquiv><Unicode>domini anno</Unicode></TextEquiv>
+            </TextLine>
+        </TextRegion>
+    </Page>
+</PcGts>"""
+
+# a region with two lines, the second line is a triangle
+SPATIAL_DOCUMENT = b"""<PcGts pcGtsId="spatial">
+    <Metadata>
+        <Creator>Test</Creator>
+        <Created>2021-10-21T18:37:36</Created>
+        <LastChange>2021-10-21T18:37:36</LastChange>
+    </Metadata>
+    <Page imageFilename="test.png" imageWidth="1000" imageHeight="1000">
+        <TextRegion id="r0">
+            <Coords points="0,0 500,0 500,500 0,500" />
+            <TextLine id="l0">
+                <Coords points="10,10 490,10 490,50 10,50" />
+                <Word id="w0">
+                    <Coords points="10,10 100,10 100,50 10,50" />
+                    <Glyph id="g0">
+                        <Coords points="10,10 40,10 40,50 10,50" />
+                    </Glyph>
+                </Word>
+                <Word id="w1">
+                    <Coords points="200,10 300,10 300,50 200,50" />
+                </Word>
+            </TextLine>
+            <TextLine id="l1">
+                <Coords points="100,100 400,100 100,400" />
+            </TextLine>
+        </TextRegion>
+        <TextRegion id="r1">
+            <Coords points="600,600 900,600 900,900 600,900" />
+        </TextRegion>
+    </Page>
+</PcGts>"""
+
+INDEXED_TEXT_LINE = etree.XML(
+    """<TextLine id="l0">
+        <Coords points="0,0 1,1 2,2" />
+        <TextEquiv index="0">
+            <Unicode>text alternative 1</Unicode>
+        </TextEquiv>
+        <TextEquiv index="1">
+            <Unicode>text alternative 2</Unicode>
+        </TextEquiv>
+    </TextLine>"""
+)
+
+INDEXED_WORD_WITH_GLYPHS = etree.XML(
+    """<Word id="w3">
+        <Coords points="3421,2358 932,182 8345,3482 1392,4738" />
+        <Glyph id="w3g0">
+            <Coords points="0,0 1,1" />
+            <TextEquiv index="0"><Unicode>a</Unicode></TextEquiv>
+            <TextEquiv index="1"><Unicode>c</Unicode></TextEquiv>
+        </Glyph>
+        <Glyph id="w3g1">
+            <Coords points="0,0 1,1" />
+            <TextEquiv index="0"><Unicode>b</Unicode></TextEquiv>
+            <TextEquiv index="1"><Unicode>b</Unicode></TextEquiv>
+        </Glyph>
+        <Glyph id="w3g2">
+            <Coords points="0,0 1,1" />
+            <TextEquiv index="0"><Unicode>c</Unicode></TextEquiv>
+            <TextEquiv index="1"><Unicode>a</Unicode></TextEquiv>
+        </Glyph>
+        <TextEquiv index="0">
+            <Unicode>abc</Unicode>
+        </TextEquiv>
+        <TextEquiv index="1">
+            <Unicode>cba</Unicode>
+        </TextEquiv>
+    </Word>"""
+)
+
+
+def random_page(rng: random.Random, regions: int) -> bytes:
+    def polygon():
+        x, y = rng.randrange(0, 1000), rng.randrange(0, 1000)
+        return " ".join(
+            f"{x + rng.randrange(0, 80)},{y + rng.randrange(0, 80)}"
+            for _ in range(rng.randrange(3, 7))
+        )
+
+    out = [
+        '<PcGts><Metadata><Creator>x</Creator>'
+        '<Created>2021-10-21T18:37:36</Created>'
+        '<LastChange>2021-10-21T18:37:36</LastChange></Metadata>'
+        '<Page imageFilename="a.png" imageWidth="1100" imageHeight="1100">'
+    ]
+
+    for r in range(regions):
+        out.append(f'<TextRegion id="r{r}"><Coords points="{polygon()}"/>')
+        for li in range(3):
+            out.append(
+                f'<TextLine id="r{r}l{li}"><Coords points="{polygon()}"/>'
+                f'<Word id="r{r}l{li}w0"><Coords points="{polygon()}"/>'
+                '</Word></TextLine>'
+            )
+        out.append("</TextRegion>")
+
+    out.append("</Page></PcGts>")
+    return "".join(out).encode("utf-8")
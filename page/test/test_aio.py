@@ -0,0 +1,114 @@
+import asyncio
+import io
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from lxml import etree
+from page import aio
+from page.elements import PcGts, ParseOptions
+from page.test.fixtures import PCGTS_DOCUMENT
+
+
+class TestAsyncIO(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "test.xml")
+
+        with open(self.path, "wb") as file:
+            file.write(PCGTS_DOCUMENT)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_aload(self):
+        pcgts = asyncio.run(PcGts.aload(self.path))
+        self.assertEqual(pcgts, PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT)))
+
+    def test_aload_chunks(self):
+        expected = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT))
+
+        for chunk_size in (1, 100):
+            pcgts = asyncio.run(PcGts.aload(self.path, chunk_size=chunk_size))
+            self.assertEqual(pcgts, expected)
+
+        other_path = os.path.join(self.tmp_dir.name, "other.xml")
+        with open(other_path, "wb") as file:
+            file.write(b"<Other />")
+        self.assertIsNone(asyncio.run(PcGts.aload(other_path)))
+
+    def test_aload_off_loop(self):
+        feed = aio._feed
+        threads = set()
+
+        def record(*args):
+            threads.add(threading.get_ident())
+            feed(*args)
+
+        with mock.patch.object(aio, "_feed", side_effect=record):
+            pcgts = asyncio.run(PcGts.aload(self.path, chunk_size=100))
+
+        # all chunks are parsed by one thread, which is not the loop's
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertEqual(pcgts, PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT)))
+
+    def test_aload_process_pool(self):
+        with ProcessPoolExecutor(1) as executor:
+            pcgts = asyncio.run(PcGts.aload(self.path, executor=executor))
+
+        self.assertEqual(pcgts, PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT)))
+
+    def test_aload_many_with_limit(self):
+        async def load_all():
+            limit = asyncio.Semaphore(2)
+
+            with ThreadPoolExecutor(2) as executor:
+                return await asyncio.gather(*[
+                    PcGts.aload(
+                        self.path, ParseOptions(point_arrays=False),
+                        executor=executor, limit=limit
+                    )
+                    for _ in range(10)
+                ])
+
+        results = asyncio.run(load_all())
+        self.assertEqual(len(results), 10)
+
+        for pcgts in results:
+            self.assertEqual(pcgts, results[0])
+
+    def test_aload_errors(self):
+        syntax_error_path = os.path.join(self.tmp_dir.name, "invalid.xml")
+
+        with open(syntax_error_path, "wb") as file:
+            file.write(b"<PcGts>")
+
+        self.assertRaises(
+            etree.XMLSyntaxError,
+            lambda: asyncio.run(PcGts.aload(syntax_error_path))
+        )
+        self.assertRaises(
+            OSError,
+            lambda: asyncio.run(PcGts.aload(self.path + ".missing"))
+        )
+
+        with open(syntax_error_path, "wb") as file:
+            file.write(b"")
+
+        self.assertRaises(
+            etree.XMLSyntaxError,
+            lambda: asyncio.run(PcGts.aload(syntax_error_path))
+        )
+
+    def test_asave(self):
+        pcgts = PcGts.from_file(self.path)
+        out_path = os.path.join(self.tmp_dir.name, "out.xml")
+        asyncio.run(pcgts.asave(out_path))
+
+        with open(out_path, "rb") as file:
+            self.assertEqual(file.read(), pcgts.to_bytes())
+
+        self.assertEqual(asyncio.run(PcGts.aload(out_path)), pcgts)
@@ -0,0 +1,135 @@
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+from lxml import etree
+from page.archive import iter_archive, archive_members
+from page.archive import UnsupportedMemberError
+from page.compression import compress, GZIP
+from page.elements import PcGts
+from page.test.fixtures import PCGTS_DOCUMENT, RICH_DOCUMENT
+
+MEMBERS = {
+    "a.xml": PCGTS_DOCUMENT,
+    "pages/b.xml": RICH_DOCUMENT,
+    "pages/c.xml.gz": compress(RICH_DOCUMENT, GZIP),
+    "pages/broken.xml": b"<PcGts><Page>",
+    "readme.txt": b"not a page",
+}
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.zip_path = os.path.join(self.tmp_dir.name, "corpus.zip")
+        self.tar_path = os.path.join(self.tmp_dir.name, "corpus.tar.gz")
+
+        with zipfile.ZipFile(self.zip_path, "w") as archive:
+            archive.writestr("pages/", b"")
+            for name, content in MEMBERS.items():
+                archive.writestr(name, content)
+
+        with tarfile.open(self.tar_path, "w:gz") as archive:
+            for name, content in MEMBERS.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+
+        self.expected = {
+            name: PcGts.from_file(io.BytesIO(content))
+            for name, content in MEMBERS.items()
+            if name.endswith((".xml", ".gz")) and "broken" not in name
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def check(self, results, pattern_names):
+        results = list(results)
+        self.assertEqual([result.path for result in results], pattern_names)
+
+        for result in results:
+            if result.path == "pages/broken.xml":
+                self.assertIsInstance(result.error, etree.XMLSyntaxError)
+            else:
+                self.assertIsNone(result.error)
+                self.assertEqual(result.pcgts, self.expected[result.path])
+
+    def test_default_pattern(self):
+        names = ["a.xml", "pages/b.xml", "pages/broken.xml"]
+
+        for path in (self.zip_path, self.tar_path):
+            self.assertEqual(archive_members(path), names)
+            self.check(iter_archive(path), names)
+
+    def test_pattern(self):
+        names = ["pages/b.xml", "pages/c.xml.gz"]
+
+        for path in (self.zip_path, self.tar_path):
+            self.check(iter_archive(path, "pages/[bc].xml*"), names)
+
+    def test_parallel_zip(self):
+        names = ["a.xml", "pages/b.xml", "pages/c.xml.gz", "pages/broken.xml"]
+        self.check(
+            iter_archive(self.zip_path, "*.xml*", workers=2, chunksize=1),
+            names
+        )
+
+        results = iter_archive(
+            self.zip_path, "*.xml*", workers=2, chunksize=1, ordered=False
+        )
+        self.assertEqual(
+            sorted(result.path for result in results), sorted(names)
+        )
+
+    def test_broken_zip_members(self):
+        path = os.path.join(self.tmp_dir.name, "broken.zip")
+
+        with zipfile.ZipFile(path, "w") as archive:
+            for name in ("crc.xml", "encrypted.xml", "method.xml", "z.xml"):
+                archive.writestr(name, PCGTS_DOCUMENT)
+
+        with open(path, "rb") as file:
+            data = bytearray(file.read())
+
+        # the local headers (signature PK\3\4) and the central directory
+        # entries (PK\1\2) of the members, in the same order
+        local = [i for i in range(len(data)) if data[i:i + 4] == b"PK\3\4"]
+        central = [i for i in range(len(data)) if data[i:i + 4] == b"PK\1\2"]
+
+        # a modified byte of the stored content breaks the CRC
+        start = data.index(b"Test Creator", local[0])
+        data[start] = ord("X")
+        # the encryption flag
+        data[local[1] + 6] |= 1
+        data[central[1] + 8] |= 1
+        # an unknown compression method
+        data[local[2] + 8] = data[central[2] + 10] = 99
+
+        with open(path, "wb") as file:
+            file.write(data)
+
+        results = list(iter_archive(path))
+        self.assertEqual(
+            [type(result.error) for result in results],
+            [
+                zipfile.BadZipFile, UnsupportedMemberError,
+                UnsupportedMemberError, type(None)
+            ]
+        )
+        self.assertEqual(results[3].pcgts, self.expected["a.xml"])
+
+        # other errors are not mistaken for broken members
+        with mock.patch.object(PcGts, "from_file", side_effect=RecursionError):
+            self.assertRaises(RecursionError, list, iter_archive(path))
+
+    def test_not_an_archive(self):
+        path = os.path.join(self.tmp_dir.name, "page.xml")
+        with open(path, "wb") as file:
+            file.write(PCGTS_DOCUMENT)
+
+        self.assertRaises(ValueError, lambda: iter_archive(path))
+        self.assertRaises(ValueError, lambda: archive_members(path))
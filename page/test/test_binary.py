@@ -0,0 +1,159 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+from page.binary import MAGIC, _decode_varints, _encode_varints
+from page.cache import cache_path
+from page.elements import PcGts, ParseOptions
+from page.elements.point import np
+from page.exceptions import PageXMLError
+from page.test.fixtures import PCGTS_DOCUMENT, RICH_DOCUMENT
+
+
+def load(document: bytes, point_arrays: bool = False) -> PcGts:
+    options = ParseOptions(point_arrays=point_arrays)
+    return PcGts.from_file(io.BytesIO(document), options)
+
+
+class TestBinary(unittest.TestCase):
+    def test_round_trip(self):
+        for document in (PCGTS_DOCUMENT, RICH_DOCUMENT):
+            pcgts = load(document)
+            data = pcgts.to_binary()
+            self.assertTrue(data.startswith(MAGIC))
+            self.assertEqual(PcGts.from_binary(data), pcgts)
+
+    def test_round_trip_preserves_classes(self):
+        pcgts = load(RICH_DOCUMENT)
+        decoded = PcGts.from_binary(pcgts.to_binary())
+        word = decoded.page.regions[0].lines[0].words[0]
+        expected_word = pcgts.page.regions[0].lines[0].words[0]
+        self.assertEqual(type(word), type(expected_word))
+        self.assertEqual([t.unicode for t in word.texts()], ["ab", "äb"])
+        self.assertEqual(
+            type(decoded.page.reading_order.root.children[1]),
+            type(pcgts.page.reading_order.root.children[1])
+        )
+        self.assertEqual(decoded.metadata.created, pcgts.metadata.created)
+
+    def test_lazy_document(self):
+        lazy = PcGts.from_file(
+            io.BytesIO(RICH_DOCUMENT), ParseOptions(lazy=True)
+        )
+        self.assertEqual(
+            PcGts.from_binary(lazy.to_binary()), load(RICH_DOCUMENT)
+        )
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_point_arrays(self):
+        pcgts = load(RICH_DOCUMENT)
+        decoded = PcGts.from_binary(pcgts.to_binary(), point_arrays=True)
+        coords = decoded.page.regions[0].coords
+        self.assertTrue(coords.is_array())
+        self.assertEqual(coords.points.shape, (3, 2))
+        self.assertEqual(decoded, pcgts)
+
+        # arrays are encoded just like lists of points
+        arrays = load(RICH_DOCUMENT, point_arrays=True)
+        self.assertEqual(arrays.to_binary(), pcgts.to_binary())
+
+    def test_varints(self):
+        values = [0, 1, 127, 128, 300, 2 ** 35, 5]
+        data = _encode_varints(values)
+        self.assertEqual(_decode_varints(data), values)
+
+        with mock.patch("page.binary.np", None):
+            self.assertEqual(_decode_varints(data), values)
+
+    def test_invalid_data(self):
+        data = load(RICH_DOCUMENT).to_binary()
+
+        for invalid in (b"", b"<PcGts />", data[:len(data) // 2]):
+            with self.assertRaises(PageXMLError):
+                PcGts.from_binary(invalid)
+
+        other_version = data[:4] + bytes([data[4] + 1]) + data[5:]
+        with self.assertRaises(PageXMLError):
+            PcGts.from_binary(other_version)
+
+
+class TestFromFileCached(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = self.write("page.xml", RICH_DOCUMENT)
+        self.expected = load(RICH_DOCUMENT)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "wb") as file:
+            file.write(content)
+
+        return path
+
+    def test_cache_next_to_file(self):
+        cache_file = cache_path(self.path)
+        self.assertEqual(str(cache_file), self.path + ".pgbin")
+
+        self.assertEqual(PcGts.from_file_cached(self.path), self.expected)
+        self.assertTrue(cache_file.exists())
+        self.assertEqual(PcGts.from_file_cached(self.path), self.expected)
+
+    def test_cache_dir(self):
+        cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        pcgts = PcGts.from_file_cached(self.path, cache_dir)
+        self.assertEqual(pcgts, self.expected)
+        self.assertEqual(os.listdir(cache_dir), [
+            cache_path(self.path, cache_dir).name
+        ])
+        self.assertFalse(os.path.exists(cache_path(self.path)))
+        self.assertEqual(
+            PcGts.from_file_cached(self.path, cache_dir), self.expected
+        )
+
+    def test_uses_cache(self):
+        PcGts.from_file_cached(self.path)
+
+        # a cached document is loaded even though the source file is now
+        # invalid, as long as its mtime and size are unchanged
+        stat = os.stat(self.path)
+        self.write("page.xml", b"x" * stat.st_size)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(PcGts.from_file_cached(self.path), self.expected)
+
+    def test_invalidated_on_change(self):
+        PcGts.from_file_cached(self.path)
+        self.write("page.xml", PCGTS_DOCUMENT)
+        self.assertEqual(
+            PcGts.from_file_cached(self.path), load(PCGTS_DOCUMENT)
+        )
+
+    def test_corrupt_cache_file(self):
+        PcGts.from_file_cached(self.path)
+
+        with open(cache_path(self.path), "r+b") as file:
+            file.truncate(100)
+
+        self.assertEqual(PcGts.from_file_cached(self.path), self.expected)
+        self.assertEqual(PcGts.from_file_cached(self.path), self.expected)
+
+    def test_not_pcgts(self):
+        path = self.write("other.xml", b"<Other />")
+        self.assertIsNone(PcGts.from_file_cached(path))
+        self.assertFalse(cache_path(path).exists())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_point_arrays(self):
+        # by default, points are loaded as arrays if numpy is installed
+        for point_arrays in (True, None, None, False):
+            pcgts = PcGts.from_file_cached(
+                self.path, point_arrays=point_arrays
+            )
+            self.assertEqual(
+                pcgts.page.regions[0].coords.is_array(),
+                point_arrays is not False
+            )
+            self.assertEqual(pcgts, self.expected)
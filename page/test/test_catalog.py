@@ -0,0 +1,155 @@
+import os
+import tempfile
+import unittest
+from page.catalog import Catalog, LineHit
+from page.test.fixtures import LINE_DOCUMENT, PCGTS_DOCUMENT
+
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = self.tmp_dir.name
+        self.first = self.write("a/first.xml", LINE_DOCUMENT)
+        self.second = self.write("b/second.xml", PCGTS_DOCUMENT)
+        self.catalog = Catalog()
+
+    def tearDown(self):
+        self.catalog.close()
+        self.tmp_dir.cleanup()
+
+    def write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(content)
+
+        return path
+
+    def test_update(self):
+        result = self.catalog.update_directory(self.root)
+        self.assertEqual((result.added, result.unchanged), (2, 0))
+        self.assertEqual(self.catalog.paths(), [self.first, self.second])
+
+        result = self.catalog.update_directory(self.root)
+        self.assertEqual((result.added, result.unchanged), (0, 2))
+
+        # a modified file is parsed again (the size changes as well, in case
+        # the file system has a coarse modification time)
+        self.write(
+            "a/first.xml", LINE_DOCUMENT.replace(b"Catalog", b"Changed!")
+        )
+        result = self.catalog.update_directory(self.root)
+        self.assertEqual((result.updated, result.unchanged), (1, 1))
+        self.assertEqual(self.catalog.find_documents("Changed!"), [self.first])
+        self.assertEqual(len(self.catalog.find_lines("domini")), 2)
+
+        # a deleted file is removed
+        os.remove(self.second)
+        result = self.catalog.update_directory(self.root)
+        self.assertEqual((result.removed, result.unchanged), (1, 1))
+        self.assertEqual(self.catalog.paths(), [self.first])
+
+    def test_duplicate_paths(self):
+        relative = os.path.relpath(self.first)
+        dotted = os.path.join(os.path.dirname(self.first), ".", "first.xml")
+
+        result = self.catalog.update([self.first, relative, dotted])
+        self.assertEqual((result.added, result.failed), (1, []))
+        self.assertEqual(self.catalog.paths(), [self.first])
+
+    def test_failed(self):
+        broken = self.write("broken.xml", b"<PcGts><Page>")
+        other = self.write("other.xml", b"<Other />")
+        missing = os.path.join(self.root, "missing.xml")
+        no_width = self.write(
+            "no_width.xml", PCGTS_DOCUMENT.replace(b' imageWidth="1024"', b"")
+        )
+
+        result = self.catalog.update(
+            [self.first, broken, other, missing, no_width]
+        )
+        self.assertEqual(result.added, 1)
+        self.assertEqual(
+            sorted(failed.path for failed in result.failed),
+            sorted([broken, other, missing, no_width])
+        )
+        self.assertEqual(len(self.catalog), 1)
+
+        # a cataloged file which becomes broken is removed
+        self.write("a/first.xml", b"<PcGts><Page>")
+        result = self.catalog.update([self.first])
+        self.assertEqual(len(result.failed), 1)
+        self.assertEqual(len(self.catalog), 0)
+
+    def test_find_documents(self):
+        self.catalog.update([self.first, self.second])
+        find = self.catalog.find_documents
+
+        self.assertEqual(find(), [self.first, self.second])
+        self.assertEqual(find(creator="Test Creator"), [self.second])
+        self.assertEqual(find(min_size=(1500, 1500)), [self.first])
+        self.assertEqual(find(max_size=(1500, 1500)), [self.second])
+        self.assertEqual(find(region_type="heading"), [self.first])
+        self.assertEqual(find(min_lines=2), [self.first])
+        self.assertEqual(find(text='"anno domini"'), [self.first])
+        self.assertEqual(find(text="a"), [self.second])
+        self.assertEqual(find(creator="Catalog", text="a"), [])
+
+    def test_find_regions(self):
+        self.catalog.update([self.first, self.second])
+
+        hits = self.catalog.find_regions(region_type="heading")
+        self.assertEqual([hit.region_id for hit in hits], ["h0"])
+        self.assertEqual(hits[0].bbox, (100, 100, 900, 200))
+        self.assertEqual(hits[0].path, self.first)
+
+        hits = self.catalog.find_regions(bbox=(0, 250, 1000, 260))
+        self.assertEqual(hits, [])
+        hits = self.catalog.find_regions(bbox=(0, 0, 150, 150))
+        self.assertEqual(
+            [hit.region_id for hit in hits], ["h0", "r0", "r1"]
+        )
+        hits = self.catalog.find_regions(path=self.second)
+        self.assertEqual([hit.region_id for hit in hits], ["r0", "r1"])
+
+    def test_find_lines(self):
+        self.catalog.update([self.first, self.second])
+
+        self.assertEqual(
+            self.catalog.find_lines("domini"),
+            [
+                LineHit(
+                    self.first, "p0", "p0l0", (100, 300, 900, 350),
+                    "Anno Domini 1492"
+                ),
+                LineHit(
+                    self.first, "p0", "p0l1", (100, 400, 900, 450),
+                    "domini nostri"
+                )
+            ]
+        )
+        self.assertEqual(len(self.catalog.find_lines("domini", limit=1)), 1)
+        self.assertEqual(
+            [hit.line_id for hit in self.catalog.find_lines(
+                "domini", bbox=(0, 420, 1000, 1000)
+            )],
+            ["p0l1"]
+        )
+        self.assertEqual(len(self.catalog.find_lines(path=self.second)), 1)
+
+    def test_remove(self):
+        self.catalog.update([self.first, self.second])
+        self.assertTrue(self.catalog.remove(self.first))
+        self.assertFalse(self.catalog.remove(self.first))
+        self.assertEqual(self.catalog.find_lines("domini"), [])
+        self.assertEqual(self.catalog.paths(), [self.second])
+
+    def test_persistent(self):
+        path = os.path.join(self.root, "catalog.sqlite")
+        with Catalog(path) as catalog:
+            catalog.update([self.first])
+
+        with Catalog(path) as catalog:
+            self.assertEqual(catalog.paths(), [self.first])
+            result = catalog.update([self.first])
+            self.assertEqual(result.unchanged, 1)
@@ -0,0 +1,48 @@
+import unittest
+from lxml import etree
+from page.elements.children import group_children, first_child
+from page.elements import Line
+from page.constants import DEFAULT_NAMESPACE_MAP
+
+NAMESPACED_LINE = etree.XML(
+    """<TextLine xmlns="%s" xmlns:other="urn:other" id="l0">
+        <!-- a comment -->
+        <Coords points="0,0 1,1 2,2" />
+        <other:Coords points="9,9 9,9" />
+        <Word id="l0_w0"><Coords points="0,0 1,1" /></Word>
+        <TextEquiv><Unicode>first</Unicode></TextEquiv>
+        <Word id="l0_w1"><Coords points="0,0 1,1" /></Word>
+    </TextLine>""" % DEFAULT_NAMESPACE_MAP[None]
+)
+
+
+class TestGroupChildren(unittest.TestCase):
+    def test_group_children(self):
+        children = group_children(
+            NAMESPACED_LINE, NAMESPACED_LINE.nsmap, Line._CHILD_TAGS
+        )
+
+        self.assertEqual(len(children["Coords"]), 1)
+        self.assertEqual(children["Coords"][0].get("points"), "0,0 1,1 2,2")
+        self.assertEqual(
+            [xml.get("id") for xml in children["Word"]], ["l0_w0", "l0_w1"]
+        )
+        self.assertEqual(len(children["TextEquiv"]), 1)
+        self.assertIsNone(first_child(children, "Baseline"))
+
+    def test_equivalent_to_findall(self):
+        for nsmap in [NAMESPACED_LINE.nsmap, {}]:
+            children = group_children(
+                NAMESPACED_LINE, nsmap, Line._CHILD_TAGS
+            )
+
+            for name in Line._CHILD_TAGS:
+                self.assertEqual(
+                    children[name],
+                    NAMESPACED_LINE.findall(f"./{name}", nsmap)
+                )
+
+    def test_parse_namespaced_line(self):
+        line = Line.from_element(NAMESPACED_LINE, NAMESPACED_LINE.nsmap)
+        self.assertEqual(len(line.words), 2)
+        self.assertEqual(line.text.unicode, "first")
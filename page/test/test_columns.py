@@ -0,0 +1,129 @@
+import io
+import math
+import os
+import tempfile
+import unittest
+from page.elements import PcGts, ParseOptions, Line, Word, Glyph
+from page.elements import Coordinates
+from page.elements.point import np
+from page.columns import Columns, StringColumn, corpus_columns
+from page.test.fixtures import LINE_DOCUMENT, PCGTS_DOCUMENT, WORD_DOCUMENT
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestColumns(unittest.TestCase):
+    def setUp(self):
+        self.words = PcGts.from_file(io.BytesIO(WORD_DOCUMENT))
+        self.lines = PcGts.from_file(io.BytesIO(LINE_DOCUMENT))
+
+    def test_lines(self):
+        columns = self.words.page.to_columns(key="words")
+
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(columns.documents.tolist(), ["words"])
+        self.assertEqual(columns.document.tolist(), [0, 0])
+        self.assertEqual(columns.ids.tolist(), ["l0", "l1"])
+        # the line of the nested region comes first
+        self.assertEqual(columns.parent_ids.tolist(), ["r1", "r0"])
+        self.assertEqual(columns.min_y.tolist(), [0, 200])
+        self.assertEqual(columns.max_x.tolist(), [500, 500])
+        self.assertEqual(columns.texts.tolist(), ["ignored", "domini anno"])
+        self.assertTrue(np.isnan(columns.conf).all())
+        self.assertEqual(
+            columns.polygon(1).tolist(),
+            [[0, 200], [500, 200], [500, 250], [0, 250]]
+        )
+
+    def test_words(self):
+        columns = self.words.page.to_columns(Word)
+
+        self.assertEqual(columns.ids.tolist(), ["w0", "w1", "w2", "w3"])
+        self.assertEqual(columns.parent_ids.tolist(), ["l0"] * 4)
+        self.assertEqual(columns.texts[1], None)
+        self.assertEqual(columns.texts[3], "ﬁnis-terrae")
+        self.assertEqual(columns.min_x.tolist(), [0, 120, 220, 320])
+
+    def test_glyphs(self):
+        page = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT)).page
+        columns = page.to_columns(Glyph)
+
+        self.assertEqual(columns.ids.tolist(), ["l0_w0_g0"])
+        self.assertEqual(columns.parent_ids.tolist(), ["l0_w0"])
+        self.assertEqual(columns.texts.tolist(), ["a"])
+        self.assertRaises(ValueError, lambda: page.to_columns(PcGts))
+
+    def test_corpus(self):
+        columns = corpus_columns([("a", self.words), ("b", self.lines.page)])
+
+        self.assertEqual(columns.documents.tolist(), ["a", "b"])
+        self.assertEqual(columns.document.tolist(), [0, 0, 1, 1])
+        self.assertEqual(
+            columns.point_offsets.tolist(), [0, 4, 8, 12, 16]
+        )
+        self.assertEqual(
+            columns.to_dict()["document"].tolist(), ["a", "a", "b", "b"]
+        )
+
+        # the same columns from point arrays
+        arrays = PcGts.from_file(
+            io.BytesIO(LINE_DOCUMENT), ParseOptions(point_arrays=True)
+        )
+        mixed = corpus_columns([("a", self.words), ("b", arrays)])
+        self.assertTrue(np.array_equal(mixed.points, columns.points))
+
+        empty = corpus_columns([])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.points.shape, (0, 2))
+
+    def test_conf(self):
+        line = self.lines.page.regions[1].lines[0]
+        line.text.conf = 0.5
+        columns = self.lines.page.to_columns(Line)
+        self.assertEqual(columns.conf[0], 0.5)
+        self.assertTrue(math.isnan(columns.conf[1]))
+
+    def test_save(self):
+        columns = corpus_columns([("a", self.words), ("b", self.lines)])
+        expected = columns.to_dict()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "lines.npz")
+            columns.save(path)
+
+            for mmap in (True, False):
+                loaded = Columns.load(path, mmap)
+                self.assertEqual(isinstance(loaded.points, np.memmap), mmap)
+
+                for name, values in loaded.to_dict().items():
+                    np.testing.assert_array_equal(values, expected[name])
+
+                self.assertTrue(
+                    np.array_equal(loaded.points, columns.points)
+                )
+                self.assertEqual(loaded.texts[2], "Anno Domini 1492")
+                del loaded
+
+            # arrays of compressed files are read into memory
+            with np.load(path) as npz:
+                np.savez_compressed(path, **dict(npz))
+            loaded = Columns.load(path)
+            self.assertEqual(loaded.ids.tolist(), columns.ids.tolist())
+
+    def test_empty_polygons(self):
+        words = self.words.page.regions[0].children[0].lines[0].words
+        for index in (1, 3):
+            words[index].coords = Coordinates([])
+
+        columns = self.words.page.to_columns(Word)
+        self.assertEqual(columns.min_x.tolist(), [0, 0, 220, 0])
+        self.assertEqual(columns.max_y.tolist(), [50, 0, 50, 0])
+        self.assertEqual(columns.point_offsets.tolist(), [0, 4, 4, 8, 8])
+        self.assertEqual(columns.polygon(1).shape, (0, 2))
+
+    def test_string_column(self):
+        strings = ["", None, "äb", "c"]
+        column = StringColumn.from_strings(strings)
+        self.assertEqual(len(column), 4)
+        self.assertEqual(column.tolist(), strings)
+        self.assertEqual([column[i] for i in range(4)], strings)
+        self.assertEqual(column.offsets.tolist(), [0, 0, 0, 3, 4])
@@ -0,0 +1,123 @@
+import asyncio
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from page.compression import detect_compression, compression_from_suffix
+from page.compression import compress, ChunkDecompressor, GZIP, BZ2, XZ
+from page.elements import PcGts
+from page.stream import iter_regions
+from page.test.fixtures import RICH_DOCUMENT
+
+SUFFIXES = {GZIP: ".xml.gz", BZ2: ".xml.bz2", XZ: ".xml.xz"}
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.pcgts = PcGts.from_file(io.BytesIO(RICH_DOCUMENT))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def path(self, name: str) -> Path:
+        return Path(self.tmp_dir.name) / name
+
+    def save(self, compression: str, **kwargs) -> Path:
+        path = self.path("page" + SUFFIXES[compression])
+        self.pcgts.save_to_file(path, **kwargs)
+        return path
+
+    def test_compression_from_suffix(self):
+        self.assertEqual(compression_from_suffix("a.xml.gz"), GZIP)
+        self.assertEqual(compression_from_suffix(Path("a.XML.BZ2")), BZ2)
+        self.assertEqual(compression_from_suffix("a.xml.xz"), XZ)
+        self.assertIsNone(compression_from_suffix("a.xml"))
+        self.assertIsNone(compression_from_suffix("gz"))
+
+    def test_round_trip(self):
+        for compression in SUFFIXES:
+            path = self.save(compression)
+
+            with path.open("rb") as file:
+                self.assertEqual(detect_compression(file.read(6)), compression)
+
+            self.assertEqual(PcGts.from_file(path), self.pcgts)
+            self.assertEqual(PcGts.from_file(str(path)), self.pcgts)
+
+            with path.open("rb") as file:
+                self.assertEqual(PcGts.from_file(file), self.pcgts)
+
+    def test_detected_by_content(self):
+        for compression in SUFFIXES:
+            misnamed = self.path(f"{compression}.xml")
+            shutil.copy(self.save(compression), misnamed)
+            self.assertEqual(PcGts.from_file(misnamed), self.pcgts)
+
+    def test_uncompressed(self):
+        path = self.path("page.xml")
+        self.pcgts.save_to_file(path)
+        self.assertIsNone(detect_compression(path.read_bytes()))
+        self.assertEqual(PcGts.from_file(path), self.pcgts)
+
+        with path.open("rb", buffering=0) as file:
+            self.assertEqual(PcGts.from_file(file), self.pcgts)
+
+    def test_compresslevel(self):
+        fast = self.save(GZIP, compresslevel=1).read_bytes()
+        best = self.save(GZIP, compresslevel=9).read_bytes()
+        self.assertNotEqual(fast, best)
+        # the output is reproducible
+        self.assertEqual(self.save(GZIP).read_bytes(), best)
+
+    def test_stream(self):
+        for compression in SUFFIXES:
+            regions = list(iter_regions(self.save(compression)))
+            self.assertEqual(regions, self.pcgts.page.regions)
+
+    def test_aio(self):
+        for compression in SUFFIXES:
+            path = self.path("async" + SUFFIXES[compression])
+            asyncio.run(self.pcgts.asave(path))
+
+            with path.open("rb") as file:
+                self.assertEqual(detect_compression(file.read(6)), compression)
+
+            self.assertEqual(asyncio.run(PcGts.aload(path)), self.pcgts)
+            self.assertEqual(
+                asyncio.run(PcGts.aload(path, chunk_size=5)), self.pcgts
+            )
+
+    def test_chunk_decompressor(self):
+        for compression in [None, GZIP, BZ2, XZ]:
+            # two concatenated streams
+            data = compress(RICH_DOCUMENT, compression) * 2
+
+            for chunk_size in (1, 7, len(data)):
+                decompressor = ChunkDecompressor()
+                parts = [
+                    decompressor.decompress(data[start:start + chunk_size])
+                    for start in range(0, len(data), chunk_size)
+                ]
+                parts.append(decompressor.flush())
+                self.assertEqual(b"".join(parts), RICH_DOCUMENT * 2)
+
+            if compression is not None:
+                decompressor = ChunkDecompressor()
+                decompressor.decompress(data[:len(data) // 2 - 1])
+                self.assertRaises(EOFError, decompressor.flush)
+
+        # data shorter than the magic bytes
+        decompressor = ChunkDecompressor()
+        self.assertEqual(decompressor.decompress(b"<a"), b"")
+        self.assertEqual(decompressor.flush(), b"<a")
+
+    def test_cached(self):
+        path = self.save(GZIP)
+
+        for _ in range(2):
+            self.assertEqual(PcGts.from_file_cached(path), self.pcgts)
+
+        self.assertTrue(os.path.exists(str(path) + ".pgbin"))
@@ -0,0 +1,120 @@
+import io
+import pickle
+import unittest
+from page.elements import PcGts, ParseOptions, Line, Text, Coordinates
+from page.elements import Point, content_hash, invalidate_content_hash
+from page.elements import content_equal
+from page.elements.content_hash import DIGEST_SIZE
+from page.elements.point import np
+from page.test.fixtures import INDEXED_TEXT_LINE, SPATIAL_DOCUMENT
+
+
+def load(options: ParseOptions = ParseOptions()) -> PcGts:
+    return PcGts.from_file(io.BytesIO(SPATIAL_DOCUMENT), options)
+
+
+class TestContentHash(unittest.TestCase):
+    def setUp(self):
+        self.page = load().page
+        self.other = load().page
+
+    def test_equal_content(self):
+        self.assertEqual(len(content_hash(self.page)), DIGEST_SIZE)
+        self.assertEqual(content_hash(self.page), content_hash(self.other))
+        self.assertEqual(
+            content_hash(load().metadata), content_hash(load().metadata)
+        )
+        self.assertEqual(content_hash(load()), content_hash(load()))
+
+        # the hash does not depend on the process
+        self.assertEqual(
+            content_hash(Text(None, "a")).hex(),
+            "e7e46226f00ce79351405fd94451fc20"
+        )
+
+    def test_different_content(self):
+        region, other_region = self.page.regions[0], self.other.regions[0]
+        hashes = {content_hash(self.page), content_hash(region)}
+
+        other_region.lines[0].words[0].glyphs[0].coords.points[0].x += 1
+        self.assertNotIn(content_hash(other_region), hashes)
+
+        self.assertNotEqual(
+            content_hash(Text(None, "a")), content_hash(Text(None, "b"))
+        )
+        self.assertNotEqual(
+            content_hash(Text(None, "a", None, 0.5)),
+            content_hash(Text(None, "a", None, 0.25))
+        )
+        # the same fields, but different classes
+        line = Line.from_element(INDEXED_TEXT_LINE, {})
+        plain = Line(line.line_id, line.coords, line.text, [], None)
+        self.assertNotEqual(content_hash(line), content_hash(plain))
+
+    def test_lazy(self):
+        lazy = load(ParseOptions(lazy=True)).page
+        self.assertEqual(content_hash(lazy), content_hash(self.page))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_point_arrays(self):
+        arrays = load(ParseOptions(point_arrays=True)).page
+        self.assertEqual(content_hash(arrays), content_hash(self.page))
+
+    def test_cache(self):
+        word = self.page.regions[0].lines[0].words[0]
+        before = content_hash(self.page)
+        self.assertIs(content_hash(self.page), before)
+
+        # changes are not noticed until the hashes are invalidated
+        word.text = Text(None, "changed")
+        self.assertEqual(content_hash(self.page), before)
+
+        invalidate_content_hash(self.page)
+        self.assertIsNone(word._content_hash)
+        self.assertNotEqual(content_hash(self.page), before)
+
+        # pickles do not contain the hashes
+        copy = pickle.loads(pickle.dumps(self.page))
+        self.assertIsNone(getattr(copy, "_content_hash", None))
+        self.assertEqual(content_hash(copy), content_hash(self.page))
+
+    def test_invalidate_lazy(self):
+        lazy = load(ParseOptions(lazy=True)).page
+        invalidate_content_hash(lazy)
+        self.assertFalse(lazy.regions.is_materialized())
+
+        content_hash(lazy.regions[0])
+        invalidate_content_hash(lazy)
+        self.assertIsNone(lazy.regions[0]._content_hash)
+        self.assertFalse(lazy.regions.is_materialized())
+
+    def test_content_equal(self):
+        region, other_region = self.page.regions[0], self.other.regions[0]
+        self.assertTrue(content_equal(self.page, self.other))
+        self.assertTrue(content_equal(region, other_region))
+
+        other_region.region_id = "changed"
+        invalidate_content_hash(self.other)
+        self.assertFalse(content_equal(self.page, self.other))
+        self.assertTrue(content_equal(region.lines[0], other_region.lines[0]))
+
+    def test_equality(self):
+        line = self.page.regions[0].lines[0]
+        content_hash(self.page)
+        content_hash(self.other)
+        self.assertEqual(self.page, self.other)
+
+        # == compares the fields, regardless of stale hashes
+        line.line_id = "changed"
+        self.assertNotEqual(line, self.other.regions[0].lines[0])
+        self.assertNotEqual(self.page, self.other)
+
+        # invalidate_indices discards the hashes
+        self.page.invalidate_indices()
+        self.assertIsNone(line._content_hash)
+        self.assertFalse(content_equal(self.page, self.other))
+
+    def test_unhashable(self):
+        coords = Coordinates([Point(0, 0), Point(1, 1)])
+        line = Line("l", coords, Text(None, "a"), [object()])
+        self.assertRaises(TypeError, content_hash, line)
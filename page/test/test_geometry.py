@@ -0,0 +1,114 @@
+import io
+import random
+import unittest
+from page.elements import PcGts, ParseOptions, Coordinates, Point, Word
+from page.elements.coords import compute_geometry
+from page.elements.geometry import polygon_signed_area, convex_hull
+from page.elements.point import np
+from page.test.fixtures import SPATIAL_DOCUMENT, random_page
+
+
+def square(size: int) -> Coordinates:
+    return Coordinates([
+        Point(0, 0), Point(size, 0), Point(size, size), Point(0, size)
+    ])
+
+
+class TestGeometry(unittest.TestCase):
+    def test_properties(self):
+        # an L shape
+        coords = Coordinates([
+            Point(0, 0), Point(4, 0), Point(4, 1), Point(1, 1), Point(1, 3),
+            Point(0, 3)
+        ])
+        self.assertEqual(coords.bbox, (0, 0, 4, 3))
+        self.assertEqual(coords.area, 6)
+        cx, cy = coords.centroid
+        self.assertAlmostEqual(cx, (2 * 4 + 0.5 * 2) / 6)
+        self.assertAlmostEqual(cy, (0.5 * 4 + 2 * 2) / 6)
+        self.assertEqual(coords.convex_hull, [
+            Point(0, 0), Point(4, 0), Point(4, 1), Point(1, 3), Point(0, 3)
+        ])
+
+    def test_degenerate(self):
+        line = Coordinates([Point(0, 0), Point(4, 2)])
+        self.assertEqual(line.area, 0)
+        self.assertEqual(line.centroid, (2, 1))
+        self.assertEqual(line.convex_hull, [Point(0, 0), Point(4, 2)])
+        self.assertEqual(convex_hull([(1, 1), (2, 2), (3, 3), (1, 1)]),
+                         [(1, 1), (3, 3)])
+
+    def test_orientation(self):
+        points = [(0, 0), (2, 0), (2, 2), (0, 2)]
+        self.assertEqual(polygon_signed_area(points), 4)
+        self.assertEqual(polygon_signed_area(points[::-1]), -4)
+        self.assertEqual(Coordinates(
+            [Point(x, y) for x, y in points[::-1]]
+        ).area, 4)
+
+    def test_cache(self):
+        coords = square(2)
+        bbox = coords.bbox
+        self.assertIs(coords.bbox, bbox)
+
+        # assigning new points invalidates the cache
+        coords.points = square(3).points
+        self.assertEqual(coords.bbox, (0, 0, 3, 3))
+        self.assertEqual(coords.area, 9)
+
+        # changes in place require an explicit invalidation
+        coords.points.append(Point(-1, 10))
+        self.assertEqual(coords.bbox, (0, 0, 3, 3))
+        coords.invalidate_geometry()
+        self.assertEqual(coords.bbox, (-1, 0, 3, 10))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_point_arrays(self):
+        options = ParseOptions(point_arrays=True)
+        page = PcGts.from_file(io.BytesIO(SPATIAL_DOCUMENT), options).page
+        coords = page.regions[0].lines[1].coords
+        self.assertEqual(coords.bbox, (100, 100, 400, 400))
+        self.assertEqual(coords.area, 300 * 300 / 2)
+        self.assertEqual(coords.centroid, (200, 200))
+        self.assertTrue(np.array_equal(coords.convex_hull, coords.points))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_matches_single(self):
+        document = random_page(random.Random(0), 20)
+
+        for point_arrays in (False, True):
+            options = ParseOptions(point_arrays=point_arrays)
+            page = PcGts.from_file(io.BytesIO(document), options).page
+            expected = [
+                (e.coords.bbox, e.coords.area, e.coords.centroid)
+                for e in page.iter_elements()
+            ]
+
+            page = PcGts.from_file(io.BytesIO(document), options).page
+            elements, geometry = page.geometry()
+            self.assertEqual(len(elements), 20 * 7)
+
+            for row, (bbox, area, (cx, cy)) in enumerate(expected):
+                self.assertEqual(tuple(geometry.bboxes[row]), bbox)
+                self.assertAlmostEqual(geometry.areas[row], area)
+                self.assertAlmostEqual(geometry.centroids[row][0], cx)
+                self.assertAlmostEqual(geometry.centroids[row][1], cy)
+
+            # the results were cached
+            for element, (bbox, area, _) in zip(elements, expected):
+                self.assertEqual(element.coords._geometry.bbox, bbox)
+                self.assertAlmostEqual(element.coords._geometry.area, area)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_types(self):
+        page = PcGts.from_file(io.BytesIO(SPATIAL_DOCUMENT)).page
+        words, geometry = page.geometry(Word)
+        self.assertEqual([word.word_id for word in words], ["w0", "w1"])
+        self.assertEqual(geometry.areas.tolist(), [3600, 4000])
+
+        _, geometry = page.geometry(Point)
+        self.assertEqual(geometry.bboxes.shape, (0, 4))
+
+        self.assertRaises(
+            ValueError, lambda: compute_geometry([Coordinates([])])
+        )
@@ -0,0 +1,81 @@
+import io
+import unittest
+from page.elements import PcGts, TextRegion, Line, Word, Glyph, Coordinates
+from page.elements import Point
+from page.elements.page import element_id
+from page.test.fixtures import RICH_DOCUMENT, SPATIAL_DOCUMENT
+
+
+class TestIds(unittest.TestCase):
+    def setUp(self):
+        self.page = PcGts.from_file(io.BytesIO(SPATIAL_DOCUMENT)).page
+
+    def test_get_by_id(self):
+        region = self.page.regions[0]
+        line = region.lines[0]
+        word = line.words[0]
+
+        self.assertIs(self.page.get_by_id("r0"), region)
+        self.assertIs(self.page.get_by_id("l0"), line)
+        self.assertIs(self.page.get_by_id("w0"), word)
+        self.assertIs(self.page.get_by_id("g0"), word.glyphs[0])
+        self.assertIs(self.page.get_by_id("r1"), self.page.regions[1])
+        self.assertIsNone(self.page.get_by_id("missing"))
+
+        for element in self.page.iter_elements():
+            self.assertIs(self.page.get_by_id(element_id(element)), element)
+
+    def test_parent_of(self):
+        region = self.page.regions[0]
+        line = region.lines[0]
+        word = line.words[0]
+
+        self.assertIs(self.page.parent_of(region), self.page)
+        self.assertIs(self.page.parent_of(line), region)
+        self.assertIs(self.page.parent_of(word), line)
+        self.assertIs(self.page.parent_of(word.glyphs[0]), word)
+
+        # an equal element which is not part of the page
+        copy = PcGts.from_file(io.BytesIO(SPATIAL_DOCUMENT)).page.regions[0]
+        self.assertEqual(copy, region)
+        self.assertIsNone(self.page.parent_of(copy))
+
+    def test_nested_regions(self):
+        page = PcGts.from_file(io.BytesIO(RICH_DOCUMENT)).page
+        outer = page.regions[0]
+        nested = page.get_by_id("r2")
+
+        self.assertIs(nested, outer.children[0])
+        self.assertIs(page.parent_of(nested), outer)
+
+        # region references of the reading order can be resolved
+        refs = page.reading_order.root.region_refs()
+        self.assertEqual([page.get_by_id(ref.ref) for ref in refs], [outer])
+
+    def test_invalidate(self):
+        self.assertIsNone(self.page.get_by_id("new"))
+
+        line = Line("new", Coordinates([Point(0, 0), Point(1, 1)]))
+        self.page.regions[1].lines.append(line)
+        self.assertIsNone(self.page.get_by_id("new"))
+
+        self.page.invalidate_indices()
+        self.assertIs(self.page.get_by_id("new"), line)
+        self.assertIs(self.page.parent_of(line), self.page.regions[1])
+
+    def test_duplicate_ids(self):
+        coords = Coordinates([Point(0, 0), Point(1, 1)])
+        first = TextRegion("x", coords, [], None, [])
+        second = TextRegion("x", coords, [], None, [])
+        self.page.regions[:] = [first, second]
+        self.page.invalidate_indices()
+
+        self.assertIs(self.page.get_by_id("x"), first)
+        self.assertIs(self.page.parent_of(second), self.page)
+
+    def test_element_id(self):
+        self.assertRaises(TypeError, lambda: element_id(self.page))
+        self.assertEqual(
+            [type(e) for e in self.page.iter_elements((Word, Glyph))],
+            [Word, Glyph, Word]
+        )
@@ -0,0 +1,67 @@
+import io
+import pickle
+import unittest
+from lxml import etree
+from page.elements import PcGts, Page, ParseOptions
+from page.elements.lazy import LazyList
+from page.exceptions import PageXMLError
+from page.test.fixtures import PCGTS_DOCUMENT
+
+LAZY = ParseOptions(lazy=True)
+
+PAGE_WITH_INVALID_REGION = etree.XML(
+    """<Page imageFilename="test.png" imageWidth="1024" imageHeight="768">
+        <TextRegion id="r0" type="paragraph">
+            <Coords points="0,0 1,1 2,2" />
+        </TextRegion>
+        <TextRegion id="r1" type="paragraph" />
+    </Page>"""
+)
+
+
+class TestLazy(unittest.TestCase):
+    def test_lazy_equals_eager(self):
+        eager = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT))
+        lazy = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT), LAZY)
+        self.assertEqual(lazy, eager)
+
+    def test_parsed_on_access(self):
+        page = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT), LAZY).page
+        self.assertIsInstance(page.regions, LazyList)
+        self.assertFalse(page.regions.is_materialized())
+        self.assertEqual(page.image_size, (1024, 768))
+
+        region = page.regions[0]
+        self.assertIs(page.regions[0], region)
+        self.assertFalse(page.regions.is_materialized())
+
+        glyphs = region.lines[0].words[0].glyphs
+        self.assertIsInstance(glyphs, LazyList)
+        self.assertEqual(glyphs[0].text.unicode, "a")
+
+        self.assertEqual(len(page.regions), 2)
+        self.assertEqual(page.regions[-1].region_id, "r1")
+        self.assertTrue(page.regions.is_materialized())
+
+    def test_errors_are_deferred(self):
+        page = Page.from_element(PAGE_WITH_INVALID_REGION, {}, LAZY)
+        self.assertEqual(page.regions[0].region_id, "r0")
+        self.assertRaises(PageXMLError, lambda: page.regions[1])
+        self.assertRaises(
+            PageXMLError,
+            lambda: Page.from_element(PAGE_WITH_INVALID_REGION, {})
+        )
+
+    def test_mutation(self):
+        page = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT), LAZY).page
+        region = page.regions[1]
+        del page.regions[0]
+        page.regions.append(region)
+        self.assertEqual(page.regions, [region, region])
+        self.assertTrue(page.regions.is_materialized())
+
+    def test_pickle(self):
+        pcgts = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT), LAZY)
+        unpickled = pickle.loads(pickle.dumps(pcgts))
+        self.assertIsInstance(unpickled.page.regions, list)
+        self.assertEqual(unpickled, pcgts)
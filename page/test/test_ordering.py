@@ -0,0 +1,114 @@
+import io
+import unittest
+from page.constants import DEFAULT_NAMESPACE_MAP
+from page.elements import PcGts, Coordinates, Point, TextRegion, Line
+from page.ordering import xy_cut, order_elements, INFERRED_GROUP_ID
+
+# a heading across two columns with two paragraphs each, and a footer
+LAYOUT = {
+    "heading": (100, 50, 900, 120),
+    "right_bottom": (520, 600, 900, 900),
+    "left_top": (100, 150, 480, 500),
+    "footer": (100, 950, 900, 980),
+    "right_top": (520, 150, 900, 560),
+    "left_bottom": (100, 520, 480, 900),
+}
+EXPECTED = [
+    "heading", "left_top", "left_bottom", "right_top", "right_bottom",
+    "footer"
+]
+
+
+def coords(bbox) -> Coordinates:
+    x0, y0, x1, y1 = bbox
+    return Coordinates(
+        [Point(x0, y0), Point(x1, y0), Point(x1, y1), Point(x0, y1)]
+    )
+
+
+def layout_pcgts() -> PcGts:
+    pcgts = PcGts.from_file(io.BytesIO(
+        b"<PcGts><Metadata><Creator>x</Creator>"
+        b"<Created>2021-10-21T18:37:36</Created>"
+        b"<LastChange>2021-10-21T18:37:36</LastChange></Metadata>"
+        b'<Page imageFilename="a.png" imageWidth="1000" imageHeight="1000">'
+        b"</Page></PcGts>"
+    ))
+    pcgts.page.regions = [
+        TextRegion(region_id, coords(bbox), [], None, [])
+        for region_id, bbox in LAYOUT.items()
+    ]
+    return pcgts
+
+
+class TestOrdering(unittest.TestCase):
+    def test_columns(self):
+        bboxes = list(LAYOUT.values())
+        names = list(LAYOUT)
+        self.assertEqual([names[i] for i in xy_cut(bboxes)], EXPECTED)
+
+    def test_widest_gap(self):
+        # two columns whose paragraphs are separated at the same height,
+        # the wider gap between the columns wins
+        bboxes = [
+            (0, 0, 100, 100), (0, 110, 100, 200),
+            (150, 0, 250, 100), (150, 110, 250, 200)
+        ]
+        self.assertEqual(xy_cut(bboxes), [0, 1, 2, 3])
+        self.assertEqual(xy_cut(bboxes, min_gap=60), [0, 2, 1, 3])
+
+    def test_inseparable(self):
+        # overlapping boxes are ordered by their top and left edges
+        bboxes = [(50, 10, 200, 60), (0, 0, 100, 50), (20, 10, 80, 90)]
+        self.assertEqual(xy_cut(bboxes), [1, 2, 0])
+        self.assertEqual(xy_cut([]), [])
+
+    def test_deep_recursion(self):
+        # every cut separates only a single box
+        bboxes = [(i, i, i + 1, 100000) for i in range(0, 10000, 2)]
+        self.assertEqual(xy_cut(bboxes), list(range(len(bboxes))))
+
+    def test_order_lines(self):
+        lines = [
+            Line(f"l{i}", coords((0, y, 100, y + 10)))
+            for i, y in enumerate([40, 0, 20])
+        ]
+        self.assertEqual(
+            [line.line_id for line in order_elements(lines)],
+            ["l1", "l2", "l0"]
+        )
+
+    def test_infer_reading_order(self):
+        pcgts = layout_pcgts()
+        page = pcgts.page
+        self.assertIsNone(page.reading_order)
+
+        page.reading_order = page.infer_reading_order()
+        page.invalidate_indices()
+        self.assertEqual(
+            [region.region_id for region in page.ordered_regions()], EXPECTED
+        )
+
+        # the reading order is written and parsed again
+        xml = pcgts.to_element(DEFAULT_NAMESPACE_MAP)
+        group = xml.find(".//{*}OrderedGroup")
+        self.assertEqual(group.get("id"), INFERRED_GROUP_ID)
+
+        parsed = PcGts.from_file(io.BytesIO(pcgts.to_bytes())).page
+        self.assertEqual(
+            [region.region_id for region in parsed.ordered_regions()],
+            EXPECTED
+        )
+
+    def test_regions_without_id(self):
+        pcgts = layout_pcgts()
+        pcgts.page.regions[0].region_id = None
+        refs = pcgts.page.infer_reading_order().region_refs()
+        self.assertEqual([ref.ref for ref in refs], EXPECTED[1:])
+
+        # an empty group would not be valid PAGE-XML
+        for region in pcgts.page.regions:
+            region.region_id = None
+        self.assertIsNone(pcgts.page.infer_reading_order())
+        pcgts.page.regions.clear()
+        self.assertIsNone(pcgts.page.infer_reading_order())
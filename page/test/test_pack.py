@@ -0,0 +1,130 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+from page.elements import PcGts
+from page.compression import compress, GZIP
+from page.exceptions import PageXMLError
+from page.pack import PackWriter, CorpusPack
+from page.test.fixtures import PCGTS_DOCUMENT, RICH_DOCUMENT
+
+
+class TestPack(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "corpus.pgpack")
+        self.rich = PcGts.from_file(io.BytesIO(RICH_DOCUMENT))
+        self.simple = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_file(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def test_round_trip(self):
+        plain = self.write_file("zeta.xml", PCGTS_DOCUMENT)
+        gzipped = compress(RICH_DOCUMENT, GZIP)
+        compressed = self.write_file("alpha.xml.gz", gzipped)
+
+        with PackWriter(self.path) as writer:
+            writer.add_file(plain)
+            writer.add(self.rich, key="müller")
+            writer.add_file(compressed)
+            self.assertEqual(len(writer), 3)
+
+        with CorpusPack(self.path) as pack:
+            self.assertEqual(len(pack), 3)
+            self.assertEqual(
+                list(pack.keys()), ["zeta.xml", "müller", "alpha.xml.gz"]
+            )
+
+            self.assertEqual(pack[0], self.simple)
+            self.assertEqual(pack[1], self.rich)
+            self.assertEqual(pack[-1], self.rich)
+            self.assertEqual(pack.get("alpha.xml.gz"), self.rich)
+            self.assertEqual(pack.get("zeta.xml"), self.simple)
+
+            self.assertEqual(pack.index_of("müller"), 1)
+            self.assertIn("zeta.xml", pack)
+            self.assertNotIn("missing.xml", pack)
+            self.assertIsNone(pack.get("missing.xml"))
+            self.assertRaises(IndexError, lambda: pack[3])
+
+            # already compressed files are stored as they are
+            self.assertEqual(pack.raw(2), gzipped)
+
+    def test_many_keys(self):
+        keys = [f"page_{i:04d}" for i in range(200)]
+        keys.reverse()
+
+        with PackWriter(self.path, compresslevel=1) as writer:
+            for key in keys:
+                writer.add(self.simple, key=key)
+
+        with CorpusPack(self.path) as pack:
+            for index, key in enumerate(keys):
+                self.assertEqual(pack.index_of(key), index)
+                self.assertEqual(pack.key(index), key)
+
+            self.assertIsNone(pack.index_of("page_"))
+            self.assertIsNone(pack.index_of("page_9999"))
+
+    def test_default_key(self):
+        with PackWriter(self.path) as writer:
+            writer.add(self.rich)
+
+        with CorpusPack(self.path) as pack:
+            self.assertEqual(list(pack.keys()), [self.rich.pc_gts_id])
+
+    def test_empty(self):
+        with PackWriter(self.path):
+            pass
+
+        with CorpusPack(self.path) as pack:
+            self.assertEqual(len(pack), 0)
+            self.assertIsNone(pack.index_of("a"))
+
+    def test_duplicate_keys(self):
+        with PackWriter(self.path) as writer:
+            writer.add(self.simple, key="a")
+            position = writer._file.tell()
+
+            # the duplicate is rejected before anything is written
+            self.assertRaises(
+                ValueError, lambda: writer.add(self.rich, key="a")
+            )
+            self.assertEqual(writer._file.tell(), position)
+            writer.add(self.rich, key="b")
+
+        with CorpusPack(self.path) as pack:
+            self.assertEqual(list(pack.keys()), ["a", "b"])
+            self.assertEqual(pack.get("a"), self.simple)
+
+    def test_failed_index(self):
+        def write():
+            with PackWriter(self.path) as writer:
+                writer.add(self.simple, key="a")
+
+        with mock.patch.object(
+            PackWriter, "_write_index", side_effect=OSError
+        ):
+            self.assertRaises(OSError, write)
+
+        # the incomplete pack is removed
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_not_a_pack(self):
+        empty = self.write_file("empty", b"")
+        self.assertRaises(PageXMLError, lambda: CorpusPack(empty))
+
+        page = self.write_file("page.xml", RICH_DOCUMENT)
+        self.assertRaises(PageXMLError, lambda: CorpusPack(page))
+
+    def test_not_entered(self):
+        writer = PackWriter(self.path)
+        self.assertRaises(ValueError, lambda: writer.add(self.simple, "a"))
@@ -0,0 +1,104 @@
+import os
+import pickle
+import tempfile
+import unittest
+from lxml import etree
+from page.elements import PcGts
+from page.exceptions import PageXMLError
+from page.parallel import LoadResult
+from page.test.fixtures import PCGTS_DOCUMENT
+
+INVALID_PAGE_DOCUMENT = b"""<PcGts>
+    <Metadata>
+        <Creator>Test Creator</Creator>
+        <Created>2021-10-21T18:37:36</Created>
+        <LastChange>1970-01-01T00:00:00</LastChange>
+    </Metadata>
+</PcGts>"""
+
+MISSING_ATTRIBUTES_DOCUMENTS = [
+    PCGTS_DOCUMENT.replace(b' imageWidth="1024"', b""),
+    PCGTS_DOCUMENT.replace(b"<Creator>Test Creator</Creator>", b""),
+]
+
+
+class TestLoadMany(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.paths = []
+
+        for i in range(10):
+            self.paths.append(self.write(f"valid{i}.xml", PCGTS_DOCUMENT))
+
+        self.syntax_error = self.write("syntax.xml", b"<PcGts><Page>")
+        self.invalid_page = self.write("invalid.xml", INVALID_PAGE_DOCUMENT)
+        self.missing_attributes = [
+            self.write(f"missing{i}.xml", document)
+            for i, document in enumerate(MISSING_ATTRIBUTES_DOCUMENTS)
+        ]
+        self.not_pcgts = self.write("other.xml", b"<Other />")
+        self.missing = os.path.join(self.tmp_dir.name, "missing.xml")
+        self.paths[3:3] = [
+            self.syntax_error, self.invalid_page, self.not_pcgts, self.missing
+        ] + self.missing_attributes
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "wb") as file:
+            file.write(content)
+
+        return path
+
+    def check_results(self, results):
+        by_path = {result.path: result for result in results}
+        self.assertEqual(set(by_path), set(self.paths))
+        expected = PcGts.from_file(self.paths[0])
+
+        for path, result in by_path.items():
+            if path == self.syntax_error:
+                self.assertIsInstance(result.error, etree.XMLSyntaxError)
+            elif path == self.invalid_page or path in self.missing_attributes:
+                self.assertIsInstance(result.error, PageXMLError)
+            elif path == self.missing:
+                self.assertIsInstance(result.error, OSError)
+            elif path == self.not_pcgts:
+                self.assertIsNone(result.error)
+                self.assertIsNone(result.pcgts)
+            else:
+                self.assertIsNone(result.error)
+                self.assertEqual(result.pcgts, expected)
+
+    def test_load_many_ordered(self):
+        for workers in [0, 2]:
+            results = list(PcGts.load_many(
+                self.paths, workers=workers, chunksize=3
+            ))
+            self.assertEqual(
+                [result.path for result in results], self.paths
+            )
+            self.check_results(results)
+
+    def test_load_many_unordered(self):
+        self.check_results(PcGts.load_many(
+            iter(self.paths), workers=2, chunksize=2, ordered=False
+        ))
+
+    def test_stop_early(self):
+        results = PcGts.load_many(self.paths, workers=2, chunksize=1)
+        self.assertEqual(next(results).path, self.paths[0])
+        results.close()
+
+    def test_pickle_syntax_error(self):
+        with self.assertRaises(etree.XMLSyntaxError) as context:
+            etree.XML("<PcGts>")
+
+        error = context.exception
+        result = pickle.loads(pickle.dumps(LoadResult("a", None, error)))
+
+        self.assertEqual(result.path, "a")
+        self.assertIsInstance(result.error, etree.XMLSyntaxError)
+        self.assertEqual(result.error.msg, error.msg)
+        self.assertEqual(result.error.position, error.position)
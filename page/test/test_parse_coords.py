@@ -1,6 +1,7 @@
 import unittest
 from page.elements.coords import Baseline, Coordinates
-from page.elements.point import Point
+from page.elements.point import Point, np
+from page.elements.options import ParseOptions
 from page.exceptions import PageXMLError
 import page.test.assert_utils as utils
 from lxml import etree
@@ -43,3 +44,22 @@ class TestParseCoords(unittest.TestCase):
         self.assertEqual(baseline.points, [
             Point(2, 2), Point(1, 1), Point(0, 0)
         ])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_parse_coords_array(self):
+        options = ParseOptions(point_arrays=True)
+        coords = Coordinates.from_element(SIMPLE_COORDS, {}, options)
+        self.assertTrue(coords.is_array())
+        self.assertEqual(coords.as_array().tolist(), [[0, 0], [1, 1], [2, 2]])
+        self.assertEqual(coords, Coordinates.from_element(SIMPLE_COORDS, {}))
+        self.assertNotEqual(
+            coords, Baseline.from_element(SIMPLE_COORDS, {}, options)
+        )
+        self.assertEqual(
+            coords.to_element({}).get("points"), SIMPLE_COORDS.get("points")
+        )
+
+        baseline = Baseline.from_element(SIMPLE_BASELINE, {}, options)
+        self.assertEqual(baseline.as_points(), [
+            Point(2, 2), Point(1, 1), Point(0, 0)
+        ])
@@ -1,6 +1,7 @@
 import unittest
 from lxml import etree
 from page.elements import Line, IndexedLine, Text, Point
+from page.elements import ParseOptions, ParseDepth
 from page.elements.coords import Coordinates
 from page.elements.word import Word
 from page.exceptions import PageXMLError
@@ -164,3 +165,10 @@ class TestParseLine(unittest.TestCase):
                 Line.from_element(xml, {}).to_element({}),
                 xml
             )
+
+    def test_parse_line_depth(self):
+        options = ParseOptions(depth=ParseDepth.LINE)
+        line: Line = Line.from_element(TEXT_LINE_WITH_WORDS, {}, options)
+        self.assertEqual(line.line_id, "l2")
+        self.assertEqual(line.words, [])
+        self.assertEqual(line.text, Text(None, "test text 1"))
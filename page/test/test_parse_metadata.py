@@ -1,6 +1,8 @@
 import unittest
 from page.exceptions import PageXMLError
 from page.elements import Metadata
+from page.elements.metadata import parse_datetime
+from datetime import datetime, timedelta, timezone
 import page.test.assert_utils as utils
 from lxml import etree
 
@@ -49,6 +51,21 @@ EMPTY_COMMENT_METADATA = etree.XML(
     """
 )
 
+MISSING_CREATOR_METADATA = etree.XML(
+    """<Metadata>
+        <Created>2021-10-21T18:37:36</Created>
+        <LastChange>1970-01-01T00:00:00</LastChange>
+    </Metadata>"""
+)
+
+EMPTY_DATE_METADATA = etree.XML(
+    """<Metadata>
+        <Creator>Test Creator</Creator>
+        <Created/>
+        <LastChange>1970-01-01T00:00:00</LastChange>
+    </Metadata>"""
+)
+
 
 class TestParseMetadata(unittest.TestCase):
     def test_simple(self):
@@ -89,6 +106,12 @@ class TestParseMetadata(unittest.TestCase):
             lambda: Metadata.from_element(MALFORMED_DATE_METADATA, {})
         )
 
+    def test_missing_elements(self):
+        for xml in [MISSING_CREATOR_METADATA, EMPTY_DATE_METADATA]:
+            self.assertRaises(
+                PageXMLError, lambda: Metadata.from_element(xml, {})
+            )
+
     def test_invert(self):
         for xml in [
             SIMPLE_METADATA,
@@ -99,3 +122,22 @@ class TestParseMetadata(unittest.TestCase):
             utils.assert_same_descendant_tags(
                 self, Metadata.from_element(xml, {}).to_element({}), xml
             )
+
+    def test_parse_datetime(self):
+        offset = timezone(timedelta(hours=2))
+        for text, expected in [
+            ("2021-10-21T18:37:36", datetime(2021, 10, 21, 18, 37, 36)),
+            (
+                " 2021-10-21T18:37:36.250+02:00\n",
+                datetime(2021, 10, 21, 18, 37, 36, 250000, offset)
+            ),
+            # only dateutil understands these before Python 3.11
+            (
+                "2021-10-21T16:37:36Z",
+                datetime(2021, 10, 21, 16, 37, 36, tzinfo=timezone.utc)
+            ),
+            ("21 October 2021", datetime(2021, 10, 21)),
+        ]:
+            self.assertEqual(parse_datetime(text), expected)
+
+        self.assertRaises(ValueError, lambda: parse_datetime("invalid date"))
@@ -1,6 +1,7 @@
 import unittest
 from lxml import etree
 from page.elements import Page, TextRegion, RegionRefIndexed
+from page.elements import ParseOptions, TextRegionType
 from page.exceptions import PageXMLError
 from page.elements.reading_order import OrderedGroup
 import page.test.assert_utils as utils
@@ -15,6 +16,11 @@ INVALID_PAGE_ATTRIBS = etree.XML(
     </Page>"""
 )
 
+MISSING_PAGE_ATTRIBS = etree.XML(
+    """<Page imageFilename="test.png" imageHeight="768">
+    </Page>"""
+)
+
 SIMPLE_PAGE = etree.XML(
     """<Page imageFilename="test.jpg" imageWidth="100" imageHeight="400">
         <TextRegion id="r0" type="paragraph">
@@ -48,6 +54,42 @@ COMPLEX_PAGE = etree.XML(
 )
 
 
+TYPED_REGIONS_PAGE = etree.XML(
+    """<Page imageFilename="test.tga" imageWidth="392" imageHeight="400">
+        <TextRegion id="r0" type="paragraph">
+            <Coords points="0,0 1,1 2,2" />
+            <TextRegion id="r01" type="marginalia">
+                <Coords points="0,0 4,4 0,0" />
+            </TextRegion>
+        </TextRegion>
+        <TextRegion id="r1" type="marginalia">
+            <Coords points="2,2 1,1 0,1" />
+        </TextRegion>
+        <TextRegion id="r2" type="footnote">
+            <Coords points="2,2 1,1 0,1" />
+            <TextLine id="l0" />
+        </TextRegion>
+    </Page>"""
+)
+
+NESTED_REGIONS_PAGE = etree.XML(
+    """<Page imageFilename="test.tga" imageWidth="392" imageHeight="400">
+        <TextRegion id="r0">
+            <Coords points="0,0 1,1 2,2" />
+            <TextRegion id="r00">
+                <Coords points="0,0 4,4 0,0" />
+                <TextRegion id="r000">
+                    <Coords points="0,0 4,4 0,0" />
+                </TextRegion>
+            </TextRegion>
+            <TextRegion id="r01">
+                <Coords points="0,0 4,4 0,0" />
+            </TextRegion>
+        </TextRegion>
+    </Page>"""
+)
+
+
 class TestParsePage(unittest.TestCase):
     def test_parse_empty_page(self):
         page = Page.from_element(EMPTY_PAGE, {})
@@ -60,6 +102,10 @@ class TestParsePage(unittest.TestCase):
             PageXMLError,
             lambda: Page.from_element(INVALID_PAGE_ATTRIBS, {})
         )
+        self.assertRaises(
+            PageXMLError,
+            lambda: Page.from_element(MISSING_PAGE_ATTRIBS, {})
+        )
 
     def test_parse_simple_page(self):
         page = Page.from_element(SIMPLE_PAGE, {})
@@ -111,3 +157,65 @@ class TestParsePage(unittest.TestCase):
         self.assertIn("r1", region_ids)
         self.assertNotIn("r2", region_ids)
         self.assertNotIn("g1", region_ids)
+
+    def test_parse_page_region_filters(self):
+        def region_ids(options: ParseOptions):
+            page = Page.from_element(TYPED_REGIONS_PAGE, {}, options)
+            return [region.region_id for region in page.regions]
+
+        self.assertEqual(
+            region_ids(ParseOptions(region_types={TextRegionType.MARGINALIA})),
+            ["r01", "r1"]
+        )
+        self.assertEqual(
+            region_ids(ParseOptions(region_ids={"r0", "r1"})), ["r0", "r1"]
+        )
+        self.assertEqual(
+            region_ids(ParseOptions(
+                region_filter=lambda attrib: attrib["id"].endswith("0")
+            )),
+            ["r0"]
+        )
+        self.assertEqual(
+            region_ids(ParseOptions(
+                region_ids={"r0", "r1"},
+                region_types={TextRegionType.PARAGRAPH}
+            )),
+            ["r0"]
+        )
+
+        # r2 is invalid, but it is never parsed
+        self.assertRaises(
+            PageXMLError, lambda: Page.from_element(TYPED_REGIONS_PAGE, {})
+        )
+
+    def test_parse_page_region_filter_nested(self):
+        page = Page.from_element(
+            TYPED_REGIONS_PAGE, {},
+            ParseOptions(region_types={
+                TextRegionType.PARAGRAPH, TextRegionType.FOOTNOTE
+            }, region_ids={"r0", "r01"})
+        )
+        self.assertEqual(len(page.regions), 1)
+        self.assertEqual(page.regions[0].children, [])
+
+        # a selected region takes the place of an enclosing region which is
+        # not selected
+        page = Page.from_element(
+            TYPED_REGIONS_PAGE, {},
+            ParseOptions(region_types={TextRegionType.MARGINALIA})
+        )
+        self.assertEqual(page.regions[0].region_id, "r01")
+        self.assertEqual(
+            page.regions[0].region_type, TextRegionType.MARGINALIA
+        )
+
+        page = Page.from_element(
+            NESTED_REGIONS_PAGE, {},
+            ParseOptions(region_ids={"r0", "r000", "r01"})
+        )
+        self.assertEqual(len(page.regions), 1)
+        self.assertEqual(
+            [child.region_id for child in page.regions[0].children],
+            ["r000", "r01"]
+        )
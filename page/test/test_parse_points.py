@@ -3,6 +3,8 @@ import rstr
 import re
 import random
 from page.elements import Point, parse_points, points_to_string
+from page.elements import parse_points_array
+from page.elements.point import array_to_points, np
 from page.exceptions import PageXMLError
 
 
@@ -106,3 +108,34 @@ class TestParsePoints(unittest.TestCase):
             p = Point(x, y)
             self.assertEqual(f"{p}", f"({int(x)}, {int(y)})")
             self.assertEqual(str(p), repr(p))
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestParsePointsArray(unittest.TestCase):
+    def test_parse_array_matches_parse_points(self):
+        for i in range(100):
+            n = random.randrange(2, 100)
+            points_str = ' '.join(
+                f"{random.randrange(-1000, 1000)},"
+                f"{random.randrange(-1000, 1000)}"
+                for _ in range(n)
+            )
+
+            array = parse_points_array(points_str)
+            self.assertEqual(array.dtype, np.int32)
+            self.assertEqual(array.shape, (n, 2))
+            self.assertEqual(array_to_points(array), parse_points(points_str))
+            self.assertEqual(points_to_string(array), points_str)
+
+    def test_parse_array_uncommon_points(self):
+        array = parse_points_array("+1,2 3,+4")
+        self.assertEqual(array.tolist(), [[1, 2], [3, 4]])
+
+    def test_parse_array_invalid(self):
+        for points_str in [
+            "1,2", "1,2,3 4,5,6", "1 2 3 4", "a,b c,d", "1,2  3,4",
+            "1,2 3,99999999999"
+        ]:
+            self.assertRaises(
+                PageXMLError, lambda: parse_points_array(points_str)
+            )
@@ -2,6 +2,7 @@ import unittest
 from typing import Optional
 from lxml import etree
 from page.elements import Region, TextRegion, TextRegionType, Point
+from page.elements import ParseOptions, ParseDepth
 from page.exceptions import PageXMLError
 import page.test.assert_utils as utils
 
@@ -78,6 +79,18 @@ TRAVERSE_CHILDREN = etree.XML(
 )
 
 
+NESTED_TEXT_REGIONS_WITH_LINES = etree.XML(
+    """<TextRegion id="r0" type="paragraph">
+        <Coords points="0,0 300,400 800,600 100,200" />
+        <TextRegion id="r01" type="heading">
+            <Coords points="100,200 600,200 400,500 300,900" />
+            <TextLine id="l0"><Coords points="0,0 1,1" /></TextLine>
+        </TextRegion>
+        <TextLine id="l1"><Coords points="0,0 1,1" /></TextLine>
+    </TextRegion>"""
+)
+
+
 class TestParseRegion(unittest.TestCase):
     def test_text_region(self):
         text_region: TextRegion = TextRegion.from_element(
@@ -171,3 +184,18 @@ class TestParseRegion(unittest.TestCase):
                 TextRegion.from_element(test_xml, {}).to_element({}),
                 test_xml
             )
+
+    def test_parse_text_region_depth(self):
+        region: TextRegion = TextRegion.from_element(
+            NESTED_TEXT_REGIONS_WITH_LINES, {}
+        )
+        self.assertEqual(len(region.lines), 1)
+        self.assertEqual(len(region.children[0].lines), 1)
+
+        region = TextRegion.from_element(
+            NESTED_TEXT_REGIONS_WITH_LINES, {},
+            ParseOptions(depth=ParseDepth.REGION)
+        )
+        self.assertEqual(region.lines, [])
+        self.assertEqual(region.children[0].region_id, "r01")
+        self.assertEqual(region.children[0].lines, [])
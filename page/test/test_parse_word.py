@@ -4,6 +4,7 @@ from lxml import etree
 from page.elements.point import Point
 from page.elements.word import IndexedWord, Word
 from page.elements.text import Text
+from page.elements.options import ParseOptions, ParseDepth
 from page.exceptions import PageXMLError
 import page.test.assert_utils as utils
 
@@ -154,3 +155,10 @@ class TestParseWord(unittest.TestCase):
                 Word.from_element(xml, {}).to_element({}),
                 xml
             )
+
+    def test_parse_word_depth(self):
+        options = ParseOptions(depth=ParseDepth.WORD)
+        word: Word = Word.from_element(WORD_WITH_GLYPHS, {}, options)
+        self.assertEqual(word.word_id, "w2")
+        self.assertEqual(word.glyphs, [])
+        self.assertEqual(word.text, Text(None, "test"))
@@ -0,0 +1,90 @@
+import io
+import unittest
+from page.elements import PcGts, ParseOptions
+from page.test.fixtures import PCGTS_DOCUMENT
+
+# the children of the ordered groups are not stored in index order
+DOCUMENT = b"""<PcGts>
+    <Metadata>
+        <Creator>Test</Creator>
+        <Created>2021-10-21T18:37:36</Created>
+        <LastChange>2021-10-21T18:37:36</LastChange>
+    </Metadata>
+    <Page imageFilename="test.png" imageWidth="100" imageHeight="100">
+        <ReadingOrder>
+            <OrderedGroup id="g0">
+                <RegionRefIndexed regionRef="r4" index="5" />
+                <OrderedGroupIndexed id="g1" index="2">
+                    <RegionRefIndexed regionRef="r3" index="1" />
+                    <RegionRefIndexed regionRef="r2" index="0" />
+                </OrderedGroupIndexed>
+                <RegionRefIndexed regionRef="missing" index="3" />
+                <RegionRefIndexed regionRef="r0" index="0" />
+                <UnorderedGroupIndexed id="g2" index="4">
+                    <RegionRef regionRef="r1" />
+                    <RegionRef regionRef="r0" />
+                </UnorderedGroupIndexed>
+            </OrderedGroup>
+        </ReadingOrder>
+        <TextRegion id="r0"><Coords points="0,0 1,1" /></TextRegion>
+        <TextRegion id="r1"><Coords points="0,0 1,1" /></TextRegion>
+        <TextRegion id="r2">
+            <Coords points="0,0 1,1" />
+            <TextRegion id="r3"><Coords points="0,0 1,1" /></TextRegion>
+        </TextRegion>
+        <TextRegion id="r4"><Coords points="0,0 1,1" /></TextRegion>
+        <TextRegion id="r5"><Coords points="0,0 1,1" /></TextRegion>
+    </Page>
+</PcGts>"""
+
+
+def ids(regions):
+    return [region.region_id for region in regions]
+
+
+class TestReadingOrder(unittest.TestCase):
+    def setUp(self):
+        self.page = PcGts.from_file(io.BytesIO(DOCUMENT)).page
+
+    def test_region_refs(self):
+        refs = self.page.reading_order.region_refs()
+        self.assertEqual(
+            [ref.ref for ref in refs],
+            ["r0", "r2", "r3", "missing", "r1", "r0", "r4"]
+        )
+
+    def test_ordered_regions(self):
+        regions = self.page.ordered_regions()
+        # the missing region and the second reference to r0 are skipped
+        self.assertEqual(ids(regions), ["r0", "r2", "r3", "r1", "r4"])
+        self.assertIs(regions[2], self.page.regions[2].children[0])
+        self.assertIs(self.page.ordered_regions(), regions)
+
+    def test_reading_position(self):
+        for position, region in enumerate(self.page.ordered_regions()):
+            self.assertEqual(self.page.reading_position(region), position)
+
+        # r5 is not referenced by the reading order
+        self.assertIsNone(self.page.reading_position(self.page.regions[4]))
+
+        copy = PcGts.from_file(io.BytesIO(DOCUMENT)).page.regions[0]
+        self.assertIsNone(self.page.reading_position(copy))
+
+    def test_selected_regions(self):
+        options = ParseOptions(region_ids=frozenset(["r1", "r4"]))
+        page = PcGts.from_file(io.BytesIO(DOCUMENT), options).page
+        self.assertEqual(ids(page.ordered_regions()), ["r1", "r4"])
+
+    def test_without_reading_order(self):
+        page = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT)).page
+        self.assertIsNone(page.reading_order)
+        self.assertEqual(list(page.ordered_regions()), page.regions)
+
+    def test_invalidate(self):
+        self.page.reading_order = None
+        self.assertEqual(len(self.page.ordered_regions()), 5)
+
+        self.page.invalidate_indices()
+        self.assertEqual(
+            ids(self.page.ordered_regions()), ["r0", "r1", "r2", "r4", "r5"]
+        )
@@ -0,0 +1,247 @@
+import io
+import itertools
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime
+from page.elements import PcGts, Page, Metadata, TextRegion, Line, Text
+from page.elements import Coordinates, Point
+from page.exceptions import PageXMLError
+from page.search import TextIndex, SearchHit, tokenize
+from page.test.fixtures import LINE_DOCUMENT, WORD_DOCUMENT
+
+L0_BBOX = (0, 0, 500, 50)
+L1_BBOX = (0, 200, 500, 250)
+
+
+def load(document: bytes) -> PcGts:
+    return PcGts.from_file(io.BytesIO(document))
+
+
+def found(hits):
+    return [(hit.document, hit.line_id) for hit in hits]
+
+
+def random_document(
+    rng: random.Random, vocabulary, weights, lines: int
+) -> PcGts:
+    coords = Coordinates([Point(0, 0), Point(1, 1)])
+    texts = [
+        " ".join(rng.choices(vocabulary, weights, k=rng.randint(1, 6)))
+        for _ in range(lines)
+    ]
+    region = TextRegion("r", coords, [], None, [
+        Line(f"l{i}", coords, Text(None, text))
+        for i, text in enumerate(texts)
+    ])
+    metadata = Metadata("c", datetime(2021, 1, 2), datetime(2021, 1, 3), None)
+    return PcGts(None, metadata, Page((1, 1), "a.png", None, [region]))
+
+
+def expected_hits(documents, query: str):
+    """Finds the lines of a query by comparing the tokens of every line."""
+
+    tokens = tokenize(query)
+    prefix = query.endswith("*")
+
+    def matches(line_tokens, start):
+        return all(
+            start + i < len(line_tokens) and (
+                line_tokens[start + i].startswith(token)
+                if prefix and i == len(tokens) - 1
+                else line_tokens[start + i] == token
+            )
+            for i, token in enumerate(tokens)
+        )
+
+    return [
+        (key, line.line_id)
+        for key, pcgts in documents
+        for line in pcgts.page.iter_elements(Line)
+        for start in range(len(tokenize(line.text.unicode)))
+        if matches(tokenize(line.text.unicode), start)
+    ]
+
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        self.index = TextIndex()
+        self.index.add("words", load(WORD_DOCUMENT))
+        self.index.add("lines", load(LINE_DOCUMENT))
+
+    def test_tokenize(self):
+        self.assertEqual(
+            tokenize("Anno DOMINI, ﬁnis-terrae"),
+            ["anno", "domini", "finis", "terrae"]
+        )
+        self.assertEqual(tokenize(" ,- "), [])
+
+    def test_words(self):
+        self.assertEqual(self.index.search("anno domini"), [
+            SearchHit(
+                "words", "l0", L0_BBOX,
+                [("w0", (0, 0, 100, 50)), ("w2", (220, 0, 300, 50))]
+            ),
+            SearchHit(
+                "lines", "p0l0", (100, 300, 900, 350),
+                [("p0l0", (100, 300, 900, 350))]
+            )
+        ])
+
+        # a word with two tokens is reported once
+        hits = self.index.search("Domini finis terrae")
+        self.assertEqual(
+            hits[0].elements,
+            [("w2", (220, 0, 300, 50)), ("w3", (320, 0, 480, 50))]
+        )
+
+        # the text of a line is ignored if its words are indexed
+        self.assertEqual(self.index.search("ignored"), [])
+
+    def test_lines(self):
+        self.assertEqual(self.index.search("domini anno"), [
+            SearchHit("words", "l1", L1_BBOX, [("l1", L1_BBOX)])
+        ])
+        self.assertEqual(
+            found(self.index.search("domini")),
+            [
+                ("words", "l0"), ("words", "l1"),
+                ("lines", "p0l0"), ("lines", "p0l1")
+            ]
+        )
+        self.assertEqual(len(self.index.search("domini", limit=3)), 3)
+
+    def test_phrases(self):
+        self.assertEqual(self.index.search("anno terrae"), [])
+        self.assertEqual(self.index.search("terrae anno"), [])
+        self.assertEqual(self.index.search("missing"), [])
+        self.assertEqual(self.index.search(""), [])
+        self.assertEqual(
+            found(self.index.search("domini nostri")), [("lines", "p0l1")]
+        )
+
+    def test_prefix(self):
+        self.assertEqual(
+            found(self.index.search("dom*")),
+            [
+                ("words", "l0"), ("words", "l1"),
+                ("lines", "p0l0"), ("lines", "p0l1")
+            ]
+        )
+        self.assertEqual(
+            found(self.index.search("domini n*")), [("lines", "p0l1")]
+        )
+        self.assertEqual(list(self.index.terms("ann")), ["anno"])
+        self.assertEqual(list(self.index.terms("x")), [])
+
+    def test_remove(self):
+        self.assertEqual(len(self.index), 2)
+        self.assertTrue(self.index.remove("words"))
+        self.assertFalse(self.index.remove("words"))
+        self.assertNotIn("words", self.index)
+        self.assertEqual(
+            found(self.index.search("domini")),
+            [("lines", "p0l0"), ("lines", "p0l1")]
+        )
+
+        # adding a document again replaces it
+        self.index.add("lines", load(WORD_DOCUMENT))
+        self.assertEqual(list(self.index.keys()), ["lines"])
+        self.assertEqual(self.index.search("nostri"), [])
+
+    def test_save(self):
+        queries = ["domini", "anno domini", "dom*", "domini n*", "terrae"]
+        expected = [self.index.search(query) for query in queries]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "corpus.idx")
+            self.index.save(path)
+
+            with TextIndex(path) as index:
+                self.assertEqual(list(index.keys()), ["words", "lines"])
+                self.assertEqual(
+                    [index.search(query) for query in queries], expected
+                )
+                self.assertEqual(
+                    list(index.terms()), list(self.index.terms())
+                )
+
+                # changes of a mapped index are merged by the next save
+                self.assertTrue(index.remove("words"))
+                index.add("more", load(WORD_DOCUMENT))
+                self.assertEqual(
+                    found(index.search("anno")),
+                    [("lines", "p0l0"), ("more", "l0"), ("more", "l1")]
+                )
+                self.assertEqual(
+                    found(index.search("ter*")), [("more", "l0")]
+                )
+                index.save(path)
+
+            with TextIndex(path) as index:
+                self.assertEqual(list(index.keys()), ["lines", "more"])
+                self.assertEqual(
+                    found(index.search("anno")),
+                    [("lines", "p0l0"), ("more", "l0"), ("more", "l1")]
+                )
+                self.assertIn("more", index)
+                self.assertNotIn("words", index)
+
+    def test_random_queries(self):
+        rng = random.Random(0)
+        # common and rare tokens, so that rare tokens are looked up in the
+        # postings of common ones and vice versa
+        vocabulary = ["a", "ab", "abc", "b", "ba", "c"]
+        weights = [40, 2, 1, 10, 1, 5]
+        documents = [
+            (f"d{i}", random_document(rng, vocabulary, weights, 100))
+            for i in range(4)
+        ]
+        phrases = [
+            " ".join(tokens)
+            for length in (1, 2)
+            for tokens in itertools.product(vocabulary, repeat=length)
+        ] + [
+            " ".join(rng.choices(vocabulary, weights, k=3))
+            for _ in range(20)
+        ]
+        queries = phrases + [phrase + "*" for phrase in phrases]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "corpus.idx")
+            index = TextIndex()
+            for key, pcgts in documents[:3]:
+                index.add(key, pcgts)
+            index.save(path)
+
+            # a mapped index with a removed and an added document
+            with TextIndex(path) as index:
+                index.remove("d1")
+                index.add(*documents[3])
+                remaining = [documents[0], documents[2], documents[3]]
+
+                for query in queries:
+                    expected = expected_hits(remaining, query)
+                    self.assertEqual(
+                        found(index.search(query)), expected, query
+                    )
+                    self.assertEqual(
+                        found(index.search(query, limit=5)), expected[:5]
+                    )
+
+    def test_invalid_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "empty.idx")
+            TextIndex().save(path)
+            with TextIndex(path) as index:
+                self.assertEqual(len(index), 0)
+                self.assertEqual(index.search("anno"), [])
+
+            with open(path, "r+b") as file:
+                file.truncate(os.path.getsize(path) - 1)
+            self.assertRaises(PageXMLError, TextIndex, path)
+
+            with open(path, "wb"):
+                pass
+            self.assertRaises(PageXMLError, TextIndex, path)
@@ -0,0 +1,73 @@
+import io
+import unittest
+from datetime import datetime
+from lxml import etree
+from page.constants import DEFAULT_NAMESPACE_MAP, DEFAULT_XML_NAMESPACE
+from page.elements import PcGts, Page, Metadata, TextRegion, Text
+from page.elements import Coordinates, Point, Line, Word, Glyph
+from page.elements.reading_order import ReadingOrder, UnorderedGroup
+from page.serialize import to_bytes
+from page.test.fixtures import PCGTS_DOCUMENT, RICH_DOCUMENT
+
+SPECIAL = "a&b<c>d\"e'f\tg\nh\ri ü 😀 ]]>"
+
+NSMAPS = [
+    DEFAULT_NAMESPACE_MAP,
+    {"pc": DEFAULT_XML_NAMESPACE},
+    {None: DEFAULT_XML_NAMESPACE, "xsi": "http://example.com/xsi"},
+    {}
+]
+
+
+def special_document() -> PcGts:
+    coords = Coordinates([Point(0, 0), Point(1, 2)])
+    glyph = Glyph(SPECIAL, coords, Text(None, "", SPECIAL, 0.5))
+    word = Word("w", coords, [glyph], Text(3, SPECIAL))
+    line = Line("l", coords, None, [word])
+    region = TextRegion(SPECIAL, coords, [], None, [line])
+    reading_order = ReadingOrder(UnorderedGroup(SPECIAL, [], SPECIAL))
+    metadata = Metadata(SPECIAL, datetime(2021, 1, 2), datetime(2021, 1, 3),
+                        SPECIAL)
+    page = Page((1, 2), SPECIAL, reading_order, [region])
+    return PcGts(SPECIAL, metadata, page)
+
+
+def documents():
+    for document in (RICH_DOCUMENT, PCGTS_DOCUMENT):
+        yield PcGts.from_file(io.BytesIO(document))
+
+    yield special_document()
+
+    metadata = Metadata("c", datetime(2021, 1, 2), datetime(2021, 1, 3), None)
+    yield PcGts(None, metadata, Page((1, 2), "empty.png", None, []))
+
+
+class TestSerialize(unittest.TestCase):
+    def test_same_as_lxml(self):
+        for pcgts in documents():
+            for nsmap in NSMAPS:
+                for pretty_print in (True, False):
+                    expected = etree.tostring(
+                        pcgts.to_element(nsmap), pretty_print=pretty_print
+                    )
+                    self.assertEqual(
+                        to_bytes(pcgts, nsmap, pretty_print), expected
+                    )
+
+    def test_round_trip(self):
+        for pcgts in documents():
+            for pretty_print in (True, False):
+                document = pcgts.to_bytes(pretty_print=pretty_print)
+                self.assertEqual(
+                    PcGts.from_file(io.BytesIO(document)), pcgts
+                )
+
+    def test_invalid_characters(self):
+        pcgts = special_document()
+        pcgts.metadata.creator = "null\x00byte"
+
+        with self.assertRaises(ValueError):
+            pcgts.to_element(DEFAULT_NAMESPACE_MAP)
+
+        with self.assertRaises(ValueError):
+            pcgts.to_bytes()
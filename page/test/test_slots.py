@@ -0,0 +1,66 @@
+import pickle
+import unittest
+from dataclasses import dataclass, field
+from page.elements import Line, Word, Text, Point, PcGts
+from page.elements.slots import add_slots
+import io
+from page.test.fixtures import INDEXED_TEXT_LINE, INDEXED_WORD_WITH_GLYPHS
+from page.test.fixtures import PCGTS_DOCUMENT
+
+
+@dataclass
+class Base:
+    __slots__ = ()
+
+    def describe(self) -> str:
+        return "base"
+
+
+@add_slots
+@dataclass
+class Slotted(Base):
+    __slots__ = ("_cache",)
+
+    name: str
+    values: list = field(default_factory=list)
+    flag: bool = False
+
+    def describe(self) -> str:
+        return "slotted " + super().describe()
+
+
+class TestSlots(unittest.TestCase):
+    def test_add_slots(self):
+        obj = Slotted("a")
+        self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertEqual(obj, Slotted("a", [], False))
+        self.assertEqual(obj.describe(), "slotted base")
+        self.assertEqual(
+            set(Slotted.__slots__), {"_cache", "name", "values", "flag"}
+        )
+
+        obj._cache = 1
+        self.assertRaises(AttributeError, lambda: setattr(obj, "other", 1))
+
+    def test_elements_have_no_dict(self):
+        line = Line.from_element(INDEXED_TEXT_LINE, {})
+        word = Word.from_element(INDEXED_WORD_WITH_GLYPHS, {})
+        pcgts = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT))
+        region = pcgts.page.regions[0]
+
+        for obj in [
+            line, line.coords, word, word.glyphs[0], Text(0, "a"),
+            Point(0, 0), region, pcgts, pcgts.page, pcgts.metadata
+        ]:
+            self.assertFalse(
+                hasattr(obj, "__dict__"), f"{type(obj)} has a __dict__"
+            )
+
+    def test_pickle_indexed(self):
+        for obj in [
+            Line.from_element(INDEXED_TEXT_LINE, {}),
+            Word.from_element(INDEXED_WORD_WITH_GLYPHS, {})
+        ]:
+            unpickled = pickle.loads(pickle.dumps(obj))
+            self.assertEqual(unpickled, obj)
+            self.assertEqual(list(unpickled.texts()), list(obj.texts()))
@@ -0,0 +1,151 @@
+import io
+import random
+import unittest
+from page.elements import PcGts, ParseOptions, Line, Word, TextRegion
+from page.elements.point import np
+from page.spatial import SpatialIndex, polygon_contains, polygon_distance
+from page.spatial import polygon_intersects_bbox, _polygon
+from page.test.fixtures import SPATIAL_DOCUMENT, random_page
+
+
+def ids(elements):
+    return [
+        getattr(element, name)
+        for element in elements
+        for name in ("region_id", "line_id", "word_id", "glyph_id")
+        if hasattr(element, name)
+    ]
+
+
+class TestSpatial(unittest.TestCase):
+    def setUp(self):
+        self.page = PcGts.from_file(io.BytesIO(SPATIAL_DOCUMENT)).page
+
+    def test_polygon_predicates(self):
+        triangle = [(0, 0), (10, 0), (0, 10)]
+        self.assertTrue(polygon_contains(triangle, 2, 2))
+        self.assertTrue(polygon_contains(triangle, 5, 5))  # on an edge
+        self.assertTrue(polygon_contains(triangle, 0, 0))
+        self.assertFalse(polygon_contains(triangle, 6, 6))
+
+        self.assertTrue(polygon_intersects_bbox(triangle, (4, 4, 20, 20)))
+        self.assertFalse(polygon_intersects_bbox(triangle, (6, 6, 20, 20)))
+        # the rectangle lies inside the polygon
+        self.assertTrue(polygon_intersects_bbox(triangle, (1, 1, 2, 2)))
+        # the polygon crosses the rectangle without a vertex inside it
+        self.assertTrue(
+            polygon_intersects_bbox([(-5, 1), (15, 1), (15, 2)], (0, 0, 3, 3))
+        )
+
+        self.assertEqual(polygon_distance(triangle, 2, 2), 0)
+        self.assertAlmostEqual(polygon_distance(triangle, 10, 10), 50 ** 0.5)
+        self.assertEqual(polygon_distance(triangle, -3, 5), 3)
+
+    def test_query_point(self):
+        self.assertEqual(
+            ids(self.page.query_point(20, 20)), ["r0", "l0", "w0", "g0"]
+        )
+        self.assertEqual(ids(self.page.query_point(20, 20, Word)), ["w0"])
+        self.assertEqual(ids(self.page.query_point(150, 150)), ["r0", "l1"])
+        # inside the bounding box of l1, but outside of the triangle
+        self.assertEqual(ids(self.page.query_point(350, 350)), ["r0"])
+        self.assertEqual(ids(self.page.query_point(550, 550)), [])
+
+    def test_query_bbox(self):
+        self.assertEqual(
+            ids(self.page.query_bbox((320, 320, 700, 700))), ["r0", "r1"]
+        )
+        self.assertEqual(
+            ids(self.page.query_bbox((320, 320, 700, 700), exact=False)),
+            ["r0", "l1", "r1"]
+        )
+        self.assertEqual(
+            ids(self.page.query_bbox((0, 0, 1000, 1000), (Line, Word))),
+            ["l0", "w0", "w1", "l1"]
+        )
+        self.assertRaises(
+            ValueError, lambda: self.page.query_bbox((10, 10, 0, 0))
+        )
+
+    def test_nearest(self):
+        nearest = self.page.nearest(150, 30, k=2, types=Word)
+        self.assertEqual(ids(element for element, _ in nearest), ["w0", "w1"])
+        self.assertEqual([d for _, d in nearest], [50, 50])
+
+        (region, distance), = self.page.nearest(950, 950, types=TextRegion)
+        self.assertEqual(region.region_id, "r1")
+        self.assertAlmostEqual(distance, 50 * 2 ** 0.5)
+
+        self.assertEqual(len(self.page.nearest(0, 0, k=100)), 7)
+        self.assertEqual(self.page.nearest(0, 0, k=0), [])
+
+    def test_invalidate(self):
+        index = self.page.spatial_index()
+        self.assertIs(self.page.spatial_index(), index)
+
+        self.page.regions.pop()
+        self.assertEqual(len(self.page.spatial_index()), 7)
+        self.page.invalidate_indices()
+        self.assertEqual(len(self.page.spatial_index()), 6)
+
+    def test_invalidate_points_in_place(self):
+        region = self.page.regions[1]
+        self.assertEqual(ids(self.page.query_point(750, 750)), ["r1"])
+
+        for point in region.coords.points:
+            point.x -= 600
+            point.y -= 600
+
+        self.page.invalidate_indices()
+        self.assertEqual(region.coords.bbox, (0, 0, 300, 300))
+        self.assertEqual(ids(self.page.query_point(750, 750)), [])
+        self.assertEqual(
+            ids(self.page.query_point(150, 150)), ["r0", "l1", "r1"]
+        )
+
+        # unparsed elements of lazy pages stay unparsed
+        lazy = PcGts.from_file(
+            io.BytesIO(SPATIAL_DOCUMENT), ParseOptions(lazy=True)
+        ).page
+        lazy.invalidate_indices()
+        self.assertFalse(lazy.regions.is_materialized())
+
+    def test_empty(self):
+        index = SpatialIndex([])
+        self.assertEqual(index.query_bbox((0, 0, 10, 10)), [])
+        self.assertEqual(index.query_point(0, 0), [])
+        self.assertEqual(index.nearest(0, 0), [])
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(0)
+        page = PcGts.from_file(io.BytesIO(random_page(rng, 40))).page
+        elements = list(page.iter_elements())
+        polygons = [_polygon(element.coords) for element in elements]
+
+        for _ in range(50):
+            x, y = rng.randrange(-50, 1150), rng.randrange(-50, 1150)
+            bbox = (x, y, x + rng.randrange(0, 300), y + rng.randrange(0, 300))
+
+            self.assertEqual(page.query_bbox(bbox), [
+                element for element, polygon in zip(elements, polygons)
+                if polygon_intersects_bbox(polygon, bbox)
+            ])
+            self.assertEqual(page.query_point(x, y), [
+                element for element, polygon in zip(elements, polygons)
+                if polygon_contains(polygon, x, y)
+            ])
+
+            distances = sorted(
+                polygon_distance(polygon, x, y) for polygon in polygons
+            )
+            self.assertEqual(
+                [d for _, d in page.nearest(x, y, k=5)], distances[:5]
+            )
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_point_arrays(self):
+        options = ParseOptions(point_arrays=True)
+        page = PcGts.from_file(io.BytesIO(SPATIAL_DOCUMENT), options).page
+        self.assertEqual(
+            ids(page.query_point(20, 20)), ["r0", "l0", "w0", "g0"]
+        )
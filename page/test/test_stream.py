@@ -0,0 +1,154 @@
+import gzip
+import io
+import unittest
+from page.elements import PcGts, TextRegion, Line, ParseOptions
+from page.elements import TextRegionType
+from page.stream import iter_regions, iter_lines, scan_header
+from page.exceptions import PageXMLError
+from page.constants import DEFAULT_XML_NAMESPACE
+from lxml import etree
+from page.test.fixtures import RICH_DOCUMENT
+
+PCGTS_DOCUMENT = ("""<?xml version="1.0" encoding="UTF-8"?>
+<PcGts xmlns="%s">
+    <Metadata>
+        <Creator>Test Creator</Creator>
+        <Created>2021-10-21T18:37:36</Created>
+        <LastChange>1970-01-01T00:00:00</LastChange>
+    </Metadata>
+    <Page imageFilename="test.png" imageWidth="1024" imageHeight="768">
+        <TextRegion id="r0" type="paragraph">
+            <Coords points="0,0 1,1 2,2" />
+            <TextRegion id="r01" type="heading">
+                <Coords points="0,0 4,4 0,0" />
+                <TextLine id="l0">
+                    <Coords points="0,0 1,1 2,2" />
+                    <TextEquiv><Unicode>nested</Unicode></TextEquiv>
+                </TextLine>
+            </TextRegion>
+            <TextLine id="l1">
+                <Coords points="0,0 1,1 2,2" />
+                <TextEquiv><Unicode>first</Unicode></TextEquiv>
+            </TextLine>
+        </TextRegion>
+        <TextRegion id="r1" type="paragraph">
+            <Coords points="2,2 1,1 0,1" />
+            <TextLine id="l2">
+                <Coords points="0,0 1,1 2,2" />
+                <TextEquiv><Unicode>second</Unicode></TextEquiv>
+            </TextLine>
+            <TextLine id="l3">
+                <Coords points="0,0 1,1 2,2" />
+            </TextLine>
+        </TextRegion>
+    </Page>
+</PcGts>""" % DEFAULT_XML_NAMESPACE).encode()
+
+NOT_A_PCGTS_DOCUMENT = b"""<Page>
+    <TextRegion id="r0"><Coords points="0,0 1,1" /></TextRegion>
+</Page>"""
+
+INVALID_LINE_DOCUMENT = b"""<PcGts>
+    <Page imageFilename="test.png" imageWidth="1024" imageHeight="768">
+        <TextRegion id="r0"><TextLine id="l0" /></TextRegion>
+    </Page>
+</PcGts>"""
+
+
+class TestStream(unittest.TestCase):
+    def test_iter_regions(self):
+        regions = list(iter_regions(io.BytesIO(PCGTS_DOCUMENT)))
+        self.assertEqual([r.region_id for r in regions], ["r0", "r1"])
+
+        for region in regions:
+            self.assertIsInstance(region, TextRegion)
+
+        self.assertEqual(regions[0].children[0].region_id, "r01")
+        self.assertEqual(len(regions[0].children[0].lines), 1)
+        self.assertEqual(len(regions[1].lines), 2)
+
+    def test_iter_regions_matches_from_file(self):
+        pcgts = PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT))
+        self.assertEqual(
+            list(iter_regions(io.BytesIO(PCGTS_DOCUMENT))),
+            pcgts.page.regions
+        )
+
+    def test_iter_lines(self):
+        lines = list(iter_lines(io.BytesIO(PCGTS_DOCUMENT)))
+        self.assertEqual(
+            [line.line_id for line in lines], ["l0", "l1", "l2", "l3"]
+        )
+
+        for line in lines:
+            self.assertIsInstance(line, Line)
+
+        self.assertEqual(lines[0].text.unicode, "nested")
+        self.assertIsNone(lines[3].text)
+
+    def test_nested_region_filter(self):
+        # the heading is selected, but not the paragraph enclosing it
+        options = ParseOptions(region_types={TextRegionType.HEADING})
+        regions = list(iter_regions(io.BytesIO(PCGTS_DOCUMENT), options))
+
+        self.assertEqual([r.region_id for r in regions], ["r01"])
+        self.assertEqual(
+            regions,
+            PcGts.from_file(io.BytesIO(PCGTS_DOCUMENT), options).page.regions
+        )
+        self.assertEqual(
+            [
+                line.line_id
+                for line in iter_lines(io.BytesIO(PCGTS_DOCUMENT), options)
+            ],
+            ["l0"]
+        )
+
+    def test_not_a_pcgts_document(self):
+        self.assertEqual(
+            list(iter_regions(io.BytesIO(NOT_A_PCGTS_DOCUMENT))), []
+        )
+        self.assertEqual(
+            list(iter_lines(io.BytesIO(NOT_A_PCGTS_DOCUMENT))), []
+        )
+
+    def test_invalid_line(self):
+        self.assertRaises(
+            PageXMLError,
+            lambda: list(iter_lines(io.BytesIO(INVALID_LINE_DOCUMENT)))
+        )
+
+    def test_scan_header(self):
+        pcgts = PcGts.from_file(io.BytesIO(RICH_DOCUMENT))
+        header = PcGts.scan_header(io.BytesIO(RICH_DOCUMENT))
+        self.assertEqual(header.pc_gts_id, "rich")
+        self.assertEqual(header.metadata, pcgts.metadata)
+        self.assertEqual(header.image_size, (1024, 768))
+        self.assertEqual(header.image_filename, "test.png")
+
+        header = scan_header(io.BytesIO(gzip.compress(PCGTS_DOCUMENT)))
+        self.assertIsNone(header.pc_gts_id)
+        self.assertEqual(header.metadata.creator, "Test Creator")
+
+    def test_scan_header_stops_at_page(self):
+        # everything after the Page start tag is never read
+        start = RICH_DOCUMENT.index(b"<ReadingOrder>")
+        file = io.BytesIO(RICH_DOCUMENT[:start] + b"\xff" * 100000)
+        header = scan_header(file, chunk_size=64)
+        self.assertEqual(header.image_size, (1024, 768))
+        self.assertLess(file.tell(), start + 64)
+
+    def test_scan_header_errors(self):
+        self.assertIsNone(scan_header(io.BytesIO(NOT_A_PCGTS_DOCUMENT)))
+        # the Metadata is missing
+        self.assertRaises(
+            PageXMLError,
+            lambda: scan_header(io.BytesIO(INVALID_LINE_DOCUMENT))
+        )
+        self.assertRaises(
+            PageXMLError, lambda: scan_header(io.BytesIO(b"<PcGts />"))
+        )
+        self.assertRaises(
+            etree.XMLSyntaxError,
+            lambda: scan_header(io.BytesIO(b"<PcGts><Metadata>"))
+        )
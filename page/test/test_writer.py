@@ -0,0 +1,94 @@
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from lxml import etree
+from page.elements import PcGts
+from page.stream import iter_regions
+from page.writer import PcGtsWriter
+from page.test.fixtures import RICH_DOCUMENT
+
+
+def normalize(document: bytes) -> str:
+    return etree.tostring(etree.fromstring(document), encoding="unicode")
+
+
+class TestWriter(unittest.TestCase):
+    def setUp(self):
+        self.pcgts = PcGts.from_file(io.BytesIO(RICH_DOCUMENT))
+
+    def write(self, pcgts: PcGts, **kwargs) -> bytes:
+        file = io.BytesIO()
+        pcgts.write(file, **kwargs)
+        return file.getvalue()
+
+    def test_to_bytes_round_trip(self):
+        self.assertEqual(
+            PcGts.from_file(io.BytesIO(self.pcgts.to_bytes())), self.pcgts
+        )
+
+    def test_pretty_print(self):
+        document = self.write(self.pcgts)
+        self.assertTrue(document.startswith(b"<?xml"))
+        self.assertTrue(document.endswith(b"</PcGts>\n"))
+        self.assertEqual(normalize(document), normalize(self.pcgts.to_bytes()))
+        self.assertEqual(PcGts.from_file(io.BytesIO(document)), self.pcgts)
+
+    def test_compact(self):
+        document = self.write(self.pcgts, pretty_print=False)
+        self.assertNotIn(b">\n", document.split(b"\n", 1)[1])
+        self.assertNotIn(b"  ", document)
+        self.assertEqual(PcGts.from_file(io.BytesIO(document)), self.pcgts)
+
+    def test_generator(self):
+        # regions are written while the source document is still being read
+        page = self.pcgts.page
+        file = io.BytesIO()
+
+        with PcGtsWriter(
+            file, self.pcgts.metadata, page.image_size, page.image_filename,
+            page.reading_order, self.pcgts.pc_gts_id
+        ) as writer:
+            writer.write_regions(iter_regions(io.BytesIO(RICH_DOCUMENT)))
+
+        self.assertEqual(file.getvalue(), self.write(self.pcgts))
+
+    def test_without_regions(self):
+        file = io.BytesIO()
+        page = self.pcgts.page
+
+        with PcGtsWriter(
+            file, self.pcgts.metadata, page.image_size, page.image_filename
+        ):
+            pass
+
+        pcgts = PcGts.from_file(io.BytesIO(file.getvalue()))
+        self.assertEqual(pcgts.page.regions, [])
+        self.assertIsNone(pcgts.page.reading_order)
+
+    def test_not_entered(self):
+        page = self.pcgts.page
+        writer = PcGtsWriter(
+            io.BytesIO(), self.pcgts.metadata, page.image_size,
+            page.image_filename
+        )
+        self.assertRaises(
+            ValueError, lambda: writer.write_region(page.regions[0])
+        )
+
+    def test_error_propagates(self):
+        page = self.pcgts.page
+
+        with self.assertRaises(KeyError):
+            with PcGtsWriter(
+                io.BytesIO(), self.pcgts.metadata, page.image_size,
+                page.image_filename
+            ):
+                raise KeyError()
+
+    def test_save_to_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(os.path.join(tmp_dir, "out.xml"))
+            self.pcgts.save_to_file(path)
+            self.assertEqual(PcGts.from_file(str(path)), self.pcgts)
@@ -0,0 +1,193 @@
+"""Incremental writing of PAGE-XML documents.
+
+In contrast to PcGts.to_bytes, which builds the element tree of the whole
+document and serializes it at once, PcGtsWriter writes every region to the
+file as soon as it is passed to the writer. Only the element tree of a
+single line is kept in memory at a time, so documents can be written while
+their regions are still being produced, e.g. by a generator pipeline.
+"""
+
+from contextlib import ExitStack
+from typing import BinaryIO, Iterable, Optional, Tuple
+from lxml import etree
+
+from page.constants import NsMap, DEFAULT_NAMESPACE_MAP
+from page.elements.metadata import Metadata
+from page.elements.pcgts import PcGts
+from page.elements.reading_order import ReadingOrder
+from page.elements.region import Region, TextRegion
+
+INDENT = "  "
+
+# Elements which are written as a whole are created without namespace map,
+# lxml would repeat the namespace declarations on each of them otherwise.
+# They inherit the namespace of the enclosing PcGts element when the file
+# is parsed again, just like the elements created by PcGts.to_bytes.
+_NO_NSMAP: NsMap = {}
+
+
+class PcGtsWriter:
+    """Writes a PcGts document region by region to a binary file object.
+
+    The writer is a context manager. Entering it writes everything up to
+    the first region, leaving it closes the Page and PcGts elements::
+
+        with PcGtsWriter(file, metadata, (1024, 768), "img.png") as writer:
+            for region in produce_regions():
+                writer.write_region(region)
+
+    Parameters
+    ----------
+    file : binary file object
+        The file to write to. It is neither opened nor closed by the
+        writer.
+    metadata : Metadata
+        The metadata of the document.
+    image_size : Tuple[int, int]
+        The width and height of the page image.
+    image_filename : str
+        The file name of the page image.
+    reading_order : ReadingOrder, optional
+        The reading order of the page, which is written before the regions.
+    pc_gts_id : str, optional
+        The pcGtsId attribute of the document.
+    nsmap : NsMap
+        The namespace map of the document.
+    pretty_print : bool
+        If True, the document is indented like PcGts.to_bytes, otherwise
+        no whitespace is written between elements.
+    """
+
+    def __init__(
+        self, file: BinaryIO, metadata: Metadata,
+        image_size: Tuple[int, int], image_filename: str,
+        reading_order: Optional[ReadingOrder] = None,
+        pc_gts_id: Optional[str] = None,
+        nsmap: NsMap = DEFAULT_NAMESPACE_MAP, pretty_print: bool = True
+    ):
+        self.file = file
+        self.metadata = metadata
+        self.image_size = image_size
+        self.image_filename = image_filename
+        self.reading_order = reading_order
+        self.pc_gts_id = pc_gts_id
+        self.nsmap = nsmap
+        self.pretty_print = pretty_print
+        self._stack: Optional[ExitStack] = None
+        self._xf = None
+
+    def __enter__(self) -> "PcGtsWriter":
+        stack = ExitStack()
+
+        try:
+            self._xf = stack.enter_context(
+                etree.xmlfile(self.file, encoding="UTF-8")
+            )
+            self._xf.write_declaration()
+
+            pcgts_attrib = {}
+            if self.pc_gts_id is not None:
+                pcgts_attrib["pcGtsId"] = self.pc_gts_id
+
+            stack.enter_context(
+                self._xf.element("PcGts", pcgts_attrib, nsmap=self.nsmap)
+            )
+            # before the closing tag of PcGts, callbacks run in reverse
+            stack.callback(self._newline, 0)
+            self._write_subtree(self.metadata.to_element(_NO_NSMAP), 1)
+
+            width, height = self.image_size
+            page_attrib = {
+                "imageWidth": str(width),
+                "imageHeight": str(height),
+                "imageFilename": self.image_filename
+            }
+
+            self._newline(1)
+            stack.enter_context(self._xf.element("Page", page_attrib))
+            stack.callback(self._newline, 1)
+
+            if self.reading_order is not None:
+                self._write_subtree(
+                    self.reading_order.to_element(_NO_NSMAP), 2
+                )
+        except BaseException:
+            stack.close()
+            raise
+
+        self._stack = stack
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        stack, self._stack = self._stack, None
+
+        try:
+            stack.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._xf = None
+
+        if exc_type is None and self.pretty_print:
+            self.file.write(b"\n")
+
+    def _newline(self, depth: int):
+        if self.pretty_print:
+            self._xf.write("\n" + INDENT * depth)
+
+    def _write_subtree(self, xml: etree.ElementBase, depth: int):
+        self._newline(depth)
+
+        if self.pretty_print:
+            etree.indent(xml, INDENT, level=depth)
+
+        self._xf.write(xml)
+
+    def _write_region(self, region: Region, depth: int):
+        if not isinstance(region, TextRegion):
+            # other region types are written as a whole
+            self._write_subtree(region.to_element(_NO_NSMAP), depth)
+            return
+
+        self._newline(depth)
+
+        with self._xf.element("TextRegion", region._attrib()):
+            self._write_subtree(
+                region.coords.to_element(_NO_NSMAP), depth + 1
+            )
+
+            for child in region.children:
+                self._write_region(child, depth + 1)
+
+            for line in region.lines:
+                self._write_subtree(line.to_element(_NO_NSMAP), depth + 1)
+
+            self._newline(depth)
+
+    def write_region(self, region: Region):
+        """Writes a region (including its lines and child regions) to the
+        Page element of the document."""
+
+        if self._stack is None:
+            raise ValueError("the writer has not been entered")
+
+        self._write_region(region, 2)
+
+    def write_regions(self, regions: Iterable[Region]):
+        """Writes all regions of an iterable, see write_region."""
+
+        for region in regions:
+            self.write_region(region)
+
+
+def write_pcgts(
+    file: BinaryIO, pcgts: PcGts, nsmap: NsMap = DEFAULT_NAMESPACE_MAP,
+    pretty_print: bool = True
+):
+    """Writes a PcGts document incrementally, see PcGts.write."""
+
+    page = pcgts.page
+
+    with PcGtsWriter(
+        file, pcgts.metadata, page.image_size, page.image_filename,
+        page.reading_order, pcgts.pc_gts_id, nsmap, pretty_print
+    ) as writer:
+        writer.write_regions(page.regions)
@@ -5,6 +5,7 @@ setup(
     version='1.0',
     description='Library for dealing with PAGE XML files.',
     install_requires=['lxml>=4.6.0', 'python-dateutil>=2.8.0'],
+    extras_require={'numpy': ['numpy>=1.17.0']},
     tests_require=['rstr>=3.0.0'],
     test_suite='page.test',
     packages=[